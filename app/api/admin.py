@@ -0,0 +1,59 @@
+"""Endpoints d'administration — /api/v1/admin."""
+
+from __future__ import annotations
+
+import secrets
+from dataclasses import asdict
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException, Request
+
+router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
+
+
+@router.post("/reload")
+def reload_data(
+    request: Request,
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> dict:
+    """Recharge data/rfe.json et bascule sur la nouvelle génération de données.
+
+    Repli de la surveillance automatique du fichier. La validation complète
+    s'exécute avant la bascule : en cas d'erreur, l'ancienne génération
+    reste servie.
+
+    Parameters
+    ----------
+    request : Request
+        Requête FastAPI (accès au gestionnaire de données via app.state).
+    x_admin_token : str | None
+        Jeton d'administration (en-tête ``X-Admin-Token``).
+
+    Returns
+    -------
+    dict
+        Génération servie après le rechargement, durée de chargement et
+        identifiants ajoutés, supprimés ou modifiés.
+
+    Raises
+    ------
+    HTTPException
+        403 si le jeton est absent, invalide ou si l'endpoint est désactivé ;
+        422 si le nouveau fichier est invalide.
+    """
+    expected = request.app.state.settings.admin_token
+    if not expected or not x_admin_token or not secrets.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="Jeton d'administration invalide.")
+
+    datasets = request.app.state.datasets
+    previous = datasets.current.number
+    try:
+        generation = datasets.reload(force=True)
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=datasets.last_error) from e
+    return {
+        "generation": generation.number,
+        "previous_generation": previous,
+        "load_duration_ms": round(generation.load_duration * 1000, 1),
+        "changes": asdict(generation.diff),
+    }
@@ -2,46 +2,360 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, HTTPException, Query, Request
+import pydantic_core
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel, Field
 
-from app.data.models import Intervention
+from app.api.projection import (
+    FieldsQuery,
+    InterventionProjection,
+    ViewQuery,
+    projection_fields,
+)
+from app.data.filters import bit_positions
+from app.data.models import ForceRecommandation, Intervention, Molecule
+from app.data.pagination import Cursor, InvalidCursorError, keyset_page
+from app.utils.http import conditional_generation
+
+if TYPE_CHECKING:
+    from app.data.reload import DatasetGeneration
+    from app.data.repository import RFERepository
 
 router = APIRouter(prefix="/api/v1/interventions", tags=["interventions"])
 
 
-@router.get("", response_model=list[Intervention])
+class InterventionBatchItem(BaseModel):
+    """Résultat de la lecture groupée pour un identifiant.
+
+    Attributes
+    ----------
+    id : str
+        Identifiant demandé.
+    intervention : Intervention | InterventionProjection | None
+        L'intervention (ou les champs demandés), None si l'identifiant est inconnu.
+    detail : str | None
+        Message d'erreur si l'identifiant est inconnu.
+    """
+
+    id: str
+    intervention: Intervention | InterventionProjection | None = None
+    detail: str | None = None
+
+
+class InterventionBatchRequest(BaseModel):
+    """Corps de requête de la lecture groupée.
+
+    Attributes
+    ----------
+    ids : list[str]
+        Identifiants des interventions, dans l'ordre souhaité.
+    """
+
+    ids: list[str] = Field(min_length=1)
+
+
+def _json(
+    request: Request,
+    generation: DatasetGeneration,
+    body: bytes,
+    extra_headers: dict[str, str] | None = None,
+) -> Response:
+    """Corps JSON pré-encodé, ou 304 si la copie du client est à jour."""
+    headers, not_modified = conditional_generation(request, generation)
+    if not_modified is not None:
+        return not_modified
+    if extra_headers:
+        headers.update(extra_headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _cursor_page(
+    request: Request,
+    generation: DatasetGeneration,
+    token: str,
+    limit: int,
+    projection: tuple[str, ...] | None,
+) -> Response:
+    """Page qui suit le curseur ``token`` (vide : première page), avec le lien ``next``."""
+    try:
+        cursor = Cursor.decode(token) if token else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    ids, suivant = keyset_page(
+        generation.repository.ids_tries, generation.dataset.fingerprint, cursor, limit
+    )
+    if projection is None:
+        body = generation.responses.interventions_list(ids)
+    else:
+        body = generation.projections.interventions_list(ids, projection)
+    links = {}
+    if suivant is not None:
+        url = request.url.include_query_params(cursor=suivant.encode())
+        links["Link"] = f'<{url}>; rel="next"'
+    return _json(request, generation, body, links)
+
+
+def _batch_body(
+    request: Request,
+    generation: DatasetGeneration,
+    ids: list[str],
+    projection: tuple[str, ...] | None,
+) -> bytes:
+    """Corps ``list[InterventionBatchItem]`` assemblé à partir des interventions pré-encodées.
+
+    Raises
+    ------
+    HTTPException
+        413 si le nombre d'identifiants dépasse ``interventions_batch_max_ids``.
+    """
+    max_ids = request.app.state.settings.interventions_batch_max_ids
+    if len(ids) > max_ids:
+        raise HTTPException(status_code=413, detail=f"Trop d'identifiants (max {max_ids}).")
+    parts = []
+    for intervention_id in ids:
+        if projection is None:
+            encoded = generation.responses.intervention(intervention_id)
+        else:
+            encoded = generation.projections.intervention(intervention_id, projection)
+        if encoded is None:
+            detail = f"Intervention '{intervention_id}' non trouvée."
+            item = {"id": intervention_id, "intervention": None, "detail": detail}
+            parts.append(pydantic_core.to_json(item))
+        else:
+            parts.append(
+                b'{"id":%b,"intervention":%b,"detail":null}'
+                % (pydantic_core.to_json(intervention_id), encoded)
+            )
+    return b"[" + b",".join(parts) + b"]"
+
+
+def filter_criteria(
+    molecule: Annotated[
+        list[Molecule] | None,
+        Query(description="Molécule du protocole standard ou d'une alternative allergie"),
+    ] = None,
+    force_recommandation: Annotated[
+        list[ForceRecommandation] | None, Query(description="Force de la recommandation")
+    ] = None,
+    specialite: Annotated[
+        list[str] | None, Query(description="Spécialité (identifiant ou nom)")
+    ] = None,
+    sous_categorie: Annotated[list[str] | None, Query(description="Sous-catégorie")] = None,
+    source_tableau: Annotated[list[str] | None, Query(description="Tableau source")] = None,
+    source_page: Annotated[list[int] | None, Query(description="Page source du PDF")] = None,
+) -> dict[str, list]:
+    """Critères de filtrage de ``GET /api/v1/interventions`` (voir ``app.data.filters``).
+
+    Chaque paramètre est répétable : une intervention est retenue si elle
+    a l'une des valeurs données (« ou ») pour chacun des critères présents
+    (« et »).
+
+    Returns
+    -------
+    dict[str, list]
+        Valeurs par critère présent.
+    """
+    criteria = {
+        "molecule": molecule,
+        "force_recommandation": force_recommandation,
+        "specialite": specialite,
+        "sous_categorie": sous_categorie,
+        "source_tableau": source_tableau,
+        "source_page": source_page,
+    }
+    return {field: values for field, values in criteria.items() if values}
+
+
+def resolve_criteria(repository: RFERepository, criteria: dict[str, list]) -> dict[str, list]:
+    """Critères exprimés dans les valeurs indexées (spécialité : identifiant → nom)."""
+    if "specialite" in criteria:
+        # Index par nom (Intervention.specialite) ; l'identifiant est aussi accepté
+        criteria = dict(criteria)
+        criteria["specialite"] = [
+            s.nom if (s := repository.get_specialite(v)) is not None else v
+            for v in criteria["specialite"]
+        ]
+    return criteria
+
+
+def _filtered_page(
+    request: Request,
+    generation: DatasetGeneration,
+    criteria: dict[str, list],
+    skip: int,
+    limit: int,
+    projection: tuple[str, ...] | None,
+) -> Response:
+    """Page des interventions satisfaisant ``criteria``, dans l'ordre du fichier.
+
+    L'en-tête ``X-Total-Count`` donne le nombre total d'interventions retenues.
+    """
+    bits = generation.dataset.filters.select(resolve_criteria(generation.repository, criteria))
+    positions = bit_positions(bits, skip, limit)
+    if projection is None:
+        body = generation.responses.interventions_at(positions)
+    else:
+        body = generation.projections.interventions_at(positions, projection)
+    return _json(request, generation, body, {"X-Total-Count": str(bits.bit_count())})
+
+
+@router.get(
+    "",
+    response_model=list[Intervention] | list[InterventionProjection] | list[InterventionBatchItem],
+)
 def list_interventions(
     request: Request,
+    criteria: Annotated[dict[str, list], Depends(filter_criteria)],
     skip: Annotated[int, Query(ge=0, description="Nombre d'éléments à sauter")] = 0,
     limit: Annotated[int, Query(ge=1, le=200, description="Nombre max d'éléments")] = 50,
-) -> list[Intervention]:
+    view: ViewQuery = "full",
+    fields: FieldsQuery = None,
+    cursor: Annotated[
+        str | None,
+        Query(description="Curseur de pagination (vide pour la première page) ; exclut skip"),
+    ] = None,
+    ids: Annotated[
+        str | None,
+        Query(description="Identifiants séparés par des virgules (lecture groupée)"),
+    ] = None,
+) -> Response:
     """Liste toutes les interventions chirurgicales avec pagination.
 
+    Deux modes de pagination :
+
+    - ``skip``/``limit`` : positions dans l'ordre du fichier ;
+    - ``cursor``/``limit`` : parcours par identifiant croissant, stable
+      d'un rechargement à chaud à l'autre (voir ``app.data.pagination``).
+      La première page est demandée avec ``cursor=`` vide ; chaque page
+      non finale porte un en-tête ``Link: <…>; rel="next"``.
+
+    Les critères ``molecule``, ``force_recommandation``, ``specialite``,
+    ``sous_categorie``, ``source_tableau`` et ``source_page`` (répétables)
+    filtrent les interventions par intersection d'index inversés en bitsets
+    (voir ``app.data.filters``) ; ``X-Total-Count`` donne le nombre
+    d'interventions retenues.
+
+    Avec ``ids=a,b,c``, retourne ces interventions en un seul appel
+    (``list[InterventionBatchItem]``, un élément par identifiant demandé,
+    voir ``batch_interventions``).
+
+    Le corps est assemblé à partir des interventions pré-encodées de la
+    génération courante (voir ``app.data.serialized``), ou de leurs
+    projections (``view=summary``, ``fields=``, voir ``app.data.projection``).
+    Répond 304 si la copie du client est à jour (``If-None-Match`` /
+    ``If-Modified-Since``).
+
     Parameters
     ----------
     request : Request
         Requête FastAPI (accès aux données via app.state).
+    criteria : dict[str, list]
+        Critères de filtrage (voir ``filter_criteria``) ; excluent ``cursor``.
     skip : int, optional
         Nombre d'éléments à sauter (défaut : 0).
     limit : int, optional
         Nombre maximum d'éléments retournés (défaut : 50, max : 200).
+    cursor : str | None, optional
+        Curseur opaque reçu dans le lien ``next`` de la page précédente.
+    ids : str | None, optional
+        Identifiants séparés par des virgules ; exclut ``skip``, ``cursor``
+        et les critères de filtrage.
+    view : {"summary", "full"}, optional
+        ``summary`` : id, nom, spécialité et force de recommandation
+        seulement (défaut : ``full``).
+    fields : str | None, optional
+        Champs à retourner, séparés par des virgules ; prime sur ``view``.
+
+    Returns
+    -------
+    Response
+        Liste paginée des interventions (JSON), éventuellement restreinte
+        aux champs demandés.
+
+    Raises
+    ------
+    HTTPException
+        422 si ``fields`` est vide ou contient un champ inconnu, si le
+        curseur est invalide, ou si ``ids``, ``cursor``, ``skip`` et les
+        critères sont combinés ; 413 si ``ids`` dépasse
+        ``interventions_batch_max_ids``.
+    """
+    projection = projection_fields("interventions", view, fields)
+    generation = request.app.state.datasets.current
+    if ids is not None:
+        demandes = [i.strip() for i in ids.split(",") if i.strip()]
+        if not demandes or skip or cursor is not None or criteria:
+            raise HTTPException(
+                status_code=422,
+                detail="ids doit être non vide et exclut skip, cursor et les filtres.",
+            )
+        return _json(request, generation, _batch_body(request, generation, demandes, projection))
+    if cursor is not None:
+        if skip or criteria:
+            raise HTTPException(status_code=422, detail="cursor exclut skip et les filtres.")
+        return _cursor_page(request, generation, cursor, limit, projection)
+    if criteria:
+        return _filtered_page(request, generation, criteria, skip, limit, projection)
+    if projection is not None:
+        body = generation.projections.interventions_page(projection, skip, limit)
+    else:
+        body = generation.responses.interventions_page(skip, limit)
+    return _json(request, generation, body)
+
+
+@router.post("/batch", response_model=list[InterventionBatchItem])
+def batch_interventions(
+    request: Request,
+    body: InterventionBatchRequest,
+    view: ViewQuery = "full",
+    fields: FieldsQuery = None,
+) -> Response:
+    """Lecture groupée d'interventions (variante POST de ``?ids=`` pour les longues listes).
+
+    Chaque identifiant est résolu par l'index du dépôt et servi à partir de
+    l'intervention pré-encodée : un identifiant inconnu est signalé dans
+    son élément (``intervention`` null, ``detail``) sans faire échouer
+    l'appel.
+
+    Parameters
+    ----------
+    request : Request
+        Requête FastAPI (accès aux données via app.state).
+    body : InterventionBatchRequest
+        Identifiants demandés, dans l'ordre souhaité.
+    view : {"summary", "full"}, optional
+        ``summary`` : id, nom, spécialité et force de recommandation
+        seulement (défaut : ``full``).
+    fields : str | None, optional
+        Champs à retourner, séparés par des virgules ; prime sur ``view``.
 
     Returns
     -------
-    list[Intervention]
-        Liste paginée des interventions.
+    Response
+        Un ``InterventionBatchItem`` par identifiant, dans l'ordre reçu (JSON).
+
+    Raises
+    ------
+    HTTPException
+        413 si le nombre d'identifiants dépasse ``interventions_batch_max_ids``,
+        422 si ``fields`` est invalide.
     """
-    rfe_data = request.app.state.rfe_data
-    all_interventions: list[Intervention] = []
-    for specialite in rfe_data.specialites:
-        all_interventions.extend(specialite.interventions)
-    return all_interventions[skip : skip + limit]
+    projection = projection_fields("interventions", view, fields)
+    generation = request.app.state.datasets.current
+    return Response(
+        _batch_body(request, generation, body.ids, projection), media_type="application/json"
+    )
 
 
-@router.get("/{intervention_id}", response_model=Intervention)
-def get_intervention(intervention_id: str, request: Request) -> Intervention:
+@router.get("/{intervention_id}", response_model=Intervention | InterventionProjection)
+def get_intervention(
+    intervention_id: str,
+    request: Request,
+    view: ViewQuery = "full",
+    fields: FieldsQuery = None,
+) -> Response:
     """Retourne le détail d'une intervention chirurgicale.
 
     Parameters
@@ -50,20 +364,29 @@ def get_intervention(intervention_id: str, request: Request) -> Intervention:
         Identifiant de l'intervention (slug).
     request : Request
         Requête FastAPI (accès aux données via app.state).
+    view : {"summary", "full"}, optional
+        ``summary`` : id, nom, spécialité et force de recommandation
+        seulement (défaut : ``full``).
+    fields : str | None, optional
+        Champs à retourner, séparés par des virgules ; prime sur ``view``.
 
     Returns
     -------
-    Intervention
-        Détail complet de l'intervention.
+    Response
+        Détail complet de l'intervention (JSON pré-encodé) ou les champs
+        demandés, ou 304 si la copie du client est à jour.
 
     Raises
     ------
     HTTPException
-        404 si l'intervention n'existe pas.
+        404 si l'intervention n'existe pas, 422 si ``fields`` est invalide.
     """
-    rfe_data = request.app.state.rfe_data
-    for specialite in rfe_data.specialites:
-        for intervention in specialite.interventions:
-            if intervention.id == intervention_id:
-                return intervention
+    projection = projection_fields("interventions", view, fields)
+    generation = request.app.state.datasets.current
+    if projection is not None:
+        body = generation.projections.intervention(intervention_id, projection)
+    else:
+        body = generation.responses.intervention(intervention_id)
+    if body is not None:
+        return _json(request, generation, body)
     raise HTTPException(status_code=404, detail=f"Intervention '{intervention_id}' non trouvée.")
@@ -0,0 +1,91 @@
+"""Paramètres et schémas de projection des endpoints REST (``view=``, ``fields=``).
+
+Les endpoints servent des corps pré-encodés : ``response_model`` ne sert
+qu'au schéma OpenAPI, qui déclare la vue complète ou la forme projetée
+(chaque champ est alors facultatif : seuls les champs demandés sont présents).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Literal
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+from app.data.models import (  # noqa: TC001 — nécessaires au runtime pour Pydantic
+    ForceRecommandation,
+    Intervention,
+    Protocole,
+)
+from app.data.projection import requested_fields
+
+if TYPE_CHECKING:
+    from app.data.projection import Resource
+
+ViewQuery = Annotated[
+    Literal["summary", "full"],
+    Query(
+        description=(
+            "Vue résumée (spécialités : id, nom, nb_interventions ; interventions : id, nom, "
+            "specialite, force_recommandation) ou complète"
+        )
+    ),
+]
+FieldsQuery = Annotated[
+    str | None,
+    Query(
+        description=(
+            "Champs de premier niveau à retourner, séparés par des virgules ; prime sur view"
+        )
+    ),
+]
+
+
+class SpecialiteProjection(BaseModel):
+    """Spécialité projetée : seuls les champs demandés sont présents.
+
+    Attributes
+    ----------
+    id, nom : str | None
+        Identifiant et nom de la spécialité.
+    nb_interventions : int | None
+        Nombre d'interventions (vue ``summary``).
+    interventions : list[Intervention] | None
+        Interventions de la spécialité.
+    """
+
+    id: str | None = None
+    nom: str | None = None
+    nb_interventions: int | None = None
+    interventions: list[Intervention] | None = None
+
+
+class InterventionProjection(BaseModel):
+    """Intervention projetée : seuls les champs demandés sont présents (voir ``Intervention``)."""
+
+    id: str | None = None
+    nom: str | None = None
+    specialite: str | None = None
+    protocole: Protocole | None = None
+    alternative_allergie: list[Protocole] | None = None
+    force_recommandation: ForceRecommandation | None = None
+    source_page: int | None = None
+    source_tableau: str | None = None
+    notes: str | None = None
+    sous_categorie: str | None = None
+
+
+def projection_fields(
+    resource: Resource, view: Literal["summary", "full"], fields: str | None
+) -> tuple[str, ...] | None:
+    """Projection demandée, ou None pour la vue complète.
+
+    Raises
+    ------
+    HTTPException
+        422 si ``fields`` est vide ou contient un champ inconnu.
+    """
+    try:
+        return requested_fields(resource, view, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
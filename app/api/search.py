@@ -4,10 +4,18 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Query, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import BaseModel, Field
 
-from app.data.search import search_interventions
+from app.api.interventions import filter_criteria, resolve_criteria
+from app.data.filters import FACET_FIELDS
+from app.data.query import is_structured
+from app.data.search import (
+    SearchResult,
+    search_interventions_batch,
+    search_interventions_cached,
+    search_interventions_faceted,
+)
 
 router = APIRouter(prefix="/api/v1", tags=["search"])
 
@@ -24,46 +32,176 @@ class SearchResultResponse(BaseModel):
     specialite : str
         Spécialité chirurgicale.
     score : float
-        Score de similarité (0–100).
+        Score de similarité (0–100), pondéré par le poids du champ.
+    field : str
+        Champ ayant correspondu : ``nom`` (nom et spécialité),
+        ``sous_categorie``, ``source_tableau``, ``notes`` ou ``protocole``.
     """
 
     id: str
     nom: str
     specialite: str
     score: float
+    field: str
 
 
-@router.get("/search", response_model=list[SearchResultResponse])
+class FacetedSearchResponse(BaseModel):
+    """Schéma de réponse de la recherche à facettes (``facets=true``).
+
+    Attributes
+    ----------
+    results : list[SearchResultResponse]
+        Résultats retenus par les critères, triés par score décroissant.
+    total : int
+        Nombre total de correspondances retenues par les critères.
+    facets : dict[str, dict[str, int]]
+        Pour chaque facette (spécialité, sous-catégorie, molécule, force de
+        recommandation), nombre de correspondances par valeur.
+    """
+
+    results: list[SearchResultResponse]
+    total: int
+    facets: dict[str, dict[str, int]]
+
+
+class BatchSearchRequest(BaseModel):
+    """Corps de requête pour la recherche groupée.
+
+    Attributes
+    ----------
+    queries : list[str]
+        Textes de recherche (un par cas opératoire, par exemple).
+    limit : int
+        Nombre max de résultats par requête (1–50, défaut : 10).
+    """
+
+    queries: list[str]
+    limit: int = Field(default=10, ge=1, le=50)
+
+
+class BatchSearchResult(BaseModel):
+    """Résultats d'une requête de la recherche groupée.
+
+    Attributes
+    ----------
+    query : str
+        Texte de recherche tel que reçu.
+    results : list[SearchResultResponse]
+        Résultats triés par score décroissant.
+    """
+
+    query: str
+    results: list[SearchResultResponse]
+
+
+def _to_response(result: SearchResult) -> SearchResultResponse:
+    """Convertit un SearchResult en schéma de réponse."""
+    return SearchResultResponse(
+        id=result.intervention.id,
+        nom=result.intervention.nom,
+        specialite=result.intervention.specialite,
+        score=result.score,
+        field=result.field,
+    )
+
+
+@router.get("/search", response_model=list[SearchResultResponse] | FacetedSearchResponse)
 def search(
     request: Request,
+    criteria: Annotated[dict[str, list], Depends(filter_criteria)],
     q: Annotated[str, Query(description="Texte de recherche")] = "",
     limit: Annotated[int, Query(ge=1, le=50, description="Nombre max de résultats")] = 10,
-) -> list[SearchResultResponse]:
+    facets: Annotated[
+        bool, Query(description="Retourner aussi le total et les comptes par facette")
+    ] = False,
+) -> list[SearchResultResponse] | FacetedSearchResponse:
     """Recherche fuzzy d'interventions chirurgicales.
 
+    ``q`` accepte des champs qualifiés et des exclusions
+    (``molecule:cefazoline specialite:ortho hanche -reprise``, voir
+    ``app.data.query``) : seuls les termes libres sont scorés en fuzzy, sur
+    les interventions admises. Les critères de ``GET /api/v1/interventions``
+    (``molecule``, ``specialite``…) restreignent les correspondances ; avec
+    ``facets=true``, la réponse donne aussi le total et, par facette, le
+    nombre de correspondances de chaque valeur (voir
+    ``search_interventions_faceted``).
+
     Parameters
     ----------
     request : Request
         Requête FastAPI (accès aux données via app.state).
+    criteria : dict[str, list]
+        Critères de filtrage (voir ``filter_criteria``).
     q : str, optional
-        Texte de recherche (nom d'intervention, spécialité).
-        Retourne une liste vide si absent ou vide.
+        Texte de recherche (nom d'intervention, spécialité), éventuellement
+        à champs qualifiés. Retourne une liste vide si absent ou vide.
     limit : int, optional
         Nombre maximum de résultats (défaut : 10, max : 50).
+    facets : bool, optional
+        Réponse ``FacetedSearchResponse`` plutôt qu'une liste (défaut : False).
 
     Returns
     -------
-    list[SearchResultResponse]
-        Liste de résultats triés par score décroissant.
+    list[SearchResultResponse] | FacetedSearchResponse
+        Résultats triés par score décroissant, avec total et facettes si
+        ``facets`` est vrai.
     """
-    rfe_data = request.app.state.rfe_data
-    results = search_interventions(q, rfe_data, limit=limit)
-    return [
-        SearchResultResponse(
-            id=r.intervention.id,
-            nom=r.intervention.nom,
-            specialite=r.intervention.specialite,
-            score=r.score,
+    generation = request.app.state.datasets.current
+    if not criteria and not facets and not is_structured(q):
+        results = search_interventions_cached(
+            q, generation.search_index, generation.search_cache, limit=limit
         )
-        for r in results
+        return [_to_response(r) for r in results]
+    faceted = search_interventions_faceted(
+        q,
+        generation.search_index,
+        generation.dataset.filters,
+        resolve_criteria(generation.repository, criteria),
+        generation.search_cache,
+        limit=limit,
+        facet_fields=FACET_FIELDS if facets else (),
+        plans=generation.query_plans,
+    )
+    results = [_to_response(r) for r in faceted.results]
+    if not facets:
+        return results
+    return FacetedSearchResponse(results=results, total=faceted.total, facets=faceted.facets)
+
+
+@router.post("/search/batch", response_model=list[BatchSearchResult])
+def search_batch(request: Request, body: BatchSearchRequest) -> list[BatchSearchResult]:
+    """Recherche fuzzy groupée : plusieurs requêtes scorées en un seul calcul.
+
+    Parameters
+    ----------
+    request : Request
+        Requête FastAPI (accès aux données via app.state).
+    body : BatchSearchRequest
+        Requêtes et limite de résultats par requête.
+
+    Returns
+    -------
+    list[BatchSearchResult]
+        Un élément par requête, dans l'ordre reçu.
+
+    Raises
+    ------
+    HTTPException
+        413 si le nombre de requêtes dépasse ``search_batch_max_queries``.
+    """
+    settings = request.app.state.settings
+    if len(body.queries) > settings.search_batch_max_queries:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Trop de requêtes (max {settings.search_batch_max_queries}).",
+        )
+    results = search_interventions_batch(
+        body.queries,
+        request.app.state.datasets.current.search_index,
+        limit=body.limit,
+        workers=settings.search_batch_workers,
+    )
+    return [
+        BatchSearchResult(query=query, results=[_to_response(r) for r in hits])
+        for query, hits in zip(body.queries, results, strict=True)
     ]
@@ -2,33 +2,92 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Request
+from typing import TYPE_CHECKING
 
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from app.api.projection import (
+    FieldsQuery,
+    SpecialiteProjection,
+    ViewQuery,
+    projection_fields,
+)
 from app.data.models import Specialite
+from app.utils.http import conditional_generation
+
+if TYPE_CHECKING:
+    from app.data.reload import DatasetGeneration
+    from app.utils.compression import Precompressed
 
 router = APIRouter(prefix="/api/v1/specialites", tags=["specialites"])
 
 
-@router.get("", response_model=list[Specialite])
-def list_specialites(request: Request) -> list[Specialite]:
+def _precompressed(
+    request: Request, generation: DatasetGeneration, body: Precompressed
+) -> Response:
+    """Variante de ``body`` acceptée par le client (``Accept-Encoding``), ou 304."""
+    content_encoding, content = body.select(request.headers.get("accept-encoding"))
+    headers, not_modified = conditional_generation(request, generation, content_encoding)
+    if not_modified is not None:
+        return not_modified
+    return Response(content, media_type="application/json", headers=headers)
+
+
+def _projected(request: Request, generation: DatasetGeneration, body: bytes) -> Response:
+    """Corps projeté (``view=summary``, ``fields=``), ou 304."""
+    headers, not_modified = conditional_generation(request, generation)
+    if not_modified is not None:
+        return not_modified
+    return Response(body, media_type="application/json", headers=headers)
+
+
+@router.get("", response_model=list[Specialite] | list[SpecialiteProjection])
+def list_specialites(
+    request: Request, view: ViewQuery = "full", fields: FieldsQuery = None
+) -> Response:
     """Liste toutes les spécialités chirurgicales.
 
+    Le corps complet est pré-encodé et pré-compressé (gzip, brotli) une
+    fois par génération de données (voir ``app.data.serialized``) ; la
+    variante servie est choisie selon ``Accept-Encoding``. Les projections
+    (``view=summary``, ``fields=``) sont encodées une fois par génération
+    (voir ``app.data.projection``). Répond 304 si la copie du client est à
+    jour (``If-None-Match`` / ``If-Modified-Since``).
+
     Parameters
     ----------
     request : Request
         Requête FastAPI (accès aux données via app.state).
+    view : {"summary", "full"}, optional
+        ``summary`` : id, nom et nombre d'interventions seulement (défaut : ``full``).
+    fields : str | None, optional
+        Champs à retourner, séparés par des virgules ; prime sur ``view``.
 
     Returns
     -------
-    list[Specialite]
-        Liste de toutes les spécialités avec leurs interventions.
+    Response
+        Liste de toutes les spécialités avec leurs interventions (JSON), ou
+        restreinte aux champs demandés.
+
+    Raises
+    ------
+    HTTPException
+        422 si ``fields`` est vide ou contient un champ inconnu.
     """
-    rfe_data = request.app.state.rfe_data
-    return rfe_data.specialites
+    projection = projection_fields("specialites", view, fields)
+    generation = request.app.state.datasets.current
+    if projection is not None:
+        return _projected(request, generation, generation.projections.specialites_list(projection))
+    return _precompressed(request, generation, generation.responses.specialites_list)
 
 
-@router.get("/{specialite_id}", response_model=Specialite)
-def get_specialite(specialite_id: str, request: Request) -> Specialite:
+@router.get("/{specialite_id}", response_model=Specialite | SpecialiteProjection)
+def get_specialite(
+    specialite_id: str,
+    request: Request,
+    view: ViewQuery = "full",
+    fields: FieldsQuery = None,
+) -> Response:
     """Retourne une spécialité avec ses interventions.
 
     Parameters
@@ -37,19 +96,31 @@ def get_specialite(specialite_id: str, request: Request) -> Specialite:
         Identifiant de la spécialité (slug).
     request : Request
         Requête FastAPI (accès aux données via app.state).
+    view : {"summary", "full"}, optional
+        ``summary`` : id, nom et nombre d'interventions seulement (défaut : ``full``).
+    fields : str | None, optional
+        Champs à retourner, séparés par des virgules ; prime sur ``view``.
 
     Returns
     -------
-    Specialite
-        La spécialité et ses interventions associées.
+    Response
+        La spécialité et ses interventions associées (JSON pré-encodé et
+        pré-compressé) ou les champs demandés, ou 304 si la copie du client
+        est à jour.
 
     Raises
     ------
     HTTPException
-        404 si la spécialité n'existe pas.
+        404 si la spécialité n'existe pas, 422 si ``fields`` est invalide.
     """
-    rfe_data = request.app.state.rfe_data
-    for specialite in rfe_data.specialites:
-        if specialite.id == specialite_id:
-            return specialite
+    projection = projection_fields("specialites", view, fields)
+    generation = request.app.state.datasets.current
+    if projection is not None:
+        projected = generation.projections.specialite(specialite_id, projection)
+        if projected is not None:
+            return _projected(request, generation, projected)
+    else:
+        body = generation.responses.specialite(specialite_id)
+        if body is not None:
+            return _precompressed(request, generation, body)
     raise HTTPException(status_code=404, detail=f"Spécialité '{specialite_id}' non trouvée.")
@@ -18,3 +18,27 @@ class Settings(BaseSettings):
     data_version: str = "RFE SFAR 2024"
     debug: bool = False
     data_path: Path = _PROJECT_ROOT / "data" / "rfe.json"
+    # Instantané binaire (scripts/build_snapshot.py), utilisé s'il correspond à data_path
+    snapshot_path: Path | None = _PROJECT_ROOT / "data" / "rfe.snapshot"
+    # Rechargement à chaud : période de surveillance de data_path en secondes (0 = désactivé)
+    reload_poll_interval: float = 2.0
+    # Jeton de POST /api/v1/admin/reload (en-tête X-Admin-Token) ; None = endpoint désactivé
+    admin_token: str | None = None
+    # Cache LRU des résultats de recherche (taille max, TTL en secondes ; None = sans expiration)
+    search_cache_size: int = 2048
+    search_cache_ttl: float | None = None
+    # Poids des champs de recherche (nom, sous_categorie, source_tableau, notes, protocole),
+    # en JSON ; les champs absents gardent leur poids par défaut, 0 désactive un champ
+    search_weights: dict[str, float] = {}
+    # Recherche groupée : nombre max de requêtes par appel, threads rapidfuzz (-1 = tous)
+    search_batch_max_queries: int = 1000
+    search_batch_workers: int = -1
+    # Lecture groupée d'interventions (?ids=, POST /batch) : nombre max d'identifiants par appel
+    interventions_batch_max_ids: int = 500
+    # Recherche des pages web hors boucle d'événements : threads, file max, délai de réessai (s)
+    search_workers: int = 4
+    search_queue_max: int = 32
+    search_retry_after: int = 1
+    # En-tête Cache-Control des réponses validées par ETag (API JSON, pages HTML)
+    api_cache_control: str = "no-cache"
+    html_cache_control: str = "no-cache"
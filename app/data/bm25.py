@@ -0,0 +1,229 @@
+"""Index inversé de mots pondéré BM25, générateur de candidats pour le fuzzy.
+
+Le scoring fuzzy (``partial_ratio``) parcourt tous les textes indexés :
+son coût croît linéairement avec le corpus. Sur un grand corpus, cet index
+présélectionne les documents partageant des mots avec la requête, classés
+par BM25 ; seuls ces candidats sont ensuite rescorés en fuzzy.
+
+Les textes sont découpés en mots normalisés (``strip_accents``), sans mots
+vides français. Chaque mot pointe vers ses documents, triés par impact
+décroissant : la contribution BM25 ``idf × tf × (k1 + 1) / (tf + k1 × (1 -
+b + b × dl / avgdl))`` est calculée une fois à la construction. Un top-k
+lit en entier la liste de chaque mot de la requête (ou, s'il est inconnu,
+de ses substituts les plus proches), mais seulement le début de celles des
+expansions moins proches. Les scores sont accumulés sur les seules entrées
+lues (aucun tableau de la taille du corpus) : le coût d'une requête suit
+la longueur de ces listes, pas le nombre de documents. Les documents sont
+classés par nombre de mots de la requête trouvés, puis par similarité des
+mots trouvés, enfin par somme des impacts.
+
+Chaque mot de la requête s'étend aux mots du vocabulaire qui le contiennent
+approximativement, avec le scorer de la recherche (``fuzz.partial_ratio``) :
+fautes de frappe, pluriels, mots composés (« colectomie » →
+« hemicolectomie »). Ce parcours porte sur le vocabulaire, qui croît bien
+moins vite que le corpus.
+
+La construction, elle, parcourt tout le corpus : environ 24 s pour
+``SearchIndex.from_data`` à 100 000 documents (``scripts/bench_search.py``).
+Les idf dépendant de tous les documents, l'index est reconstruit en entier
+à chaque rechargement à chaud (``SearchIndex.patched``), même pour une
+seule intervention modifiée.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+# Paramètres BM25 usuels (saturation du tf, normalisation par la longueur)
+_K1 = 1.2
+_B = 0.75
+
+# Mots vides français, sans accents (les textes indexés sont normalisés)
+_MOTS_VIDES = (
+    "a au aux ce ces cet cette d dans de des du elle en et il ils l la le les leur leurs lors "
+    "n ne ni ou par pas pour qu que qui s sa se ses son sur un une y"
+)
+STOPWORDS = frozenset(_MOTS_VIDES.split())
+
+# Mots : suites de lettres minuscules et de chiffres (texte déjà normalisé)
+_MOT = re.compile(r"[a-z0-9]+")
+
+# Nombre maximal de mots du vocabulaire substitués à un mot de la requête
+_EXPANSIONS_MAX = 32
+
+# Score partial_ratio minimal d'un mot du vocabulaire (seuil de la recherche fuzzy)
+_SIMILARITE_MIN = 75
+
+# Lectures par liste pour un top-k : ``_LECTURES_PAR_RESULTAT × k``
+_LECTURES_PAR_RESULTAT = 4
+
+
+def tokenize(text: str) -> list[str]:
+    """Mots d'un texte normalisé (``strip_accents``), sans les mots vides."""
+    return [mot for mot in _MOT.findall(text) if mot not in STOPWORDS]
+
+
+class BM25Index:
+    """Index inversé mot → documents, listes triées par impact BM25 décroissant.
+
+    Parameters
+    ----------
+    textes : tuple[str, ...]
+        Textes normalisés (``strip_accents``), l'indice sert d'identifiant.
+    """
+
+    __slots__ = ("docs", "impacts", "longueurs", "size", "vocabulaire")
+
+    def __init__(self, textes: tuple[str, ...]) -> None:
+        self.size = len(textes)
+        frequences = [Counter(tokenize(texte)) for texte in textes]
+        longueurs = [sum(tf.values()) for tf in frequences]
+        moyenne = (sum(longueurs) / len(longueurs) if longueurs else 0.0) or 1.0
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for doc, tf in enumerate(frequences):
+            for mot, n in tf.items():
+                postings.setdefault(mot, []).append((doc, n))
+
+        self.docs: dict[str, np.ndarray] = {}
+        self.impacts: dict[str, np.ndarray] = {}
+        for mot, liste in postings.items():
+            idf = math.log(1 + (self.size - len(liste) + 0.5) / (len(liste) + 0.5))
+            docs = np.fromiter((doc for doc, _ in liste), dtype=np.int32, count=len(liste))
+            tf = np.fromiter((n for _, n in liste), dtype=np.float64, count=len(liste))
+            normes = _K1 * (1 - _B + _B * np.asarray([longueurs[d] for d in docs]) / moyenne)
+            impacts = idf * tf * (_K1 + 1) / (tf + normes)
+            # Impact décroissant, puis ordre des documents (tri stable)
+            ordre = np.argsort(-impacts, kind="stable")
+            self.docs[mot] = docs[ordre]
+            self.impacts[mot] = impacts[ordre].astype(np.float32)
+        # Vocabulaire par longueur croissante : les mots d'au moins n caractères en sont la fin
+        self.vocabulaire = tuple(sorted(postings, key=lambda mot: (len(mot), mot)))
+        self.longueurs = array("H", [len(mot) for mot in self.vocabulaire])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def expansions(self, mot: str) -> dict[str, float]:
+        """Mots du vocabulaire substitués à un mot de la requête, avec leur poids.
+
+        Le mot lui-même (poids 1) et les mots d'au moins ``len(mot) - 1``
+        caractères qui le contiennent approximativement (poids :
+        ``partial_ratio / 100``).
+
+        Parameters
+        ----------
+        mot : str
+            Mot normalisé de la requête.
+
+        Returns
+        -------
+        dict[str, float]
+            Poids de chaque mot retenu, au plus ``_EXPANSIONS_MAX`` en plus du mot.
+        """
+        termes = {mot: 1.0} if mot in self.docs else {}
+        debut = bisect_left(self.longueurs, len(mot) - 1)
+        for proche, score, _ in process.extract(
+            mot,
+            self.vocabulaire[debut:],
+            scorer=fuzz.partial_ratio,
+            processor=None,
+            limit=_EXPANSIONS_MAX,
+            score_cutoff=_SIMILARITE_MIN,
+        ):
+            termes.setdefault(proche, score / 100)
+        return termes
+
+    def rechercher(self, query: str, limit: int | None = None) -> list[int]:
+        """Documents partageant au moins un mot (ou une expansion) avec la requête.
+
+        Pour chaque mot de la requête, un document compte sa meilleure
+        expansion (« voie » et « voies » ne s'additionnent pas). Classement :
+        nombre de mots de la requête trouvés, puis somme des poids des
+        expansions (un mot exact avant un mot approché : c'est ce que
+        récompense le rescoring fuzzy), puis score BM25.
+
+        Parameters
+        ----------
+        query : str
+            Requête normalisée (``strip_accents``).
+        limit : int | None, optional
+            Nombre de documents voulus ; seul le début des listes des
+            expansions les moins proches est lu. Sans limite, tous les
+            documents concernés sont retournés.
+
+        Returns
+        -------
+        list[int]
+            Identifiants des documents, par pertinence décroissante puis identifiant.
+        """
+        lectures = None if limit is None else _LECTURES_PAR_RESULTAT * limit
+        # Entrées lues, un document au plus par mot de la requête
+        docs_lus: list[np.ndarray] = []
+        poids_lus: list[np.ndarray] = []
+        impacts_lus: list[np.ndarray] = []
+        for mot in dict.fromkeys(tokenize(query)):
+            termes = self.expansions(mot)
+            if not termes:
+                continue
+            # Listes du mot (ou de ses substituts les plus proches) lues en entier : tout
+            # document qui contient tous les mots est compté comme tel
+            meilleur = max(termes.values())
+            bornes = {t: None if p == meilleur else lectures for t, p in termes.items()}
+            docs = np.concatenate([self.docs[t][: bornes[t]] for t in termes])
+            impacts = np.concatenate([self.impacts[t][: bornes[t]] for t in termes])
+            poids = np.concatenate(
+                [np.full(len(self.docs[t][: bornes[t]]), termes[t]) for t in termes]
+            )
+            # Meilleure expansion de chaque document : poids, puis impact décroissants
+            ordre = np.lexsort((-impacts, -poids, docs))
+            docs = docs[ordre]
+            premiers = np.flatnonzero(np.diff(docs, prepend=-1))
+            docs_lus.append(docs[premiers])
+            poids_lus.append(poids[ordre][premiers])
+            impacts_lus.append(impacts[ordre][premiers])
+        if not docs_lus:
+            return []
+        candidats, rangs = np.unique(np.concatenate(docs_lus), return_inverse=True)
+        trouves = np.bincount(rangs, minlength=len(candidats))
+        similarite = np.bincount(rangs, np.concatenate(poids_lus), len(candidats))
+        bm25 = np.bincount(rangs, np.concatenate(impacts_lus), len(candidats))
+        # Clés par priorité décroissante, indexées par rang de candidat (croissant comme les
+        # identifiants) ; similarité arrondie (sommes flottantes)
+        cles = (trouves, similarite.round(6), bm25)
+        retenus = _premiers(np.arange(len(candidats)), cles, limit)
+        ordre = np.lexsort((retenus, *(-cle[retenus] for cle in reversed(cles))))
+        return candidats[retenus[ordre]].tolist()
+
+
+def _premiers(
+    candidats: np.ndarray, cles: tuple[np.ndarray, ...], limit: int | None
+) -> np.ndarray:
+    """Les ``limit`` meilleurs candidats par clés décroissantes, la première prioritaire.
+
+    Chaque clé est départagée par ``np.partition`` (linéaire, sans tri) :
+    les candidats au-dessus du seuil du rang ``limit`` sont acquis, ceux
+    à égalité passent à la clé suivante. À égalité sur toutes les clés, les
+    plus petits identifiants l'emportent (``candidats`` est croissant).
+    """
+    if limit is None or len(candidats) <= limit:
+        return candidats
+    acquis = []
+    restant = limit
+    for cle in cles:
+        valeurs = cle[candidats]
+        rang = len(valeurs) - restant
+        seuil = np.partition(valeurs, rang)[rang]
+        au_dessus = candidats[valeurs > seuil]
+        acquis.append(au_dessus)
+        restant -= len(au_dessus)
+        candidats = candidats[valeurs == seuil]
+        if len(candidats) <= restant:
+            break
+    return np.concatenate([*acquis, candidats[:restant]])
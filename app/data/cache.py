@@ -0,0 +1,135 @@
+"""Cache LRU borné, thread-safe, avec expiration optionnelle (TTL)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Compteurs d'utilisation d'un cache.
+
+    Attributes
+    ----------
+    hits : int
+        Nombre de lectures servies par le cache.
+    misses : int
+        Nombre de lectures absentes ou expirées.
+    evictions : int
+        Nombre d'entrées évincées faute de place.
+    size : int
+        Nombre d'entrées actuellement en cache.
+    maxsize : int
+        Capacité maximale du cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LRUCache[K, V]:
+    """Cache LRU borné, protégé par un verrou (endpoints sync sur thread pool).
+
+    Parameters
+    ----------
+    maxsize : int
+        Nombre maximal d'entrées ; la moins récemment utilisée est évincée.
+    ttl : float | None, optional
+        Durée de vie d'une entrée en secondes (défaut : pas d'expiration).
+    clock : Callable[[], float], optional
+        Horloge monotone (injectable pour les tests).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            msg = f"maxsize doit être ≥ 1 (reçu : {maxsize})"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: K) -> V | None:
+        """Retourne la valeur associée à ``key``, ou None si absente ou expirée."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expire, value = entry
+                if self.ttl is None or self._clock() < expire:
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._data[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: K, value: V) -> None:
+        """Insère ou remplace ``key``, en évinçant l'entrée la plus ancienne si plein."""
+        expire = self._clock() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._data[key] = (expire, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        """Retourne la valeur en cache, ou la calcule et la met en cache.
+
+        Le calcul s'exécute hors verrou : deux threads manquant la même clé
+        simultanément peuvent la calculer chacun une fois, sans incohérence.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def items(self) -> list[tuple[K, V]]:
+        """Instantané des entrées non expirées, de la moins à la plus récemment utilisée."""
+        now = self._clock()
+        with self._lock:
+            return [
+                (key, value)
+                for key, (expire, value) in self._data.items()
+                if self.ttl is None or now < expire
+            ]
+
+    def clear(self) -> None:
+        """Vide le cache (les compteurs sont conservés)."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> CacheStats:
+        """Retourne un instantané des compteurs."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._data),
+                maxsize=self.maxsize,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
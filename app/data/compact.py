@@ -0,0 +1,122 @@
+"""Représentation mémoire compacte des données RFE validées.
+
+Après validation, chaque ``Intervention`` détient ses propres copies de
+chaînes très répétitives (spécialité, tableau source, doses…) et de
+``Protocole`` identiques d'une intervention à l'autre. ``compact_rfe_data``
+remplace ces doublons par une instance partagée, en place, sans changer
+les valeurs : les modèles Pydantic restent ceux que l'API sérialise.
+
+Seuls des objets immuables sont partagés : chaînes internées et
+``Protocole`` (modèle gelé, ``frozen=True``). Chaque intervention garde sa
+liste d'alternatives et son ensemble de champs renseignés : modifier une
+intervention ne touche jamais les autres.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from app.data.models import Protocole
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from app.data.models import RFEData
+
+# Champs texte internés (les identifiants et noms, uniques, ne gagnent rien)
+_CHAMPS_INTERNES = ("specialite", "source_tableau", "sous_categorie", "notes")
+_CHAMPS_INTERNES_PROTOCOLE = ("dose_initiale", "reinjection")
+
+
+class _Pool:
+    """Protocoles canoniques : une seule instance (immuable) par valeur."""
+
+    def __init__(self) -> None:
+        self._protocoles: dict[tuple, Protocole] = {}
+
+    def protocole(self, protocole: Protocole) -> Protocole:
+        """Retourne l'instance canonique d'un protocole, aux chaînes internées."""
+        fields_set = protocole.model_fields_set
+        cle = (
+            protocole.molecule,
+            protocole.dose_initiale,
+            protocole.intention,
+            protocole.reinjection,
+            frozenset(fields_set),
+        )
+        partage = self._protocoles.get(cle)
+        if partage is None:
+            valeurs = protocole.model_dump(exclude_unset=True)
+            for champ in _CHAMPS_INTERNES_PROTOCOLE:
+                if type(valeurs.get(champ)) is str:
+                    valeurs[champ] = sys.intern(valeurs[champ])
+            partage = self._protocoles[cle] = Protocole.model_construct(set(fields_set), **valeurs)
+        return partage
+
+
+def _interner(model: BaseModel, champs: tuple[str, ...]) -> None:
+    """Interne les champs texte donnés (affectation ordinaire, valeur inchangée)."""
+    for champ in champs:
+        valeur = getattr(model, champ)
+        if type(valeur) is str:
+            setattr(model, champ, sys.intern(valeur))
+
+
+def compact_rfe_data(data: RFEData) -> RFEData:
+    """Partage les chaînes et protocoles répétés des données RFE, en place.
+
+    Parameters
+    ----------
+    data : RFEData
+        Données fraîchement validées.
+
+    Returns
+    -------
+    RFEData
+        Les mêmes données (même objet), valeurs inchangées.
+    """
+    pool = _Pool()
+    for specialite in data.specialites:
+        _interner(specialite, ("nom",))
+        for intervention in specialite.interventions:
+            _interner(intervention, _CHAMPS_INTERNES)
+            if intervention.protocole is not None:
+                intervention.protocole = pool.protocole(intervention.protocole)
+            if intervention.alternative_allergie is not None:
+                # Liste propre à l'intervention, protocoles partagés
+                intervention.alternative_allergie[:] = [
+                    pool.protocole(p) for p in intervention.alternative_allergie
+                ]
+    return data
+
+
+def deep_sizeof(obj: Any) -> int:
+    """Taille mémoire d'un graphe d'objets, objets partagés comptés une fois.
+
+    Les classes et les membres d'énumérations (partagés par tout le
+    processus) ne sont pas comptés.
+
+    Parameters
+    ----------
+    obj : Any
+        Racine du graphe.
+
+    Returns
+    -------
+    int
+        Somme des ``sys.getsizeof`` des objets atteignables, en octets.
+    """
+    vus: set[int] = set()
+    total = 0
+    pile = [obj]
+    while pile:
+        courant = pile.pop()
+        if id(courant) in vus or isinstance(courant, type | Enum):
+            continue
+        vus.add(id(courant))
+        total += sys.getsizeof(courant)
+        pile.extend(gc.get_referents(courant))
+    return total
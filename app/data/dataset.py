@@ -0,0 +1,106 @@
+"""Jeu de données servi : données RFE validées et structures dérivées."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from app.data.diff import diff_rfe_data, share_unchanged
+from app.data.filters import FilterIndex
+from app.data.repository import RFERepository
+from app.data.search import SearchIndex
+from app.data.serialized import SerializedResponses
+
+if TYPE_CHECKING:
+    from app.data.diff import RFEDiff
+    from app.data.models import RFEData
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Données RFE validées et toutes les structures qui en sont dérivées.
+
+    Attributes
+    ----------
+    rfe_data : RFEData
+        Données validées par Pydantic.
+    repository : RFERepository
+        Tables de correspondance par identifiant.
+    search_index : SearchIndex
+        Index de recherche pré-calculé.
+    responses : SerializedResponses
+        Corps JSON pré-encodés de l'API.
+    filters : FilterIndex
+        Index inversés (bitsets) des critères de filtrage des interventions.
+    """
+
+    rfe_data: RFEData
+    repository: RFERepository
+    search_index: SearchIndex
+    responses: SerializedResponses
+    filters: FilterIndex
+
+    @property
+    def fingerprint(self) -> str:
+        """Empreinte du contenu des données (calculée avec l'index de recherche)."""
+        return self.search_index.version
+
+    @classmethod
+    def from_data(cls, data: RFEData) -> Dataset:
+        """Construit toutes les structures dérivées à partir de données validées.
+
+        Parameters
+        ----------
+        data : RFEData
+            Données RFE validées.
+
+        Returns
+        -------
+        Dataset
+            Jeu de données prêt à servir.
+        """
+        repository = RFERepository.from_data(data)
+        return cls(
+            rfe_data=data,
+            repository=repository,
+            search_index=SearchIndex.from_data(data),
+            responses=SerializedResponses.from_repository(repository),
+            filters=FilterIndex.from_interventions(repository.interventions),
+        )
+
+    def patched(self, data: RFEData) -> tuple[Dataset, RFEDiff]:
+        """Construit le jeu de données de ``data`` à partir de celui-ci.
+
+        Les objets inchangés sont partagés avec cette génération et seules
+        les entrées dérivées des enregistrements ajoutés, supprimés ou
+        modifiés sont recalculées.
+
+        Parameters
+        ----------
+        data : RFEData
+            Nouvelle génération de données validées.
+
+        Returns
+        -------
+        tuple[Dataset, RFEDiff]
+            Jeu de données équivalent à ``Dataset.from_data(data)`` et la
+            différence avec cette génération.
+        """
+        diff = diff_rfe_data(self.rfe_data, data)
+        if not diff:
+            return self, diff
+        data = share_unchanged(self.rfe_data, data, diff)
+        repository = self.repository.patched(data, diff)
+        return (
+            Dataset(
+                rfe_data=data,
+                repository=repository,
+                search_index=self.search_index.patched(data, diff),
+                responses=SerializedResponses.from_repository(
+                    repository, previous=(self.repository, self.responses)
+                ),
+                # Positions décalées par tout ajout ou suppression : reconstruit (O(n))
+                filters=FilterIndex.from_interventions(repository.interventions),
+            ),
+            diff,
+        )
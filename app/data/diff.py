@@ -0,0 +1,192 @@
+"""Différence structurelle entre deux générations de données RFE.
+
+Les interventions et les spécialités sont appariées par identifiant
+(``Intervention.id``, ``Specialite.id``). La différence sert à ne
+reconstruire que les entrées dérivées des enregistrements ajoutés,
+supprimés ou modifiés (voir ``Dataset.patched``) et au rapport de
+modifications de ``scripts/validate_data.py``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.data.models import Intervention, RFEData, Specialite
+
+
+@dataclass(frozen=True)
+class RFEDiff:
+    """Enregistrements ajoutés, supprimés ou modifiés entre deux générations.
+
+    Les identifiants sont listés dans l'ordre du fichier (nouveau fichier
+    pour les ajouts et modifications, ancien pour les suppressions).
+
+    Attributes
+    ----------
+    added_interventions : tuple[str, ...]
+        Interventions absentes de l'ancienne génération.
+    removed_interventions : tuple[str, ...]
+        Interventions absentes de la nouvelle génération.
+    modified_interventions : tuple[str, ...]
+        Interventions présentes des deux côtés dont un champ a changé.
+    added_specialites : tuple[str, ...]
+        Spécialités absentes de l'ancienne génération.
+    removed_specialites : tuple[str, ...]
+        Spécialités absentes de la nouvelle génération.
+    modified_specialites : tuple[str, ...]
+        Spécialités dont le nom ou la liste (ou l'ordre) des interventions a changé.
+    reordered : bool
+        Ordre des spécialités modifié.
+    metadata_changed : bool
+        Version, date d'extraction ou recommandations générales modifiées.
+    """
+
+    added_interventions: tuple[str, ...] = ()
+    removed_interventions: tuple[str, ...] = ()
+    modified_interventions: tuple[str, ...] = ()
+    added_specialites: tuple[str, ...] = ()
+    removed_specialites: tuple[str, ...] = ()
+    modified_specialites: tuple[str, ...] = ()
+    reordered: bool = False
+    metadata_changed: bool = False
+
+    @property
+    def changed_interventions(self) -> frozenset[str]:
+        """Interventions ajoutées ou modifiées (à reconstruire)."""
+        return frozenset(self.added_interventions + self.modified_interventions)
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added_interventions
+            or self.removed_interventions
+            or self.modified_interventions
+            or self.added_specialites
+            or self.removed_specialites
+            or self.modified_specialites
+            or self.reordered
+            or self.metadata_changed
+        )
+
+    def summary(self) -> str:
+        """Résumé d'une ligne (journalisation)."""
+        return (
+            f"interventions +{len(self.added_interventions)} "
+            f"-{len(self.removed_interventions)} ~{len(self.modified_interventions)}, "
+            f"spécialités +{len(self.added_specialites)} "
+            f"-{len(self.removed_specialites)} ~{len(self.modified_specialites)}"
+        )
+
+
+def _interventions_par_id(data: RFEData) -> dict[str, Intervention]:
+    """Interventions par identifiant (la première occurrence l'emporte)."""
+    par_id: dict[str, Intervention] = {}
+    for specialite in data.specialites:
+        for intervention in specialite.interventions:
+            par_id.setdefault(intervention.id, intervention)
+    return par_id
+
+
+def diff_rfe_data(old: RFEData, new: RFEData) -> RFEDiff:
+    """Calcule la différence structurelle entre deux générations de données.
+
+    Parameters
+    ----------
+    old : RFEData
+        Génération précédente.
+    new : RFEData
+        Nouvelle génération.
+
+    Returns
+    -------
+    RFEDiff
+        Enregistrements ajoutés, supprimés et modifiés (vide si identiques).
+    """
+    anciennes = _interventions_par_id(old)
+    nouvelles = _interventions_par_id(new)
+    added, modified = [], []
+    for intervention_id, intervention in nouvelles.items():
+        ancienne = anciennes.get(intervention_id)
+        if ancienne is None:
+            added.append(intervention_id)
+        elif ancienne is not intervention and ancienne != intervention:
+            modified.append(intervention_id)
+    removed = [i for i in anciennes if i not in nouvelles]
+
+    specialites_anciennes = {s.id: s for s in reversed(old.specialites)}
+    specialites_nouvelles = {s.id: s for s in reversed(new.specialites)}
+    specialites_added, specialites_modified = [], []
+    for specialite in new.specialites:
+        ancienne = specialites_anciennes.get(specialite.id)
+        if ancienne is None:
+            specialites_added.append(specialite.id)
+        elif ancienne.nom != specialite.nom or [i.id for i in ancienne.interventions] != [
+            i.id for i in specialite.interventions
+        ]:
+            specialites_modified.append(specialite.id)
+
+    return RFEDiff(
+        added_interventions=tuple(added),
+        removed_interventions=tuple(removed),
+        modified_interventions=tuple(modified),
+        added_specialites=tuple(specialites_added),
+        removed_specialites=tuple(
+            s.id for s in old.specialites if s.id not in specialites_nouvelles
+        ),
+        modified_specialites=tuple(dict.fromkeys(specialites_modified)),
+        reordered=[s.id for s in old.specialites if s.id in specialites_nouvelles]
+        != [s.id for s in new.specialites if s.id in specialites_anciennes],
+        metadata_changed=(
+            old.version != new.version
+            or old.date_extraction != new.date_extraction
+            or old.recommandations_generales != new.recommandations_generales
+        ),
+    )
+
+
+def share_unchanged(old: RFEData, new: RFEData, diff: RFEDiff) -> RFEData:
+    """Réutilise dans ``new`` les objets inchangés de ``old``.
+
+    Les interventions (et les spécialités entièrement inchangées) de la
+    génération précédente sont reprises telles quelles : les structures
+    dérivées qui les référencent restent valides et les objets fraîchement
+    désérialisés en double sont libérés.
+
+    Parameters
+    ----------
+    old : RFEData
+        Génération précédente.
+    new : RFEData
+        Nouvelle génération validée.
+    diff : RFEDiff
+        Différence ``diff_rfe_data(old, new)``.
+
+    Returns
+    -------
+    RFEData
+        Données égales à ``new``, partageant les objets inchangés de ``old``.
+    """
+    anciennes = _interventions_par_id(old)
+    changed = diff.changed_interventions
+    specialites_anciennes = {s.id: s for s in reversed(old.specialites)}
+    specialites_modified = set(diff.modified_specialites)
+
+    specialites: list[Specialite] = []
+    for specialite in new.specialites:
+        # L'égalité protège contre les identifiants dupliqués (seul le premier est apparié)
+        interventions = [
+            avant if i.id not in changed and (avant := anciennes.get(i.id)) == i else i
+            for i in specialite.interventions
+        ]
+        ancienne = specialites_anciennes.get(specialite.id)
+        if (
+            ancienne is not None
+            and specialite.id not in specialites_modified
+            and all(a is b for a, b in zip(ancienne.interventions, interventions, strict=True))
+        ):
+            specialites.append(ancienne)
+        else:
+            # Copie sans revalidation : les interventions sont déjà validées
+            specialites.append(specialite.model_copy(update={"interventions": interventions}))
+    return new.model_copy(update={"specialites": specialites})
@@ -0,0 +1,229 @@
+"""Index inversés en bitsets pour le filtrage des interventions.
+
+Pour chaque critère (molécule, force de recommandation, spécialité…) et
+chaque valeur, l'ensemble des interventions concernées est un entier
+Python dont le bit ``i`` vaut 1 si l'intervention de position ``i``
+(ordre de ``RFERepository.interventions``, identique à celui de
+``SearchIndex``) possède cette valeur. Une combinaison de critères se
+résout par des ``|`` (valeurs d'un même critère) et des ``&`` (critères
+différents), exécutés en C sur des mots machine ; ``int.bit_count`` donne
+le nombre de résultats sans les énumérer.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from app.data.models import Intervention
+
+# Critères indexés (noms des paramètres de GET /api/v1/interventions)
+FILTER_FIELDS = (
+    "molecule",
+    "force_recommandation",
+    "specialite",
+    "sous_categorie",
+    "source_tableau",
+    "source_page",
+)
+
+# Critères proposés comme facettes de la recherche (valeurs peu nombreuses, lisibles)
+FACET_FIELDS = ("specialite", "sous_categorie", "molecule", "force_recommandation")
+
+
+def _valeurs(intervention: Intervention, field: str) -> Iterable[str | int]:
+    """Valeurs indexées d'une intervention pour un critère."""
+    if field == "molecule":
+        # Protocole standard et alternatives en cas d'allergie
+        protocoles = [intervention.protocole, *(intervention.alternative_allergie or ())]
+        return {p.molecule.value for p in protocoles if p is not None}
+    valeur = getattr(intervention, field)
+    return () if valeur is None else (valeur,)
+
+
+@dataclass(frozen=True)
+class FilterIndex:
+    """Bitsets par critère et par valeur, construits une fois par jeu de données.
+
+    Attributes
+    ----------
+    size : int
+        Nombre d'interventions indexées.
+    bitsets : dict[str, dict[str | int, int]]
+        Pour chaque critère de ``FILTER_FIELDS``, bitset de chaque valeur.
+    """
+
+    size: int
+    bitsets: dict[str, dict[str | int, int]]
+
+    @classmethod
+    def from_interventions(cls, interventions: tuple[Intervention, ...]) -> FilterIndex:
+        """Indexe les interventions, dans l'ordre donné.
+
+        Parameters
+        ----------
+        interventions : tuple[Intervention, ...]
+            Interventions à plat (``RFERepository.interventions``).
+
+        Returns
+        -------
+        FilterIndex
+            Index prêt à l'emploi.
+        """
+        positions: dict[str, defaultdict[str | int, list[int]]] = {
+            field: defaultdict(list) for field in FILTER_FIELDS
+        }
+        for i, intervention in enumerate(interventions):
+            for field in FILTER_FIELDS:
+                for valeur in _valeurs(intervention, field):
+                    positions[field][valeur].append(i)
+        return cls(
+            size=len(interventions),
+            bitsets={
+                field: {valeur: _bitset(pos) for valeur, pos in par_valeur.items()}
+                for field, par_valeur in positions.items()
+            },
+        )
+
+    @property
+    def all(self) -> int:
+        """Bitset de toutes les interventions."""
+        return (1 << self.size) - 1
+
+    def match(self, field: str, values: Iterable[str | int]) -> int:
+        """Interventions ayant au moins une des valeurs ``values`` pour ``field``."""
+        par_valeur = self.bitsets[field]
+        bits = 0
+        for valeur in values:
+            bits |= par_valeur.get(valeur, 0)
+        return bits
+
+    def select(self, criteria: Mapping[str, Iterable[str | int]]) -> int:
+        """Interventions satisfaisant tous les critères (valeurs d'un critère : « ou »).
+
+        Parameters
+        ----------
+        criteria : Mapping[str, Iterable[str | int]]
+            Valeurs acceptées par critère ; un critère absent ne filtre pas.
+
+        Returns
+        -------
+        int
+            Bitset des interventions retenues.
+        """
+        bits = self.all
+        # Les critères les plus sélectifs d'abord : le résultat rétrécit au plus vite
+        for critere in sorted(
+            (self.match(field, values) for field, values in criteria.items()),
+            key=int.bit_count,
+        ):
+            bits &= critere
+            if not bits:
+                break
+        return bits
+
+    def facets(
+        self,
+        candidates: int,
+        criteria: Mapping[str, Iterable[str | int]],
+        fields: Iterable[str] = FACET_FIELDS,
+    ) -> tuple[int, dict[str, dict[str | int, int]]]:
+        """Restreint ``candidates`` aux critères et compte les valeurs de chaque facette.
+
+        Les comptes d'une facette tiennent compte des critères des *autres*
+        facettes seulement : cocher une spécialité laisse voir combien de
+        résultats apporterait chacune des autres. Chaque compte est un ``&``
+        suivi d'un ``int.bit_count``, sans énumérer les interventions.
+
+        Parameters
+        ----------
+        candidates : int
+            Bitset des interventions candidates (ex. correspondances d'une recherche).
+        criteria : Mapping[str, Iterable[str | int]]
+            Valeurs acceptées par critère ; un critère absent ne filtre pas.
+        fields : Iterable[str], optional
+            Critères dont compter les valeurs (défaut : ``FACET_FIELDS``).
+
+        Returns
+        -------
+        tuple[int, dict[str, dict[str | int, int]]]
+            Bitset des candidates retenues, et pour chaque facette le nombre
+            de résultats par valeur (comptes décroissants). Les valeurs sans
+            résultat sont omises, sauf celles sélectionnées dans ``criteria``.
+        """
+        masques = {field: self.match(field, values) for field, values in criteria.items()}
+        retenues = candidates
+        for masque in sorted(masques.values(), key=int.bit_count):
+            retenues &= masque
+            if not retenues:
+                break
+        comptes: dict[str, dict[str | int, int]] = {}
+        for field in fields:
+            if field in masques:
+                base = candidates
+                for autre, masque in masques.items():
+                    if autre != field:
+                        base &= masque
+            else:
+                base = retenues
+            par_valeur: dict[str | int, int] = {}
+            if base:
+                for valeur, bits in self.bitsets[field].items():
+                    if n := (bits & base).bit_count():
+                        par_valeur[valeur] = n
+            for valeur in criteria.get(field, ()):
+                par_valeur.setdefault(valeur, 0)
+            comptes[field] = dict(
+                sorted(par_valeur.items(), key=lambda item: (-item[1], str(item[0])))
+            )
+        return retenues, comptes
+
+
+def positions_bitset(positions: Iterable[int]) -> int:
+    """Bitset des positions données, dans un ordre quelconque."""
+    return _bitset(sorted(positions))
+
+
+def _bitset(positions: list[int]) -> int:
+    """Bitset des positions données (croissantes), construit en un seul entier."""
+    if not positions:
+        return 0
+    octets = bytearray(positions[-1] // 8 + 1)
+    for i in positions:
+        octets[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(octets, "little")
+
+
+def bit_positions(bits: int, skip: int = 0, limit: int | None = None) -> list[int]:
+    """Positions des bits à 1, par ordre croissant, avec pagination.
+
+    Parameters
+    ----------
+    bits : int
+        Bitset (entier positif).
+    skip : int, optional
+        Nombre de positions à sauter.
+    limit : int | None, optional
+        Nombre maximal de positions retournées (défaut : toutes).
+
+    Returns
+    -------
+    list[int]
+        Positions ``skip`` à ``skip + limit`` (exclue) des bits à 1.
+    """
+    # Écriture binaire inversée : le caractère i est le bit i ; str.find parcourt en C
+    binaire = bin(bits)[:1:-1]
+    positions: list[int] = []
+    fin = None if limit is None else skip + limit
+    i = binaire.find("1")
+    rang = 0
+    while i != -1 and (fin is None or rang < fin):
+        if rang >= skip:
+            positions.append(i)
+        rang += 1
+        i = binaire.find("1", i + 1)
+    return positions
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path  # noqa: TC003 — utilisé au runtime
+from typing import TYPE_CHECKING
 
+from app.data.compact import compact_rfe_data
 from app.data.models import RFEData
 
+if TYPE_CHECKING:
+    from app.data.dataset import Dataset
+
 
 def load_rfe_data(path: Path) -> RFEData:
     """Charge et valide les données RFE depuis un fichier JSON.
@@ -19,7 +25,8 @@ def load_rfe_data(path: Path) -> RFEData:
     Returns
     -------
     RFEData
-        Données validées par Pydantic.
+        Données validées par Pydantic, en représentation compacte
+        (voir ``app.data.compact``).
 
     Raises
     ------
@@ -32,4 +39,54 @@ def load_rfe_data(path: Path) -> RFEData:
     """
     raw = path.read_text(encoding="utf-8")
     data = json.loads(raw)
-    return RFEData.model_validate(data)
+    return compact_rfe_data(RFEData.model_validate(data))
+
+
+def compute_fingerprint(data: RFEData) -> str:
+    """Calcule une empreinte de contenu des données RFE validées.
+
+    Deux jeux de données de même contenu ont la même empreinte : elle sert
+    de clé de version aux caches dérivés des données.
+
+    Parameters
+    ----------
+    data : RFEData
+        Données RFE validées.
+
+    Returns
+    -------
+    str
+        Empreinte hexadécimale (SHA-256 tronqué à 16 caractères).
+    """
+    return hashlib.sha256(data.model_dump_json().encode("utf-8")).hexdigest()[:16]
+
+
+def load_dataset(path: Path, snapshot_path: Path | None = None) -> Dataset:
+    """Charge le jeu de données, depuis l'instantané binaire s'il est à jour.
+
+    L'instantané (voir ``app.data.snapshot``) évite le parsing JSON, la
+    validation Pydantic et la construction des index au démarrage. Il n'est
+    utilisé que si son empreinte correspond au contenu de ``path`` ; à défaut,
+    le chargement complet s'applique.
+
+    Parameters
+    ----------
+    path : Path
+        Chemin vers le fichier ``rfe.json``.
+    snapshot_path : Path | None, optional
+        Chemin vers l'instantané (défaut : pas d'instantané).
+
+    Returns
+    -------
+    Dataset
+        Données validées et structures dérivées.
+    """
+    # Imports locaux : dataset et snapshot dépendent de ce module
+    from app.data.dataset import Dataset
+    from app.data.snapshot import read_snapshot
+
+    if snapshot_path is not None:
+        dataset = read_snapshot(snapshot_path, path)
+        if dataset is not None:
+            return dataset
+    return Dataset.from_data(load_rfe_data(path))
@@ -60,7 +60,13 @@ class ForceRecommandation(StrEnum):
 
 
 class Protocole(StrictBaseModel):
-    """Protocole d'antibioprophylaxie (standard ou alternative allergie)."""
+    """Protocole d'antibioprophylaxie (standard ou alternative allergie).
+
+    Immuable : une même instance est partagée par toutes les interventions
+    au protocole identique (voir ``app.data.compact``).
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     molecule: Molecule
     dose_initiale: str
@@ -0,0 +1,191 @@
+"""Index inversé de n-grammes de caractères pour les requêtes courtes.
+
+Chaque n-gramme (1 à ``max_n`` caractères) d'un texte normalisé pointe vers
+la liste triée des documents qui le contiennent (``array('I')`` compact).
+Une requête de longueur ≤ ``max_n`` est elle-même un n-gramme : sa liste
+de documents est lue directement. Au-delà, les listes de ses n-grammes sont
+intersectées puis chaque candidat est vérifié par sous-chaîne.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+
+# Longueur maximale des n-grammes indexés (uni-, bi- et trigrammes)
+_MAX_N = 3
+
+
+def _est_debut_de_mot(texte: str, pos: int) -> bool:
+    """Indique si ``pos`` est le début d'un mot dans ``texte``."""
+    return pos == 0 or not texte[pos - 1].isalnum()
+
+
+def _ngrammes(texte: str, max_n: int) -> set[str]:
+    """N-grammes distincts (1 à ``max_n`` caractères) de ``texte``."""
+    return {texte[i : i + n] for n in range(1, max_n + 1) for i in range(len(texte) - n + 1)}
+
+
+class NGramIndex:
+    """Index inversé n-gramme → documents, sur des textes déjà normalisés.
+
+    Parameters
+    ----------
+    textes : tuple[str, ...]
+        Textes normalisés (``strip_accents``), l'indice sert d'identifiant.
+    max_n : int, optional
+        Longueur maximale des n-grammes indexés (défaut : 3).
+    """
+
+    __slots__ = ("max_n", "postings", "textes")
+
+    def __init__(self, textes: tuple[str, ...], max_n: int = _MAX_N) -> None:
+        self.textes = textes
+        self.max_n = max_n
+        postings: dict[str, array] = {}
+        for doc, texte in enumerate(textes):
+            for gram in _ngrammes(texte, max_n):
+                liste = postings.get(gram)
+                if liste is None:
+                    liste = postings[gram] = array("I")
+                # Les documents sont parcourus dans l'ordre : listes triées, sans doublon
+                liste.append(doc)
+        self.postings = postings
+
+    def patched(self, textes: tuple[str, ...], anciens: list[int | None]) -> NGramIndex:
+        """Retourne l'index de ``textes`` en ne ré-indexant que les textes nouveaux.
+
+        Les listes de documents sont renumérotées selon ``anciens`` ; seuls
+        les n-grammes des textes sans correspondance sont calculés. Si les
+        documents conservés changent d'ordre relatif, l'index est reconstruit.
+
+        Parameters
+        ----------
+        textes : tuple[str, ...]
+            Nouveaux textes normalisés.
+        anciens : list[int | None]
+            Pour chaque nouveau texte, sa position dans cet index s'il est
+            inchangé, sinon None.
+
+        Returns
+        -------
+        NGramIndex
+            Index équivalent à ``NGramIndex(textes, self.max_n)``.
+        """
+        correspondance = [-1] * len(self.textes)
+        precedent = -1
+        for doc, ancien in enumerate(anciens):
+            if ancien is None:
+                continue
+            if ancien <= precedent:
+                # Ordre relatif modifié : la renumérotation casserait le tri des listes
+                return NGramIndex(textes, self.max_n)
+            correspondance[ancien] = doc
+            precedent = ancien
+
+        if len(textes) == len(self.textes) and all(
+            doc in (-1, ancien) for ancien, doc in enumerate(correspondance)
+        ):
+            # Numérotation inchangée : seules les listes des textes retirés sont copiées
+            postings = dict(self.postings)
+            copiees: set[str] = set()
+            for ancien, doc in enumerate(correspondance):
+                if doc != -1:
+                    continue
+                for gram in _ngrammes(self.textes[ancien], self.max_n):
+                    liste = array("I", postings[gram])
+                    liste.remove(ancien)
+                    if liste:
+                        postings[gram] = liste
+                        copiees.add(gram)
+                    else:
+                        del postings[gram]
+        else:
+            postings = {}
+            for gram, liste in self.postings.items():
+                renumerotee = array("I", [d for a in liste if (d := correspondance[a]) != -1])
+                if renumerotee:
+                    postings[gram] = renumerotee
+            copiees = set(postings)
+
+        for doc, ancien in enumerate(anciens):
+            if ancien is not None:
+                continue
+            for gram in _ngrammes(textes[doc], self.max_n):
+                liste = postings.get(gram)
+                if liste is None:
+                    postings[gram] = array("I", [doc])
+                    copiees.add(gram)
+                    continue
+                if gram not in copiees:
+                    # Liste partagée avec l'index d'origine : copie avant modification
+                    liste = postings[gram] = array("I", liste)
+                    copiees.add(gram)
+                liste.insert(bisect_left(liste, doc), doc)
+
+        index = NGramIndex.__new__(NGramIndex)
+        index.textes = textes
+        index.max_n = self.max_n
+        index.postings = postings
+        return index
+
+    def candidats(self, query: str) -> set[int]:
+        """Retourne les documents contenant ``query`` comme sous-chaîne.
+
+        Parameters
+        ----------
+        query : str
+            Requête normalisée (``strip_accents``).
+
+        Returns
+        -------
+        set[int]
+            Identifiants des documents contenant la requête.
+        """
+        if not query:
+            return set()
+        if len(query) <= self.max_n:
+            return set(self.postings.get(query, ()))
+
+        grams = {query[i : i + self.max_n] for i in range(len(query) - self.max_n + 1)}
+        listes = sorted((self.postings.get(g, ()) for g in grams), key=len)
+        docs = set(listes[0])
+        for liste in listes[1:]:
+            if not docs:
+                break
+            docs.intersection_update(liste)
+        # Les n-grammes présents ne garantissent pas la sous-chaîne : vérification
+        return {doc for doc in docs if query in self.textes[doc]}
+
+    def rechercher(self, query: str, limit: int | None = None) -> list[int]:
+        """Retourne les documents contenant ``query``, classés de façon stable.
+
+        Ordre : texte commençant par la requête, puis début de mot, puis
+        sous-chaîne quelconque ; à rang égal, la position de la première
+        occurrence puis l'ordre d'indexation départagent.
+
+        Parameters
+        ----------
+        query : str
+            Requête normalisée (``strip_accents``).
+        limit : int | None, optional
+            Nombre maximum de documents retournés (défaut : tous).
+
+        Returns
+        -------
+        list[int]
+            Identifiants des documents, du plus pertinent au moins pertinent.
+        """
+        cles = []
+        for doc in self.candidats(query):
+            texte = self.textes[doc]
+            premiere = pos = texte.find(query)
+            rang = 2
+            while pos != -1:
+                if _est_debut_de_mot(texte, pos):
+                    rang = 0 if pos == 0 else 1
+                    break
+                pos = texte.find(query, pos + 1)
+            cles.append((rang, premiere, doc))
+        cles.sort()
+        return [doc for _, _, doc in cles[:limit]]
@@ -0,0 +1,109 @@
+"""Pagination par curseur (keyset) des interventions.
+
+Les interventions sont parcourues dans l'ordre de leurs identifiants
+(``RFERepository.ids_tries``). Un curseur désigne la dernière intervention
+servie : la page suivante commence au premier identifiant strictement plus
+grand. Le parcours reste cohérent d'un rechargement à chaud à l'autre :
+aucune intervention présente du début à la fin du parcours n'est sautée ni
+servie deux fois, contrairement à ``skip`` dont les positions se décalent
+quand des interventions sont ajoutées ou supprimées.
+
+Le curseur est opaque pour le client (base64 url) ; il contient aussi
+l'empreinte des données et la position de la dernière intervention dans
+l'ordre de parcours, pour reprendre en O(1) sur la même génération (sinon
+une recherche dichotomique, O(log n)).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import bisect
+from dataclasses import dataclass
+
+# Préfixe de l'empreinte conservé dans le curseur
+_FINGERPRINT_LEN = 12
+
+
+class InvalidCursorError(ValueError):
+    """Levée quand un curseur ne peut pas être décodé."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position de reprise d'un parcours.
+
+    Attributes
+    ----------
+    fingerprint : str
+        Préfixe de l'empreinte des données de la page précédente.
+    position : int
+        Position de ``last_id`` dans ``ids_tries`` de cette génération.
+    last_id : str
+        Identifiant de la dernière intervention servie.
+    """
+
+    fingerprint: str
+    position: int
+    last_id: str
+
+    def encode(self) -> str:
+        """Forme opaque du curseur, utilisable telle quelle dans une URL."""
+        raw = f"{self.fingerprint}:{self.position}:{self.last_id}".encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> Cursor:
+        """Décode un curseur produit par ``encode``.
+
+        Raises
+        ------
+        InvalidCursorError
+            Si ``token`` n'est pas un curseur valide.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            fingerprint, position, last_id = raw.split(":", 2)
+            return cls(fingerprint, int(position), last_id)
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursorError(f"Curseur invalide : {token!r}.") from e
+
+
+def keyset_page(
+    ids_tries: tuple[str, ...], fingerprint: str, cursor: Cursor | None, limit: int
+) -> tuple[tuple[str, ...], Cursor | None]:
+    """Identifiants de la page qui suit ``cursor``, et le curseur de la suivante.
+
+    Parameters
+    ----------
+    ids_tries : tuple[str, ...]
+        Ordre de parcours de la génération servie.
+    fingerprint : str
+        Empreinte des données de la génération servie.
+    cursor : Cursor | None
+        Curseur reçu, ou None pour la première page.
+    limit : int
+        Nombre maximal d'identifiants par page.
+
+    Returns
+    -------
+    tuple[tuple[str, ...], Cursor | None]
+        Identifiants de la page (O(limit)), et le curseur de la page
+        suivante (None si la page est la dernière).
+    """
+    if cursor is None:
+        start = 0
+    elif (
+        cursor.fingerprint == fingerprint[:_FINGERPRINT_LEN]
+        and 0 <= cursor.position < len(ids_tries)
+        and ids_tries[cursor.position] == cursor.last_id
+    ):
+        start = cursor.position + 1
+    else:
+        # Données rechargées depuis : l'ordre de parcours est le même, seule la position a bougé
+        start = bisect.bisect_right(ids_tries, cursor.last_id)
+    end = min(start + limit, len(ids_tries))
+    page = ids_tries[start:end]
+    if end >= len(ids_tries):
+        return page, None
+    return page, Cursor(fingerprint[:_FINGERPRINT_LEN], end - 1, page[-1])
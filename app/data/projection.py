@@ -0,0 +1,186 @@
+"""Projections des réponses de l'API (``view=summary``, ``fields=``).
+
+Une projection ne retient que certains champs de premier niveau de chaque
+spécialité ou intervention. Ses corps JSON sont encodés une fois par
+génération de données et par ensemble de champs : la vue résumée à la
+création de la génération, les autres projections à leur première demande
+(cache LRU borné). Les requêtes suivantes ne font qu'assembler des octets,
+comme pour la vue complète (``app.data.serialized``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import pydantic_core
+
+from app.data.cache import LRUCache
+from app.data.models import Intervention, Specialite
+from app.data.serialized import _join
+
+if TYPE_CHECKING:
+    from app.data.repository import RFERepository
+
+type Resource = Literal["specialites", "interventions"]
+
+# Champs projetables, dans l'ordre de la vue complète
+FIELDS: dict[Resource, tuple[str, ...]] = {
+    "specialites": ("id", "nom", "nb_interventions", "interventions"),
+    "interventions": tuple(Intervention.model_fields),
+}
+
+# Clés de la vue complète (sans ``nb_interventions`` pour une spécialité) : une
+# demande de ces champs, et d'eux seuls, est servie par les corps pré-encodés
+_FULL_FIELDS: dict[Resource, tuple[str, ...]] = {
+    "specialites": tuple(Specialite.model_fields),
+    "interventions": tuple(Intervention.model_fields),
+}
+
+# Champs de la vue ``summary`` (ceux de la grille des spécialités de l'accueil)
+SUMMARY_FIELDS: dict[Resource, tuple[str, ...]] = {
+    "specialites": ("id", "nom", "nb_interventions"),
+    "interventions": ("id", "nom", "specialite", "force_recommandation"),
+}
+
+
+def parse_fields(resource: Resource, fields: str) -> tuple[str, ...]:
+    """Champs demandés par ``fields=``, dans l'ordre de la vue complète.
+
+    Parameters
+    ----------
+    resource : Resource
+        ``"specialites"`` ou ``"interventions"``.
+    fields : str
+        Noms de champs séparés par des virgules (ex. ``"id,nom"``).
+
+    Returns
+    -------
+    tuple[str, ...]
+        Champs sans doublon, dans l'ordre de ``FIELDS[resource]`` : deux
+        écritures d'une même projection partagent ses corps encodés.
+
+    Raises
+    ------
+    ValueError
+        Si aucun champ n'est donné ou si un champ est inconnu.
+    """
+    demandes = {f.strip() for f in fields.split(",")} - {""}
+    if not demandes:
+        raise ValueError("Paramètre fields vide.")
+    inconnus = demandes.difference(FIELDS[resource])
+    if inconnus:
+        raise ValueError(
+            f"Champ(s) inconnu(s) : {', '.join(sorted(inconnus))}. "
+            f"Champs disponibles : {', '.join(FIELDS[resource])}."
+        )
+    return tuple(f for f in FIELDS[resource] if f in demandes)
+
+
+def requested_fields(
+    resource: Resource, view: Literal["summary", "full"], fields: str | None
+) -> tuple[str, ...] | None:
+    """Projection demandée par ``view=`` et ``fields=`` (``fields`` prime).
+
+    Returns
+    -------
+    tuple[str, ...] | None
+        Champs à servir, ou None pour la vue complète (réponse par défaut).
+
+    Raises
+    ------
+    ValueError
+        Si ``fields`` est vide ou contient un champ inconnu.
+    """
+    if fields is not None:
+        champs = parse_fields(resource, fields)
+        return None if champs == _FULL_FIELDS[resource] else champs
+    return SUMMARY_FIELDS[resource] if view == "summary" else None
+
+
+def _specialite_json(specialite: Specialite, fields: tuple[str, ...]) -> bytes:
+    valeurs = {
+        "id": specialite.id,
+        "nom": specialite.nom,
+        "nb_interventions": len(specialite.interventions),
+        "interventions": specialite.interventions,
+    }
+    return pydantic_core.to_json({f: valeurs[f] for f in fields})
+
+
+def _intervention_json(intervention: Intervention, fields: tuple[str, ...]) -> bytes:
+    return pydantic_core.to_json({f: getattr(intervention, f) for f in fields})
+
+
+class Projections:
+    """Corps JSON projetés des spécialités et interventions d'une génération.
+
+    Parameters
+    ----------
+    repository : RFERepository
+        Dépôt de la génération servie.
+    maxsize : int, optional
+        Nombre de projections ``fields=`` conservées (hors vues résumées).
+    """
+
+    def __init__(self, repository: RFERepository, maxsize: int = 32) -> None:
+        self._repository = repository
+        self._cache: LRUCache[tuple[Resource, tuple[str, ...]], tuple[bytes, ...]] = LRUCache(
+            maxsize
+        )
+        # En cas d'ID dupliqué, la première occurrence l'emporte (comme le dépôt)
+        self._positions: dict[Resource, dict[str, int]] = {
+            "specialites": {},
+            "interventions": {},
+        }
+        for i, specialite in enumerate(repository.specialites):
+            self._positions["specialites"].setdefault(specialite.id, i)
+        for i, intervention in enumerate(repository.interventions):
+            self._positions["interventions"].setdefault(intervention.id, i)
+        # Vues résumées : encodées dès la création, hors du cache LRU
+        self._summaries = {
+            resource: self._encode(resource, fields) for resource, fields in SUMMARY_FIELDS.items()
+        }
+
+    def _encode(self, resource: Resource, fields: tuple[str, ...]) -> tuple[bytes, ...]:
+        if resource == "specialites":
+            return tuple(_specialite_json(s, fields) for s in self._repository.specialites)
+        return tuple(_intervention_json(i, fields) for i in self._repository.interventions)
+
+    def _encoded(self, resource: Resource, fields: tuple[str, ...]) -> tuple[bytes, ...]:
+        """Éléments encodés de la projection, construits à la première demande."""
+        if fields == SUMMARY_FIELDS[resource]:
+            return self._summaries[resource]
+        return self._cache.get_or_compute(
+            (resource, fields), lambda: self._encode(resource, fields)
+        )
+
+    def specialites_list(self, fields: tuple[str, ...]) -> bytes:
+        """Corps de ``GET /api/v1/specialites`` restreint à ``fields``."""
+        return _join(self._encoded("specialites", fields))
+
+    def specialite(self, specialite_id: str, fields: tuple[str, ...]) -> bytes | None:
+        """Corps de ``GET /api/v1/specialites/{id}`` restreint à ``fields``, ou None."""
+        position = self._positions["specialites"].get(specialite_id)
+        return None if position is None else self._encoded("specialites", fields)[position]
+
+    def interventions_page(self, fields: tuple[str, ...], skip: int, limit: int) -> bytes:
+        """Corps de ``GET /api/v1/interventions?skip=&limit=`` restreint à ``fields``."""
+        return _join(self._encoded("interventions", fields)[skip : skip + limit])
+
+    def interventions_at(self, positions: list[int], fields: tuple[str, ...]) -> bytes:
+        """Tableau JSON des interventions aux positions données, restreint à ``fields``."""
+        encodes = self._encoded("interventions", fields)
+        return _join(tuple(encodes[i] for i in positions))
+
+    def interventions_list(
+        self, intervention_ids: tuple[str, ...], fields: tuple[str, ...]
+    ) -> bytes:
+        """Tableau JSON des interventions d'identifiants donnés (tous connus), restreint."""
+        encodes = self._encoded("interventions", fields)
+        positions = self._positions["interventions"]
+        return _join(tuple(encodes[positions[i]] for i in intervention_ids))
+
+    def intervention(self, intervention_id: str, fields: tuple[str, ...]) -> bytes | None:
+        """Corps de ``GET /api/v1/interventions/{id}`` restreint à ``fields``, ou None."""
+        position = self._positions["interventions"].get(intervention_id)
+        return None if position is None else self._encoded("interventions", fields)[position]
@@ -0,0 +1,190 @@
+"""Langage de requête à champs qualifiés, compilé en plan d'exécution.
+
+Syntaxe (termes séparés par des espaces, valeurs entre guillemets admises) :
+
+- ``champ:valeur`` : critère sur un index inversé (voir ``FIELD_ALIASES``) ;
+  la valeur est comparée sans accents ni casse, à l'identique ou à défaut
+  comme sous-chaîne des valeurs indexées (``specialite:ortho``) ;
+- ``-champ:valeur`` : exclusion sur le même critère ;
+- ``-terme`` : exclusion des interventions dont le texte indexé (nom +
+  spécialité) contient ``terme`` ;
+- tout autre terme : texte libre, scoré en fuzzy (``partial_ratio``).
+
+Exemple : ``molecule:cefazoline specialite:ortho hanche -reprise``.
+
+Critères et exclusions se résolvent en un bitset (``FilterIndex`` et index
+n-gramme de ``SearchIndex``, mêmes positions) ; le scoring fuzzy ne porte
+ensuite que sur les interventions restantes (voir ``search_candidates``).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from app.data.filters import positions_bitset
+from app.utils.text import strip_accents
+
+if TYPE_CHECKING:
+    from app.data.filters import FilterIndex
+    from app.data.search import SearchIndex
+
+# Noms de champ acceptés (normalisés : sans accents, tirets → soulignés) → critère indexé
+FIELD_ALIASES = {
+    "molecule": "molecule",
+    "specialite": "specialite",
+    "sous_categorie": "sous_categorie",
+    "categorie": "sous_categorie",
+    "force": "force_recommandation",
+    "grade": "force_recommandation",
+    "force_recommandation": "force_recommandation",
+    "tableau": "source_tableau",
+    "source_tableau": "source_tableau",
+    "page": "source_page",
+    "source_page": "source_page",
+}
+
+# Terme : exclusion facultative, champ facultatif, valeur entre guillemets ou sans espace
+_TERME = re.compile(r'(-?)(?:([^\s:"]+):)?(?:"([^"]*)"?|(\S+))')
+
+
+@lru_cache(maxsize=4096)
+def _cle(valeur: str | int) -> str:
+    """Forme de comparaison d'une valeur de critère (mémoïsée : peu de valeurs indexées)."""
+    return strip_accents(str(valeur)).replace("-", " ").replace("_", " ").strip()
+
+
+@dataclass(frozen=True)
+class Clause:
+    """Critère ou exclusion d'une requête.
+
+    Attributes
+    ----------
+    field : str | None
+        Critère indexé (``FILTER_FIELDS``), None pour un terme libre exclu.
+    value : str
+        Valeur normalisée (``strip_accents``).
+    negated : bool
+        Exclusion (``-``) plutôt que critère.
+    """
+
+    field: str | None
+    value: str
+    negated: bool
+
+
+@dataclass(frozen=True)
+class ParsedQuery:
+    """Requête découpée en texte libre et clauses.
+
+    Attributes
+    ----------
+    text : str
+        Termes libres normalisés, à scorer en fuzzy.
+    clauses : tuple[Clause, ...]
+        Critères et exclusions, dans l'ordre de la requête.
+    """
+
+    text: str
+    clauses: tuple[Clause, ...]
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Plan d'exécution d'une requête pour un jeu de données.
+
+    Attributes
+    ----------
+    text : str
+        Texte à scorer en fuzzy (vide : pas de scoring).
+    candidates : int | None
+        Bitset des interventions admises par les clauses, None sans clause.
+    """
+
+    text: str
+    candidates: int | None
+
+
+def parse_query(query: str) -> ParsedQuery:
+    """Découpe une requête en texte libre et clauses.
+
+    Un préfixe ``xxx:`` qui n'est pas un champ connu (``10:30``) reste du
+    texte libre.
+
+    Parameters
+    ----------
+    query : str
+        Requête saisie.
+
+    Returns
+    -------
+    ParsedQuery
+        Texte libre et clauses, normalisés.
+    """
+    libres: list[str] = []
+    clauses: list[Clause] = []
+    for match in _TERME.finditer(strip_accents(query)):
+        moins, champ, guillemets, nu = match.groups()
+        valeur = (guillemets if guillemets is not None else nu).strip()
+        field = FIELD_ALIASES.get(champ.replace("-", "_")) if champ else None
+        if champ and field is None:
+            valeur = f"{champ}:{valeur}"
+        if not valeur:
+            continue
+        if field is not None or moins:
+            clauses.append(Clause(field, valeur, negated=bool(moins)))
+        else:
+            libres.append(valeur)
+    return ParsedQuery(" ".join(libres), tuple(clauses))
+
+
+def is_structured(query: str) -> bool:
+    """Indique si la requête contient des clauses (champ qualifié ou exclusion)."""
+    if ":" not in query and "-" not in query:
+        return False
+    return bool(parse_query(query).clauses)
+
+
+def _match_field(filters: FilterIndex, field: str, value: str) -> int:
+    """Bitset d'une clause ``champ:valeur`` : valeur identique, sinon sous-chaîne."""
+    cible = _cle(value)
+    par_cle = [(_cle(v), bits) for v, bits in filters.bitsets[field].items()]
+    exactes = [bits for cle, bits in par_cle if cle == cible]
+    bits = 0
+    for b in exactes or [b for cle, b in par_cle if cible in cle]:
+        bits |= b
+    return bits
+
+
+def compile_query(query: str, index: SearchIndex, filters: FilterIndex) -> QueryPlan:
+    """Compile une requête en plan d'exécution sur les index d'un jeu de données.
+
+    Parameters
+    ----------
+    query : str
+        Requête saisie (voir la syntaxe du module).
+    index : SearchIndex
+        Index de recherche (index n-gramme des exclusions de texte).
+    filters : FilterIndex
+        Index inversés du même jeu de données.
+
+    Returns
+    -------
+    QueryPlan
+        Texte à scorer et bitset des interventions admises.
+    """
+    parsed = parse_query(query)
+    if not parsed.clauses:
+        return QueryPlan(parsed.text, None)
+    bits = filters.all
+    for clause in parsed.clauses:
+        if clause.field is None:
+            match = positions_bitset(index.ngrams.candidats(clause.value))
+        else:
+            match = _match_field(filters, clause.field, clause.value)
+        bits = bits & ~match if clause.negated else bits & match
+        if not bits:
+            break
+    return QueryPlan(parsed.text, bits)
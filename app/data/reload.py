@@ -0,0 +1,280 @@
+"""Rechargement à chaud de rfe.json avec bascule atomique de génération.
+
+Chaque chargement produit une ``DatasetGeneration`` immuable : données,
+structures dérivées et cache de recherche. Le rechargement construit la
+nouvelle génération en arrière-plan puis remplace la référence courante
+en une seule affectation : une requête qui a lu ``manager.current`` termine
+sur sa génération, les suivantes voient la nouvelle.
+
+La nouvelle génération est dérivée de la courante (``Dataset.patched``) :
+seuls les enregistrements ajoutés, supprimés ou modifiés sont réindexés.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from app.data.cache import LRUCache
+from app.data.diff import RFEDiff
+from app.data.loader import load_dataset, load_rfe_data
+from app.data.projection import Projections
+from app.data.search import carry_over_search_cache
+from app.data.snapshot import file_sha256
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from app.data.dataset import Dataset
+    from app.data.models import RFEData
+    from app.data.repository import RFERepository
+    from app.data.search import SearchIndex
+    from app.data.serialized import SerializedResponses
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DatasetGeneration:
+    """Génération immuable du jeu de données servi.
+
+    Attributes
+    ----------
+    number : int
+        Numéro de génération (1 au démarrage, +1 à chaque rechargement).
+    dataset : Dataset
+        Données validées et structures dérivées.
+    search_cache : LRUCache
+        Cache des résultats de recherche propre à cette génération.
+    query_plans : LRUCache
+        Plans compilés des requêtes à champs qualifiés (voir ``app.data.query``).
+    projections : Projections
+        Corps projetés de l'API (``view=summary``, ``fields=``).
+    source_sha256 : str
+        Empreinte du fichier ``rfe.json`` chargé.
+    loaded_at : datetime.datetime
+        Date de mise en service (UTC).
+    modified_at : datetime.datetime
+        Date de modification du fichier ``rfe.json`` chargé (UTC, ``Last-Modified``).
+    load_duration : float
+        Durée du chargement et de la construction des index, en secondes.
+    diff : RFEDiff
+        Modifications par rapport à la génération précédente (vide pour la première).
+    """
+
+    number: int
+    dataset: Dataset
+    search_cache: LRUCache
+    query_plans: LRUCache
+    projections: Projections
+    source_sha256: str
+    loaded_at: datetime.datetime
+    modified_at: datetime.datetime
+    load_duration: float
+    diff: RFEDiff = RFEDiff()
+
+    @property
+    def rfe_data(self) -> RFEData:
+        """Données RFE validées."""
+        return self.dataset.rfe_data
+
+    @property
+    def repository(self) -> RFERepository:
+        """Tables de correspondance par identifiant."""
+        return self.dataset.repository
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Index de recherche pré-calculé."""
+        return self.dataset.search_index
+
+    @property
+    def responses(self) -> SerializedResponses:
+        """Corps JSON pré-encodés de l'API."""
+        return self.dataset.responses
+
+
+class DatasetManager:
+    """Détient la génération courante et la remplace lors d'un rechargement.
+
+    Parameters
+    ----------
+    data_path : Path
+        Chemin vers ``rfe.json``.
+    snapshot_path : Path | None
+        Instantané binaire éventuel (voir ``app.data.snapshot``).
+    cache_size : int
+        Taille du cache de recherche de chaque génération.
+    cache_ttl : float | None
+        Durée de vie des entrées du cache de recherche.
+    search_weights : Mapping[str, float] | None, optional
+        Poids des champs de recherche (voir ``SearchIndex.weighted``) ;
+        None pour les poids par défaut.
+    """
+
+    def __init__(
+        self,
+        data_path: Path,
+        snapshot_path: Path | None,
+        cache_size: int,
+        cache_ttl: float | None,
+        search_weights: Mapping[str, float] | None = None,
+    ) -> None:
+        self.data_path = data_path
+        self.snapshot_path = snapshot_path
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.search_weights = search_weights
+        self.last_error: str | None = None
+        # Sérialise les rechargements (surveillance du fichier et endpoint d'administration)
+        self._reload_lock = threading.Lock()
+        self._current = self._build(1)
+
+    @property
+    def current(self) -> DatasetGeneration:
+        """Génération courante (à lire une fois par requête)."""
+        return self._current
+
+    def _build(self, number: int) -> DatasetGeneration:
+        """Charge ``data_path`` et construit une génération complète."""
+        start = time.perf_counter()
+        source_sha256 = file_sha256(self.data_path)
+        dataset = load_dataset(self.data_path, self.snapshot_path)
+        if self.search_weights:
+            # Colonnes partagées ; les rechargements incrémentaux conservent les poids
+            dataset = replace(
+                dataset, search_index=dataset.search_index.weighted(self.search_weights)
+            )
+        return DatasetGeneration(
+            number=number,
+            dataset=dataset,
+            search_cache=LRUCache(self.cache_size, ttl=self.cache_ttl),
+            query_plans=LRUCache(self.cache_size, ttl=self.cache_ttl),
+            projections=Projections(dataset.repository),
+            source_sha256=source_sha256,
+            loaded_at=datetime.datetime.now(datetime.UTC),
+            modified_at=_modified_at(self.data_path),
+            load_duration=time.perf_counter() - start,
+        )
+
+    def _patch(self, current: DatasetGeneration) -> DatasetGeneration:
+        """Charge ``data_path`` et dérive la génération suivante de ``current``."""
+        start = time.perf_counter()
+        source_sha256 = file_sha256(self.data_path)
+        dataset, diff = current.dataset.patched(load_rfe_data(self.data_path))
+        if dataset is current.dataset:
+            search_cache = current.search_cache
+            query_plans = current.query_plans
+            projections = current.projections
+        else:
+            search_cache = LRUCache(self.cache_size, ttl=self.cache_ttl)
+            # Plans résolus sur les bitsets de l'ancienne génération : non repris
+            query_plans = LRUCache(self.cache_size, ttl=self.cache_ttl)
+            projections = Projections(dataset.repository)
+            carry_over_search_cache(
+                current.search_cache,
+                search_cache,
+                current.search_index,
+                dataset.search_index,
+                diff,
+            )
+        return DatasetGeneration(
+            number=current.number + 1,
+            dataset=dataset,
+            search_cache=search_cache,
+            query_plans=query_plans,
+            projections=projections,
+            source_sha256=source_sha256,
+            loaded_at=datetime.datetime.now(datetime.UTC),
+            modified_at=_modified_at(self.data_path),
+            load_duration=time.perf_counter() - start,
+            diff=diff,
+        )
+
+    def reload(self, force: bool = False) -> DatasetGeneration:
+        """Recharge ``data_path`` et bascule sur la nouvelle génération.
+
+        En cas d'erreur (JSON invalide, validation Pydantic), la génération
+        courante reste servie et l'erreur est conservée dans ``last_error``.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Recharger même si le contenu du fichier n'a pas changé.
+
+        Returns
+        -------
+        DatasetGeneration
+            La génération servie après l'appel (nouvelle ou inchangée).
+
+        Raises
+        ------
+        Exception
+            L'erreur de chargement, après l'avoir enregistrée dans ``last_error``.
+        """
+        with self._reload_lock:
+            current = self._current
+            if not force and file_sha256(self.data_path) == current.source_sha256:
+                return current
+            try:
+                generation = self._patch(current)
+            except Exception as e:
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.exception("Rechargement de %s refusé", self.data_path)
+                raise
+            self.last_error = None
+            # Bascule atomique : une seule affectation de référence
+            self._current = generation
+            logger.info(
+                "Génération %d chargée en %.0f ms (%s)",
+                generation.number,
+                generation.load_duration * 1000,
+                generation.diff.summary(),
+            )
+            return generation
+
+
+def _modified_at(path: Path) -> datetime.datetime:
+    """Date de modification d'un fichier (UTC)."""
+    return datetime.datetime.fromtimestamp(path.stat().st_mtime, datetime.UTC)
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+async def watch_data_file(manager: DatasetManager, interval: float) -> None:
+    """Surveille ``manager.data_path`` et recharge à chaque modification.
+
+    Interrogation périodique (date et taille du fichier) : pas de dépendance
+    à un mécanisme de notification du système. Le rechargement s'exécute
+    dans un thread pour ne pas bloquer la boucle d'événements.
+
+    Parameters
+    ----------
+    manager : DatasetManager
+        Gestionnaire à recharger.
+    interval : float
+        Période d'interrogation, en secondes.
+    """
+    signature = _file_signature(manager.data_path)
+    while True:
+        await asyncio.sleep(interval)
+        nouvelle = _file_signature(manager.data_path)
+        if nouvelle is None or nouvelle == signature:
+            continue
+        signature = nouvelle
+        try:
+            await asyncio.to_thread(manager.reload)
+        except Exception:  # déjà journalisé, la génération courante reste servie
+            continue
@@ -0,0 +1,145 @@
+"""Couche d'accès aux données RFE — index de consultation par identifiant."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.data.diff import RFEDiff
+    from app.data.models import Intervention, RFEData, Specialite
+
+
+@dataclass(frozen=True)
+class RFERepository:
+    """Accès en O(1) aux interventions et spécialités d'un jeu de données RFE.
+
+    Construit une seule fois par jeu de données (``from_data``, appelé par
+    ``Dataset.from_data``) puis partagé en lecture seule entre toutes les
+    requêtes.
+
+    Attributes
+    ----------
+    data : RFEData
+        Données RFE validées d'origine.
+    interventions : tuple[Intervention, ...]
+        Toutes les interventions, à plat, dans l'ordre du fichier.
+    ids_tries : tuple[str, ...]
+        Identifiants d'intervention distincts, triés : ordre stable de la
+        pagination par curseur (voir ``app.data.pagination``), indépendant
+        de la place des interventions dans le fichier.
+    """
+
+    data: RFEData
+    interventions: tuple[Intervention, ...]
+    ids_tries: tuple[str, ...]
+    _interventions_par_id: dict[str, Intervention]
+    _specialites_par_id: dict[str, Specialite]
+    _specialites_par_nom: dict[str, Specialite]
+    _specialite_par_intervention: dict[str, Specialite]
+
+    @classmethod
+    def from_data(cls, data: RFEData) -> RFERepository:
+        """Construit les tables de correspondance à partir des données RFE.
+
+        Parameters
+        ----------
+        data : RFEData
+            Données RFE chargées en mémoire.
+
+        Returns
+        -------
+        RFERepository
+            Dépôt indexé par identifiant.
+        """
+        interventions: list[Intervention] = []
+        interventions_par_id: dict[str, Intervention] = {}
+        specialite_par_intervention: dict[str, Specialite] = {}
+        for specialite in data.specialites:
+            for intervention in specialite.interventions:
+                interventions.append(intervention)
+                # En cas d'ID dupliqué, la première occurrence l'emporte (comme un scan)
+                interventions_par_id.setdefault(intervention.id, intervention)
+                specialite_par_intervention.setdefault(intervention.id, specialite)
+        return cls(
+            data=data,
+            interventions=tuple(interventions),
+            ids_tries=tuple(sorted(interventions_par_id)),
+            _interventions_par_id=interventions_par_id,
+            _specialites_par_id={s.id: s for s in reversed(data.specialites)},
+            _specialites_par_nom={s.nom: s for s in reversed(data.specialites)},
+            _specialite_par_intervention=specialite_par_intervention,
+        )
+
+    def patched(self, data: RFEData, diff: RFEDiff) -> RFERepository:
+        """Met à jour les tables pour ``data`` sans reparcourir les spécialités inchangées.
+
+        ``data`` doit partager les objets inchangés de ``self.data`` (voir
+        ``app.data.diff.share_unchanged``) : seules les spécialités qui ne
+        sont pas reprises telles quelles sont réindexées. En présence
+        d'identifiants dupliqués, les tables sont reconstruites.
+
+        Parameters
+        ----------
+        data : RFEData
+            Nouvelle génération de données.
+        diff : RFEDiff
+            Différence entre ``self.data`` et ``data``.
+
+        Returns
+        -------
+        RFERepository
+            Dépôt équivalent à ``RFERepository.from_data(data)``.
+        """
+        interventions = tuple(i for s in data.specialites for i in s.interventions)
+        if len(self._interventions_par_id) != len(self.interventions):
+            return RFERepository.from_data(data)
+
+        interventions_par_id = dict(self._interventions_par_id)
+        specialite_par_intervention = dict(self._specialite_par_intervention)
+        for intervention_id in diff.removed_interventions:
+            del interventions_par_id[intervention_id]
+            del specialite_par_intervention[intervention_id]
+        partagees = {id(s) for s in self.data.specialites}
+        for specialite in data.specialites:
+            if id(specialite) in partagees:
+                continue
+            for intervention in specialite.interventions:
+                interventions_par_id[intervention.id] = intervention
+                specialite_par_intervention[intervention.id] = specialite
+        if len(interventions_par_id) != len(interventions):
+            return RFERepository.from_data(data)
+        supprimes = set(diff.removed_interventions)
+        # Liste presque triée : le tri par fusion de Python est alors quasi linéaire
+        ids_tries = [i for i in self.ids_tries if i not in supprimes]
+        ids_tries.extend(diff.added_interventions)
+        return RFERepository(
+            data=data,
+            interventions=interventions,
+            ids_tries=tuple(sorted(ids_tries)),
+            _interventions_par_id=interventions_par_id,
+            _specialites_par_id={s.id: s for s in reversed(data.specialites)},
+            _specialites_par_nom={s.nom: s for s in reversed(data.specialites)},
+            _specialite_par_intervention=specialite_par_intervention,
+        )
+
+    @property
+    def specialites(self) -> list[Specialite]:
+        """Spécialités, dans l'ordre du fichier."""
+        return self.data.specialites
+
+    def get_intervention(self, intervention_id: str) -> Intervention | None:
+        """Retourne l'intervention d'identifiant donné, ou None."""
+        return self._interventions_par_id.get(intervention_id)
+
+    def get_specialite(self, specialite_id: str) -> Specialite | None:
+        """Retourne la spécialité d'identifiant donné, ou None."""
+        return self._specialites_par_id.get(specialite_id)
+
+    def get_specialite_par_nom(self, nom: str) -> Specialite | None:
+        """Retourne la spécialité de nom donné (``Intervention.specialite``), ou None."""
+        return self._specialites_par_nom.get(nom)
+
+    def specialite_de(self, intervention_id: str) -> Specialite | None:
+        """Retourne la spécialité qui contient l'intervention donnée, ou None."""
+        return self._specialite_par_intervention.get(intervention_id)
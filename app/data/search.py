@@ -1,24 +1,63 @@
 """Recherche fuzzy des interventions chirurgicales.
 
 Utilise rapidfuzz pour le matching approximatif sur les noms d'interventions
-et les spécialités.
+et les spécialités. Sur un grand corpus, un index BM25 présélectionne les
+candidats à rescorer (voir ``app.data.bm25``).
 """
 
 from __future__ import annotations
 
+import dataclasses
+import heapq
+from array import array
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
-from app.utils.text import strip_accents
+from app.data.bm25 import BM25Index
+from app.data.filters import FACET_FIELDS, bit_positions, positions_bitset
+from app.data.loader import compute_fingerprint
+from app.data.ngram import NGramIndex
+from app.data.query import QueryPlan, compile_query, is_structured
+from app.utils.text import find_occurrences, strip_accents, strip_accents_with_offsets
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from app.data.cache import LRUCache
+    from app.data.diff import RFEDiff
+    from app.data.filters import FilterIndex
     from app.data.models import Intervention, RFEData
 
 # Seuil minimal de score pour retenir un résultat (sur 100)
 _SCORE_MIN = 75
 
+# En dessous de cette longueur, la requête est cherchée comme sous-chaîne exacte
+_LONGUEUR_FUZZY_MIN = 4
+
+# Champs indexés ; « nom » est le texte nom + spécialité (``SearchIndex.choices``)
+SEARCH_FIELDS = ("nom", "sous_categorie", "source_tableau", "notes", "protocole")
+
+# Poids par défaut : score d'un champ = score partial_ratio × poids (0 désactive le champ)
+DEFAULT_WEIGHTS = {
+    "nom": 1.0,
+    "sous_categorie": 0.9,
+    "source_tableau": 0.8,
+    "notes": 0.8,
+    "protocole": 0.7,
+}
+
+# Tolérance d'arrondi sur le score minimal requis pour entrer dans le top-k
+_EPSILON = 1e-9
+
+# À partir de ce nombre d'interventions, BM25 présélectionne les candidats du fuzzy
+_BM25_DOCUMENTS_MIN = 5_000
+
+# Candidats BM25 rescorés en fuzzy pour un top-k (au moins ``limit``)
+_PROFONDEUR_RERANK = 200
+
 
 @dataclass
 class SearchResult:
@@ -30,64 +69,409 @@ class SearchResult:
         L'intervention correspondante.
     score : float
         Score de similarité entre 0 et 100 (100 = correspondance exacte).
+    position : int | None
+        Position de l'intervention dans le ``SearchIndex`` qui l'a trouvée
+        (accès aux données pré-calculées, ex. ``highlight_map``).
+    spans : tuple[tuple[int, int], ...]
+        Zones du nom normalisé ayant correspondu à la requête
+        (``(début, fin)``, à reporter via ``highlight_map``).
+    field : str
+        Champ ayant donné le score (``SEARCH_FIELDS``).
     """
 
     intervention: Intervention
     score: float
+    position: int | None = None
+    spans: tuple[tuple[int, int], ...] = ()
+    field: str = "nom"
 
 
-def _build_search_index(data: RFEData) -> list[tuple[str, Intervention]]:
-    """Construit l'index de recherche à partir des données RFE.
+@dataclass
+class FacetedResults:
+    """Résultats d'une recherche à facettes.
 
-    Parameters
+    Attributes
     ----------
-    data : RFEData
-        Données RFE chargées en mémoire.
+    results : list[SearchResult]
+        Meilleurs résultats retenus par les critères, par score décroissant.
+    total : int
+        Nombre total de correspondances retenues par les critères.
+    facets : dict[str, dict[str | int, int]]
+        Nombre de correspondances par valeur de chaque facette
+        (voir ``FilterIndex.facets``).
+    """
 
-    Returns
-    -------
-    list[tuple[str, Intervention]]
-        Liste de tuples (texte indexé, intervention).
+    results: list[SearchResult]
+    total: int
+    facets: dict[str, dict[str | int, int]]
+
+
+def _textes_champs(intervention: Intervention) -> dict[str, str | None]:
+    """Textes bruts des champs secondaires (hors « nom ») d'une intervention."""
+    protocoles = [intervention.protocole, *(intervention.alternative_allergie or ())]
+    posologies = [
+        " ".join(filter(None, (p.molecule.value, p.dose_initiale, p.reinjection)))
+        for p in protocoles
+        if p is not None
+    ]
+    return {
+        "sous_categorie": intervention.sous_categorie,
+        "source_tableau": intervention.source_tableau,
+        "notes": intervention.notes,
+        "protocole": " ; ".join(posologies) or None,
+    }
+
+
+def _ordonner(weights: Mapping[str, float]) -> tuple[tuple[str, float], ...]:
+    """Champs actifs par poids décroissant (ordre de ``SEARCH_FIELDS`` à poids égal)."""
+    inconnus = set(weights) - set(SEARCH_FIELDS)
+    if inconnus:
+        msg = f"Champs de recherche inconnus : {', '.join(sorted(inconnus))}."
+        raise ValueError(msg)
+    if any(w < 0 for w in weights.values()):
+        raise ValueError("Les poids de recherche doivent être positifs ou nuls.")
+    actifs = [(field, weights[field]) for field in SEARCH_FIELDS if weights.get(field, 0) > 0]
+    return tuple(sorted(actifs, key=lambda item: -item[1]))
+
+
+@dataclass(frozen=True)
+class SearchColumn:
+    """Colonne d'un champ indexé : textes normalisés distincts et leurs interventions.
+
+    Beaucoup d'interventions partagent la même sous-catégorie, le même
+    tableau ou la même note : chaque texte distinct n'est scoré qu'une fois.
+
+    Attributes
+    ----------
+    values : tuple[str, ...]
+        Textes normalisés (``strip_accents``) distincts.
+    rows : tuple[tuple[int, ...], ...]
+        Positions des interventions de chaque texte, alignées sur ``values``.
+    inverse : array
+        Indice dans ``values`` du texte de chaque position (``array('i')``,
+        -1 si le champ est vide).
     """
-    index = []
-    for specialite in data.specialites:
-        for intervention in specialite.interventions:
-            # Indexer sur nom + spécialité, normalisé sans accents pour le matching
-            texte = strip_accents(f"{intervention.nom} {intervention.specialite}")
-            index.append((texte, intervention))
-    return index
+
+    values: tuple[str, ...]
+    rows: tuple[tuple[int, ...], ...]
+    inverse: array
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str | None]) -> SearchColumn:
+        """Construit la colonne à partir des textes bruts, un par position."""
+        normalises: dict[str, str] = {}
+        indices: dict[str, int] = {}
+        rows: list[list[int]] = []
+        inverse = array("i")
+        for position, text in enumerate(texts):
+            if not text:
+                inverse.append(-1)
+                continue
+            norm = normalises.get(text)
+            if norm is None:
+                norm = normalises[text] = strip_accents(text)
+            u = indices.get(norm)
+            if u is None:
+                u = indices[norm] = len(rows)
+                rows.append([])
+            rows[u].append(position)
+            inverse.append(u)
+        return cls(values=tuple(indices), rows=tuple(map(tuple, rows)), inverse=inverse)
+
+
+def _columns(interventions: Sequence[Intervention]) -> dict[str, SearchColumn]:
+    """Colonnes des champs secondaires, alignées sur ``interventions``."""
+    textes = [_textes_champs(intervention) for intervention in interventions]
+    return {
+        field: SearchColumn.from_texts(t[field] for t in textes) for field in SEARCH_FIELDS[1:]
+    }
+
+
+def _bm25(choices: tuple[str, ...], columns: dict[str, SearchColumn]) -> BM25Index | None:
+    """Index BM25 des textes de tous les champs, si le corpus justifie une présélection."""
+    if len(choices) < _BM25_DOCUMENTS_MIN:
+        return None
+    textes = [
+        " ".join(
+            [texte]
+            + [column.values[u] for column in columns.values() if (u := column.inverse[i]) >= 0]
+        )
+        for i, texte in enumerate(choices)
+    ]
+    return BM25Index(tuple(textes))
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    """Index de recherche pré-calculé, construit une fois par jeu de données.
+
+    Les textes indexés sont déjà normalisés (``strip_accents``) : ils peuvent
+    être passés tels quels à rapidfuzz avec ``processor=None``.
+
+    Attributes
+    ----------
+    choices : tuple[str, ...]
+        Textes indexés normalisés (nom + spécialité), un par intervention.
+    interventions : tuple[Intervention, ...]
+        Interventions, alignées sur ``choices``.
+    ngrams : NGramIndex
+        Index inversé de n-grammes sur ``choices`` (requêtes courtes).
+    noms : tuple[str, ...]
+        Noms d'intervention normalisés, alignés sur ``choices``.
+    noms_offsets : tuple[array, ...]
+        Tables position normalisée → position dans le nom d'origine
+        (``array('H')``), pour le surlignage.
+    columns : dict[str, SearchColumn]
+        Colonnes des champs secondaires (``SEARCH_FIELDS`` hors « nom »).
+    bm25 : BM25Index | None
+        Index BM25 de tous les champs, présélection des grands corpus
+        (None en dessous de ``_BM25_DOCUMENTS_MIN`` interventions).
+    version : str
+        Empreinte des données indexées (clé de version des caches).
+    weights : tuple[tuple[str, float], ...]
+        Champs scorés et leur poids, par poids décroissant (voir ``weighted``).
+    """
+
+    choices: tuple[str, ...]
+    interventions: tuple[Intervention, ...]
+    ngrams: NGramIndex
+    noms: tuple[str, ...]
+    noms_offsets: tuple[array, ...]
+    columns: dict[str, SearchColumn]
+    bm25: BM25Index | None
+    version: str
+    weights: tuple[tuple[str, float], ...] = _ordonner(DEFAULT_WEIGHTS)
+
+    @classmethod
+    def from_data(cls, data: RFEData) -> SearchIndex:
+        """Construit l'index de recherche à partir des données RFE.
+
+        Parameters
+        ----------
+        data : RFEData
+            Données RFE chargées en mémoire.
+
+        Returns
+        -------
+        SearchIndex
+            Index prêt à l'emploi.
+        """
+        choices: list[str] = []
+        interventions: list[Intervention] = []
+        noms: list[str] = []
+        noms_offsets: list[array] = []
+        for specialite in data.specialites:
+            for intervention in specialite.interventions:
+                # Indexer sur nom + spécialité, normalisé sans accents pour le matching
+                choices.append(strip_accents(f"{intervention.nom} {intervention.specialite}"))
+                interventions.append(intervention)
+                nom, offsets = strip_accents_with_offsets(intervention.nom)
+                noms.append(nom)
+                noms_offsets.append(offsets)
+        choices_t = tuple(choices)
+        columns = _columns(interventions)
+        return cls(
+            choices=choices_t,
+            interventions=tuple(interventions),
+            ngrams=NGramIndex(choices_t),
+            noms=tuple(noms),
+            noms_offsets=tuple(noms_offsets),
+            columns=columns,
+            bm25=_bm25(choices_t, columns),
+            version=compute_fingerprint(data),
+        )
+
+    def patched(self, data: RFEData, diff: RFEDiff) -> SearchIndex:
+        """Construit l'index de ``data`` en réutilisant les entrées inchangées.
+
+        Seules les interventions ajoutées, ou modifiées dans leur nom ou leur
+        spécialité, sont normalisées et ré-indexées ; les autres reprennent
+        leurs textes, tables de surlignage et n-grammes de cet index.
+
+        Parameters
+        ----------
+        data : RFEData
+            Nouvelle génération de données.
+        diff : RFEDiff
+            Différence entre les données de cet index et ``data``.
+
+        Returns
+        -------
+        SearchIndex
+            Index équivalent à ``SearchIndex.from_data(data)``.
+        """
+        positions: dict[str, int] = {}
+        for position, intervention in enumerate(self.interventions):
+            positions.setdefault(intervention.id, position)
+        added = set(diff.added_interventions)
+
+        choices: list[str] = []
+        interventions: list[Intervention] = []
+        noms: list[str] = []
+        noms_offsets: list[array] = []
+        anciens: list[int | None] = []
+        for specialite in data.specialites:
+            for intervention in specialite.interventions:
+                ancien = None if intervention.id in added else positions.pop(intervention.id, None)
+                if ancien is not None:
+                    avant = self.interventions[ancien]
+                    if (
+                        avant.nom != intervention.nom
+                        or avant.specialite != intervention.specialite
+                    ):
+                        ancien = None
+                if ancien is None:
+                    choices.append(strip_accents(f"{intervention.nom} {intervention.specialite}"))
+                    nom, offsets = strip_accents_with_offsets(intervention.nom)
+                else:
+                    choices.append(self.choices[ancien])
+                    nom, offsets = self.noms[ancien], self.noms_offsets[ancien]
+                interventions.append(intervention)
+                noms.append(nom)
+                noms_offsets.append(offsets)
+                anciens.append(ancien)
+        choices_t = tuple(choices)
+        # Peu de textes distincts par champ : colonnes reconstruites (O(n))
+        columns = _columns(interventions)
+        return SearchIndex(
+            choices=choices_t,
+            interventions=tuple(interventions),
+            ngrams=self.ngrams.patched(choices_t, anciens),
+            noms=tuple(noms),
+            noms_offsets=tuple(noms_offsets),
+            columns=columns,
+            # Les idf dépendent de tout le corpus : index BM25 reconstruit
+            bm25=_bm25(choices_t, columns),
+            version=compute_fingerprint(data),
+            weights=self.weights,
+        )
+
+    def weighted(self, weights: Mapping[str, float]) -> SearchIndex:
+        """Copie de l'index avec d'autres poids de champs (colonnes partagées).
+
+        Parameters
+        ----------
+        weights : Mapping[str, float]
+            Poids par champ de ``SEARCH_FIELDS`` ; les champs absents gardent
+            leur poids de ``DEFAULT_WEIGHTS``, un poids nul désactive le champ.
+
+        Returns
+        -------
+        SearchIndex
+            Index pondéré.
+
+        Raises
+        ------
+        ValueError
+            Si un champ est inconnu ou un poids négatif.
+        """
+        return dataclasses.replace(self, weights=_ordonner({**DEFAULT_WEIGHTS, **weights}))
+
+    def __len__(self) -> int:
+        return len(self.choices)
+
+    def highlight_map(self, position: int | None) -> tuple[str | None, array | None]:
+        """Retourne le nom normalisé et sa table de correspondance pour le surlignage.
+
+        Parameters
+        ----------
+        position : int | None
+            Position de l'intervention (``SearchResult.position``).
+
+        Returns
+        -------
+        tuple[str | None, array | None]
+            ``(nom normalisé, table)``, ou ``(None, None)`` si la position est inconnue.
+        """
+        if position is None:
+            return None, None
+        return self.noms[position], self.noms_offsets[position]
+
+    def match_spans(self, position: int, query: str) -> tuple[tuple[int, int], ...]:
+        """Zones du nom normalisé correspondant à la requête.
+
+        Les occurrences exactes sont toutes retournées ; à défaut, pour une
+        requête fuzzy, l'alignement de ``fuzz.partial_ratio`` (le scorer de
+        la recherche) est étendu aux limites de mots. Seule la partie
+        « nom » du texte indexé est retenue.
+
+        Parameters
+        ----------
+        position : int
+            Position de l'intervention dans l'index.
+        query : str
+            Requête normalisée (``strip_accents``).
+
+        Returns
+        -------
+        tuple[tuple[int, int], ...]
+            Zones ``(début, fin)`` dans ``noms[position]``, éventuellement vide.
+        """
+        nom = self.noms[position]
+        spans = find_occurrences(nom, query)
+        if spans or len(query) < _LONGUEUR_FUZZY_MIN:
+            return spans
+        alignment = fuzz.partial_ratio_alignment(
+            query, self.choices[position], processor=None, score_cutoff=_SCORE_MIN
+        )
+        if alignment is None or alignment.dest_start >= len(nom):
+            return ()
+        start, end = alignment.dest_start, min(alignment.dest_end, len(nom))
+        while start > 0 and nom[start - 1].isalnum():
+            start -= 1
+        while end < len(nom) and nom[end].isalnum():
+            end += 1
+        return ((start, end),)
+
+    def result(self, position: int, score: float, query: str, field: str = "nom") -> SearchResult:
+        """Construit le SearchResult de la position donnée, zones de correspondance comprises.
+
+        Les zones ne sont cherchées dans le nom que si c'est lui qui a correspondu.
+        """
+        return SearchResult(
+            intervention=self.interventions[position],
+            score=score,
+            position=position,
+            spans=self.match_spans(position, query) if field == "nom" else (),
+            field=field,
+        )
 
 
 def search_interventions(
     query: str,
-    data: RFEData,
+    index: SearchIndex | RFEData,
     limit: int = 10,
 ) -> list[SearchResult]:
     """Recherche des interventions par correspondance fuzzy.
 
-    Effectue une recherche approximative sur le nom de l'intervention
-    et la spécialité chirurgicale. Les résultats sont triés par score
-    décroissant.
+    Effectue une recherche approximative sur le nom de l'intervention et
+    la spécialité chirurgicale, puis sur les champs secondaires pondérés
+    (sous-catégorie, tableau, notes, posologie ; voir ``_score_fields``).
+    Les résultats sont triés par score décroissant. Sur un grand corpus,
+    seuls les ``_PROFONDEUR_RERANK`` meilleurs candidats BM25 sont scorés.
 
     Parameters
     ----------
     query : str
         Texte de recherche (nom d'intervention, spécialité, etc.).
         Si vide ou composé uniquement d'espaces, retourne une liste vide.
-    data : RFEData
-        Données RFE chargées en mémoire.
+    index : SearchIndex | RFEData
+        Index pré-calculé (chemin nominal, partagé par génération de données).
+        Des données brutes sont acceptées pour les appels ponctuels
+        (scripts, tests) : l'index est alors construit à la volée.
     limit : int, optional
         Nombre maximum de résultats retournés (défaut : 10).
 
     Returns
     -------
     list[SearchResult]
-        Liste de résultats triés par score décroissant (0–100).
-        Retourne une liste vide si la requête est vide ou sans correspondance.
+        Liste de résultats triés par score décroissant (0–100), avec le
+        champ ayant correspondu. Retourne une liste vide si la requête est
+        vide ou sans correspondance.
 
     Examples
     --------
-    >>> results = search_interventions("hanche", data)
+    >>> results = search_interventions("hanche", index)
     >>> results[0].intervention.nom
     'Prothèse de hanche'
     >>> results[0].score
@@ -97,33 +481,391 @@ def search_interventions(
     if not query:
         return []
 
-    index = _build_search_index(data)
+    if not isinstance(index, SearchIndex):
+        index = SearchIndex.from_data(index)
     if not index:
         return []
 
     # Pour les requêtes courtes (< 4 chars) : sous-chaîne exacte
-    if len(query) < 4:
-        results = []
-        for texte, intervention in index:
-            if query in texte:
-                results.append(SearchResult(intervention=intervention, score=100.0))
-        return results[:limit]
-
-    # Pour les requêtes plus longues : fuzzy matching
-    textes = [texte for texte, _ in index]
-    matches = process.extract(
-        query,
-        textes,
-        scorer=fuzz.partial_ratio,
-        limit=limit,
-        score_cutoff=_SCORE_MIN,
-    )
+    if len(query) < _LONGUEUR_FUZZY_MIN:
+        return _search_short(query, index, limit)
+
+    # Grand corpus : seuls les meilleurs candidats BM25 sont rescorés en fuzzy
+    positions = None
+    if index.bm25 is not None:
+        positions = sorted(index.bm25.rechercher(query, max(limit, _PROFONDEUR_RERANK)))
+
+    # Pour les requêtes plus longues : fuzzy matching par champ (textes déjà normalisés)
+    return [
+        index.result(position, score, query, field)
+        for score, position, field in _score_fields(query, index, limit, positions)
+    ]
+
+
+def _score_fields(
+    query: str,
+    index: SearchIndex,
+    limit: int | None,
+    positions: Sequence[int] | None = None,
+) -> list[tuple[float, int, str]]:
+    """Score pondéré de chaque intervention : meilleur score de ses champs.
+
+    Les champs sont parcourus par poids décroissant, chaque texte distinct
+    d'une colonne une seule fois. Dès que ``limit`` résultats sont connus,
+    un champ de poids ``w`` ne peut plus placer une intervention dans le
+    top-k que si ``100 × w`` atteint le k-ième score : sinon le parcours
+    s'arrête, et sinon rapidfuzz ne retient que les textes capables
+    d'atteindre ce score (``score_cutoff``).
+
+    Parameters
+    ----------
+    query : str
+        Requête normalisée, d'au moins ``_LONGUEUR_FUZZY_MIN`` caractères.
+    index : SearchIndex
+        Index pré-calculé (colonnes et poids).
+    limit : int | None
+        Nombre de résultats voulus (None : toutes les correspondances).
+    positions : Sequence[int] | None, optional
+        Positions croissantes des seules interventions à scorer.
+
+    Returns
+    -------
+    list[tuple[float, int, str]]
+        ``(score, position, champ)`` triés par score décroissant puis
+        position ; à score égal entre champs, le plus pondéré l'emporte.
+    """
+    admises = None if positions is None else set(positions)
+    best: dict[int, tuple[float, str]] = {}
+    for field, weight in index.weights:
+        cutoff = _SCORE_MIN
+        if limit is not None and len(best) >= limit:
+            kieme = heapq.nlargest(limit, (score for score, _ in best.values()))[-1]
+            if 100 * weight < kieme:
+                break  # champs suivants, moins pondérés : aucun ne peut entrer dans le top-k
+            cutoff = max(cutoff, kieme / weight - _EPSILON)
+        if field == "nom":
+            choices = (
+                index.choices if positions is None else {p: index.choices[p] for p in positions}
+            )
+        else:
+            column = index.columns[field]
+            if positions is None:
+                choices = column.values
+            else:
+                utiles = sorted({column.inverse[p] for p in positions} - {-1})
+                choices = {u: column.values[u] for u in utiles}
+        matches = process.extract(
+            query,
+            choices,
+            scorer=fuzz.partial_ratio,
+            processor=None,
+            limit=None,
+            score_cutoff=cutoff,
+        )
+        for _, raw, key in matches:
+            score = raw * weight
+            for position in (key,) if field == "nom" else column.rows[key]:
+                if admises is not None and position not in admises:
+                    continue
+                ancien = best.get(position)
+                if ancien is None or score > ancien[0]:
+                    best[position] = (score, field)
+    ranked = sorted(((score, p, field) for p, (score, field) in best.items()), key=_rang)
+    return ranked if limit is None else ranked[:limit]
+
 
-    results = []
-    for _match, score, idx in matches:
-        _, intervention = index[idx]
-        results.append(SearchResult(intervention=intervention, score=score))
+def _rang(item: tuple[float, int, str]) -> tuple[float, int]:
+    """Clé de tri des résultats : score décroissant, puis ordre de l'index."""
+    return -item[0], item[1]
 
-    results.sort(key=lambda r: r.score, reverse=True)
 
+def _search_short(query: str, index: SearchIndex, limit: int) -> list[SearchResult]:
+    """Requêtes courtes : sous-chaîne exacte via l'index n-gramme, débuts de mot en premier."""
+    return [index.result(doc, 100.0, query) for doc in index.ngrams.rechercher(query, limit)]
+
+
+def search_interventions_batch(
+    queries: Sequence[str],
+    index: SearchIndex,
+    limit: int = 10,
+    workers: int = -1,
+) -> list[list[SearchResult]]:
+    """Recherche plusieurs requêtes en un seul calcul vectorisé.
+
+    Les requêtes longues sont scorées ensemble contre chaque champ de
+    l'index par ``rapidfuzz.process.cdist`` (multi-thread) ; les requêtes courtes
+    passent par l'index n-gramme. Chaque liste de résultats est identique
+    à celle de ``search_interventions`` pour la même requête.
+
+    Parameters
+    ----------
+    queries : Sequence[str]
+        Textes de recherche.
+    index : SearchIndex
+        Index pré-calculé.
+    limit : int, optional
+        Nombre maximum de résultats par requête (défaut : 10).
+    workers : int, optional
+        Nombre de threads pour ``cdist`` (défaut : -1, tous les cœurs).
+
+    Returns
+    -------
+    list[list[SearchResult]]
+        Résultats triés par score décroissant, dans l'ordre des requêtes.
+    """
+    normalized = [strip_accents(q.strip()) for q in queries]
+    results: list[list[SearchResult]] = [[] for _ in normalized]
+    if not index:
+        return results
+
+    longues: list[int] = []
+    for i, query in enumerate(normalized):
+        if len(query) >= _LONGUEUR_FUZZY_MIN:
+            longues.append(i)
+        elif query:
+            results[i] = _search_short(query, index, limit)
+    if not longues:
+        return results
+    if index.bm25 is not None:
+        # Grand corpus : présélection BM25 par requête plutôt qu'une matrice requêtes × corpus
+        for i in longues:
+            results[i] = search_interventions(normalized[i], index, limit)
+        return results
+
+    requetes = [normalized[i] for i in longues]
+    scores = np.zeros((len(longues), len(index)))
+    champs = np.zeros((len(longues), len(index)), dtype=np.intp)
+    for k, (field, weight) in enumerate(index.weights):
+        column = None if field == "nom" else index.columns[field]
+        if column is not None and not column.values:
+            continue
+        # Chaque texte distinct est scoré une fois, puis reporté sur ses interventions
+        par_texte = process.cdist(
+            requetes,
+            index.choices if column is None else column.values,
+            scorer=fuzz.partial_ratio,
+            processor=None,
+            score_cutoff=_SCORE_MIN,
+            dtype=np.float64,
+            workers=workers,
+        )
+        if column is None:
+            champ = par_texte * weight
+        else:
+            inverse = np.frombuffer(column.inverse, dtype=np.intc)
+            champ = np.where(inverse >= 0, par_texte[:, inverse], 0.0) * weight
+        # Strictement meilleur : à égalité, le champ le plus pondéré (vu avant) l'emporte
+        meilleur = champ > scores
+        scores[meilleur] = champ[meilleur]
+        champs[meilleur] = k
+    for row, fields, i in zip(scores, champs, longues, strict=True):
+        # Tri stable : à score égal, l'ordre de l'index départage (comme _score_fields)
+        top = np.argsort(-row, kind="stable")[:limit]
+        results[i] = [
+            index.result(int(idx), float(row[idx]), normalized[i], index.weights[fields[idx]][0])
+            for idx in top
+            if row[idx] > 0
+        ]
     return results
+
+
+def search_interventions_cached(
+    query: str,
+    index: SearchIndex,
+    cache: LRUCache[tuple[str, int, str], tuple[SearchResult, ...]],
+    limit: int = 10,
+) -> list[SearchResult]:
+    """Recherche des interventions en passant par un cache LRU de résultats.
+
+    La clé ``(requête normalisée, limit, version de l'index)`` rend les
+    entrées d'un ancien jeu de données inatteignables dès que l'index change.
+
+    Parameters
+    ----------
+    query : str
+        Texte de recherche.
+    index : SearchIndex
+        Index pré-calculé.
+    cache : LRUCache
+        Cache partagé (voir ``DatasetGeneration.search_cache``).
+    limit : int, optional
+        Nombre maximum de résultats retournés (défaut : 10).
+
+    Returns
+    -------
+    list[SearchResult]
+        Mêmes résultats que ``search_interventions``.
+    """
+    key = (strip_accents(query.strip()), limit, index.version)
+    results = cache.get_or_compute(
+        key, lambda: tuple(search_interventions(query, index, limit=limit))
+    )
+    return list(results)
+
+
+def search_candidates(
+    query: str, index: SearchIndex, allowed: int | None = None
+) -> tuple[SearchResult, ...]:
+    """Toutes les correspondances d'une requête, par score décroissant.
+
+    Même scorer et même ordre que ``search_interventions``, sans limite de
+    nombre ; les zones de correspondance (``spans``) ne sont pas calculées.
+    Sur un grand corpus (index BM25), seuls les documents partageant un mot
+    avec la requête sont scorés.
+
+    Parameters
+    ----------
+    query : str
+        Requête normalisée (``strip_accents``).
+    index : SearchIndex
+        Index pré-calculé.
+    allowed : int | None, optional
+        Bitset des seules positions à scorer (voir ``QueryPlan``) ; sans
+        requête, toutes ces positions sont retenues (score 100, ordre de
+        l'index).
+
+    Returns
+    -------
+    tuple[SearchResult, ...]
+        Correspondances, ``position`` renseignée.
+    """
+    positions = None if allowed is None else bit_positions(allowed)
+    if not query:
+        return tuple(SearchResult(index.interventions[p], 100.0, p) for p in positions or ())
+    if len(query) < _LONGUEUR_FUZZY_MIN:
+        docs = index.ngrams.rechercher(query)
+        if positions is not None:
+            admises = set(positions)
+            docs = [doc for doc in docs if doc in admises]
+        return tuple(SearchResult(index.interventions[doc], 100.0, doc) for doc in docs)
+    if index.bm25 is not None:
+        # Grand corpus : seuls les documents partageant un mot avec la requête sont scorés
+        docs = index.bm25.rechercher(query)
+        positions = sorted(docs if positions is None else set(docs).intersection(positions))
+    return tuple(
+        SearchResult(index.interventions[p], score, p, field=field)
+        for score, p, field in _score_fields(query, index, None, positions)
+    )
+
+
+def search_interventions_faceted(
+    query: str,
+    index: SearchIndex,
+    filters: FilterIndex,
+    criteria: Mapping[str, Iterable[str | int]],
+    cache: LRUCache[tuple[str, int, str], tuple[SearchResult, ...]],
+    limit: int = 10,
+    facet_fields: Iterable[str] = FACET_FIELDS,
+    plans: LRUCache[tuple[str, str], QueryPlan] | None = None,
+) -> FacetedResults:
+    """Recherche fuzzy restreinte par critères, avec comptes par facette.
+
+    La requête suit la syntaxe de ``app.data.query`` (``molecule:…``,
+    ``-terme``…) : ses clauses se résolvent en bitset, et seul le texte
+    libre est scoré, sur les interventions admises. Les correspondances
+    forment un bitset, intersecté avec les index inversés de ``filters``
+    (mêmes positions que ``index``) : les comptes de facettes ne coûtent
+    que des ``&`` et des ``int.bit_count``. La liste complète des
+    correspondances est mise en cache (clé ``(requête, 0, version)``) :
+    changer de critères pour une même requête ne relance pas le scoring.
+
+    Parameters
+    ----------
+    query : str
+        Texte de recherche, éventuellement à champs qualifiés.
+    index : SearchIndex
+        Index pré-calculé.
+    filters : FilterIndex
+        Index inversés du même jeu de données (``Dataset.filters``).
+    criteria : Mapping[str, Iterable[str | int]]
+        Valeurs acceptées par critère (voir ``FilterIndex.select``).
+    cache : LRUCache
+        Cache partagé (voir ``DatasetGeneration.search_cache``).
+    limit : int, optional
+        Nombre maximum de résultats retournés (défaut : 10).
+    facet_fields : Iterable[str], optional
+        Facettes à compter (défaut : ``FACET_FIELDS`` ; vide pour aucune).
+    plans : LRUCache | None, optional
+        Cache des plans compilés par requête (voir
+        ``DatasetGeneration.query_plans``) ; sans cache, le plan est
+        compilé à chaque appel.
+
+    Returns
+    -------
+    FacetedResults
+        Résultats, total et comptes par facette.
+    """
+    query = strip_accents(query.strip())
+    plan = QueryPlan("", None)
+    candidates: tuple[SearchResult, ...] = ()
+    if query and index:
+        if plans is None:
+            plan = compile_query(query, index, filters)
+        else:
+            plan = plans.get_or_compute(
+                (query, index.version), lambda: compile_query(query, index, filters)
+            )
+        candidates = cache.get_or_compute(
+            (query, 0, index.version),
+            lambda: search_candidates(plan.text, index, plan.candidates),
+        )
+    retenues, facets = filters.facets(
+        positions_bitset(r.position for r in candidates), criteria, facet_fields
+    )
+    if criteria:
+        positions = set(bit_positions(retenues))
+        candidates = tuple(r for r in candidates if r.position in positions)
+    return FacetedResults(
+        results=[
+            index.result(r.position, r.score, plan.text, r.field) if plan.text else r
+            for r in candidates[:limit]
+        ],
+        total=retenues.bit_count(),
+        facets=facets,
+    )
+
+
+def carry_over_search_cache(
+    old_cache: LRUCache[tuple[str, int, str], tuple[SearchResult, ...]],
+    new_cache: LRUCache[tuple[str, int, str], tuple[SearchResult, ...]],
+    old_index: SearchIndex,
+    new_index: SearchIndex,
+    diff: RFEDiff,
+) -> int:
+    """Reprend dans ``new_cache`` les résultats encore valides de ``old_cache``.
+
+    Possible seulement si les textes indexés de tous les champs et leurs
+    poids sont identiques (mêmes résultats pour toute requête, listes de
+    correspondances des facettes comprises) : les entrées qui citent une intervention
+    modifiée sont écartées, les autres sont ré-étiquetées avec la version
+    du nouvel index. Les requêtes à champs qualifiés dépendent aussi des
+    index inversés : elles ne sont pas reprises.
+
+    Parameters
+    ----------
+    old_cache, new_cache : LRUCache
+        Caches de résultats de l'ancienne et de la nouvelle génération.
+    old_index, new_index : SearchIndex
+        Index des deux générations.
+    diff : RFEDiff
+        Différence entre les deux générations.
+
+    Returns
+    -------
+    int
+        Nombre d'entrées reprises.
+    """
+    if (
+        new_index.choices != old_index.choices
+        or new_index.columns != old_index.columns
+        or new_index.weights != old_index.weights
+    ):
+        return 0
+    modified = diff.changed_interventions
+    reprises = 0
+    for (query, limit, _), results in old_cache.items():
+        if is_structured(query) or any(r.intervention.id in modified for r in results):
+            continue
+        new_cache.put((query, limit, new_index.version), results)
+        reprises += 1
+    return reprises
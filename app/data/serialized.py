@@ -0,0 +1,136 @@
+"""Réponses JSON de l'API pré-encodées, une fois par génération de données.
+
+Les données servies sont immuables : plutôt que de re-sérialiser les mêmes
+modèles à chaque requête, chaque intervention et chaque spécialité est
+encodée une fois en octets (même encodeur Pydantic que FastAPI pour un
+``response_model``). Les listes sont assemblées à partir de ces morceaux.
+
+Les corps volumineux (liste et détail des spécialités) sont en outre
+compressés une fois en gzip et brotli (voir ``app.utils.compression``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter
+
+from app.data.models import Intervention, Specialite
+from app.utils.compression import Precompressed
+
+if TYPE_CHECKING:
+    from app.data.repository import RFERepository
+
+_INTERVENTION = TypeAdapter(Intervention)
+_SPECIALITE = TypeAdapter(Specialite)
+
+
+def _join(parts: tuple[bytes, ...] | list[bytes]) -> bytes:
+    """Tableau JSON à partir d'éléments déjà encodés."""
+    return b"[" + b",".join(parts) + b"]"
+
+
+@dataclass(frozen=True)
+class SerializedResponses:
+    """Corps JSON pré-encodés des endpoints spécialités et interventions.
+
+    Attributes
+    ----------
+    interventions : tuple[bytes, ...]
+        Intervention encodée, alignée sur ``RFERepository.interventions``.
+    specialites : tuple[Precompressed, ...]
+        Spécialité encodée (interventions comprises) et ses variantes
+        compressées, dans l'ordre du fichier.
+    specialites_list : Precompressed
+        Corps complet de ``GET /api/v1/specialites`` et ses variantes compressées.
+    """
+
+    interventions: tuple[bytes, ...]
+    specialites: tuple[Precompressed, ...]
+    specialites_list: Precompressed
+    _interventions_par_id: dict[str, bytes]
+    _specialites_par_id: dict[str, Precompressed]
+
+    @classmethod
+    def from_repository(
+        cls,
+        repository: RFERepository,
+        previous: tuple[RFERepository, SerializedResponses] | None = None,
+    ) -> SerializedResponses:
+        """Encode toutes les interventions et spécialités du dépôt.
+
+        Parameters
+        ----------
+        repository : RFERepository
+            Dépôt de la génération à servir.
+        previous : tuple[RFERepository, SerializedResponses] | None, optional
+            Dépôt et réponses de la génération précédente : les objets
+            partagés avec elle (voir ``app.data.diff.share_unchanged``)
+            reprennent leurs octets (et variantes compressées) au lieu
+            d'être ré-encodés.
+
+        Returns
+        -------
+        SerializedResponses
+            Corps JSON prêts à servir.
+        """
+        deja_encodes: dict[int, bytes] = {}
+        deja_compresses: dict[int, Precompressed] = {}
+        if previous is not None:
+            ancien_repository, anciennes = previous
+            deja_encodes.update(
+                zip(map(id, ancien_repository.interventions), anciennes.interventions, strict=True)
+            )
+            deja_compresses.update(
+                zip(map(id, ancien_repository.specialites), anciennes.specialites, strict=True)
+            )
+
+        def encode(intervention: Intervention) -> bytes:
+            encoded = deja_encodes.get(id(intervention))
+            return encoded if encoded is not None else _INTERVENTION.dump_json(intervention)
+
+        def compress(specialite: Specialite) -> Precompressed:
+            compressed = deja_compresses.get(id(specialite))
+            if compressed is None:
+                compressed = Precompressed.build(_SPECIALITE.dump_json(specialite))
+            return compressed
+
+        interventions = tuple(map(encode, repository.interventions))
+        specialites = tuple(map(compress, repository.specialites))
+        interventions_par_id: dict[str, bytes] = {}
+        for intervention, encoded in zip(repository.interventions, interventions, strict=True):
+            # En cas d'ID dupliqué, la première occurrence l'emporte (comme le dépôt)
+            interventions_par_id.setdefault(intervention.id, encoded)
+        return cls(
+            interventions=interventions,
+            specialites=specialites,
+            specialites_list=Precompressed.build(_join([s.identity for s in specialites])),
+            _interventions_par_id=interventions_par_id,
+            _specialites_par_id={
+                s.id: encoded
+                for s, encoded in reversed(
+                    list(zip(repository.specialites, specialites, strict=True))
+                )
+            },
+        )
+
+    def interventions_page(self, skip: int, limit: int) -> bytes:
+        """Corps de ``GET /api/v1/interventions?skip=&limit=``."""
+        return _join(self.interventions[skip : skip + limit])
+
+    def interventions_at(self, positions: list[int]) -> bytes:
+        """Tableau JSON des interventions aux positions données (ordre du dépôt)."""
+        return _join([self.interventions[i] for i in positions])
+
+    def interventions_list(self, intervention_ids: tuple[str, ...]) -> bytes:
+        """Tableau JSON des interventions d'identifiants donnés (tous connus)."""
+        return _join([self._interventions_par_id[i] for i in intervention_ids])
+
+    def intervention(self, intervention_id: str) -> bytes | None:
+        """Corps de ``GET /api/v1/interventions/{id}``, ou None si inconnue."""
+        return self._interventions_par_id.get(intervention_id)
+
+    def specialite(self, specialite_id: str) -> Precompressed | None:
+        """Corps de ``GET /api/v1/specialites/{id}``, ou None si inconnue."""
+        return self._specialites_par_id.get(specialite_id)
@@ -0,0 +1,107 @@
+"""Instantané binaire du jeu de données validé, pour un démarrage rapide.
+
+Le fichier contient un en-tête (format, empreinte de ``rfe.json``, empreinte
+du code des structures) suivi du ``Dataset`` sérialisé par pickle :
+données validées et index pré-calculés. Il est produit au build par
+``scripts/build_snapshot.py`` et n'est utilisé que si les deux empreintes
+correspondent ; sinon le chargement complet (JSON + Pydantic) s'applique.
+
+Le format pickle n'est sûr que pour des fichiers produits localement :
+l'instantané est un artefact de build, jamais un fichier reçu de l'extérieur.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.data.dataset import Dataset
+from app.data.loader import load_rfe_data
+
+if TYPE_CHECKING:
+    from typing import Any
+
+# À incrémenter si la structure de l'en-tête change
+SNAPSHOT_FORMAT = 1
+
+# Modules dont les classes sont sérialisées : toute modification invalide l'instantané
+_CODE_FILES = (
+    *sorted((Path(__file__).parent).glob("*.py")),
+    Path(__file__).parent.parent / "utils" / "text.py",
+    Path(__file__).parent.parent / "utils" / "compression.py",
+)
+
+
+def file_sha256(path: Path) -> str:
+    """Empreinte SHA-256 du contenu d'un fichier."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def code_fingerprint() -> str:
+    """Empreinte du code des structures sérialisées (``app/data`` et modules utilitaires)."""
+    h = hashlib.sha256()
+    for path in _CODE_FILES:
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _header(source: Path) -> dict[str, Any]:
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "source_sha256": file_sha256(source),
+        "code_sha256": code_fingerprint(),
+    }
+
+
+def write_snapshot(source: Path, target: Path) -> Dataset:
+    """Valide ``source`` et écrit l'instantané correspondant dans ``target``.
+
+    Parameters
+    ----------
+    source : Path
+        Chemin vers ``rfe.json``.
+    target : Path
+        Chemin de l'instantané à produire (écriture atomique).
+
+    Returns
+    -------
+    Dataset
+        Jeu de données sérialisé.
+    """
+    header = _header(source)
+    dataset = Dataset.from_data(load_rfe_data(source))
+    tmp = target.with_name(target.name + ".tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(dataset, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(target)
+    return dataset
+
+
+def read_snapshot(target: Path, source: Path) -> Dataset | None:
+    """Lit l'instantané s'il correspond à ``source`` et au code courant.
+
+    Parameters
+    ----------
+    target : Path
+        Chemin de l'instantané.
+    source : Path
+        Chemin vers ``rfe.json`` dont l'instantané doit être issu.
+
+    Returns
+    -------
+    Dataset | None
+        Le jeu de données, ou None si l'instantané est absent, périmé ou illisible.
+    """
+    if not target.exists():
+        return None
+    try:
+        with target.open("rb") as f:
+            if pickle.load(f) != _header(source):
+                return None
+            dataset = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    return dataset if isinstance(dataset, Dataset) else None
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from dataclasses import asdict
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from app.api import interventions_router, specialites_router
+from app.api.admin import router as admin_router
 from app.api.search import router as search_router
 from app.config import _PROJECT_ROOT, Settings
-from app.data.loader import load_rfe_data
+from app.data.reload import DatasetManager, watch_data_file
+from app.web.executor import BoundedExecutor
 from app.web.routes import router as web_router
+from app.web.static import PrecompressedStaticFiles
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -24,13 +28,43 @@ if TYPE_CHECKING:
 settings = Settings()
 
 
+def create_dataset_manager() -> DatasetManager:
+    """Charge les données RFE et construit les index selon la configuration."""
+    return DatasetManager(
+        settings.data_path,
+        settings.snapshot_path,
+        cache_size=settings.search_cache_size,
+        cache_ttl=settings.search_cache_ttl,
+        search_weights=settings.search_weights,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    """Charge les données RFE en mémoire au démarrage du serveur."""
-    rfe_data = load_rfe_data(settings.data_path)
-    app.state.rfe_data = rfe_data
+    """Charge les données RFE, construit les index et surveille rfe.json.
+
+    En mode pré-forké (``app.prefork``), le jeu de données chargé par le
+    processus maître est repris tel quel ; seul un rattrapage est fait si
+    ``rfe.json`` a changé depuis.
+    """
+    datasets = getattr(app.state, "preloaded_datasets", None)
+    if datasets is None:
+        datasets = create_dataset_manager()
+    elif settings.reload_poll_interval:
+        with suppress(Exception):  # erreur journalisée, génération héritée servie
+            await asyncio.to_thread(datasets.reload)
+    app.state.datasets = datasets
     app.state.settings = settings
+    app.state.search_executor = BoundedExecutor(settings.search_workers, settings.search_queue_max)
+    watcher = (
+        asyncio.create_task(watch_data_file(datasets, settings.reload_poll_interval))
+        if settings.reload_poll_interval
+        else None
+    )
     yield
+    if watcher is not None:
+        watcher.cancel()
+    app.state.search_executor.shutdown()
 
 
 app = FastAPI(
@@ -44,10 +78,15 @@ app = FastAPI(
 
 _templates = Jinja2Templates(directory=str(_PROJECT_ROOT / "app" / "templates"))
 
-app.mount("/static", StaticFiles(directory=str(_PROJECT_ROOT / "app" / "static")), name="static")
+app.mount(
+    "/static",
+    PrecompressedStaticFiles(directory=str(_PROJECT_ROOT / "app" / "static")),
+    name="static",
+)
 app.include_router(interventions_router)
 app.include_router(specialites_router)
 app.include_router(search_router)
+app.include_router(admin_router)
 app.include_router(web_router)
 
 
@@ -66,19 +105,24 @@ async def not_found_handler(request: Request, exc: Exception) -> HTMLResponse:
 
 
 def get_rfe_data() -> RFEData:
-    """Accès aux données RFE chargées en mémoire."""
-    return app.state.rfe_data
+    """Accès aux données RFE chargées en mémoire (génération courante)."""
+    return app.state.datasets.current.rfe_data
 
 
 @app.get("/api/v1/health")
 def health() -> dict:
     """Health check endpoint."""
-    rfe: RFEData = app.state.rfe_data
-    total_interventions = sum(len(s.interventions) for s in rfe.specialites)
+    datasets: DatasetManager = app.state.datasets
+    generation = datasets.current
     return {
         "status": "ok",
         "version": settings.app_version,
         "data_version": settings.data_version,
-        "specialites": len(rfe.specialites),
-        "interventions": total_interventions,
+        "specialites": len(generation.repository.specialites),
+        "interventions": len(generation.repository.interventions),
+        "generation": generation.number,
+        "loaded_at": generation.loaded_at.isoformat(),
+        "load_duration_ms": round(generation.load_duration * 1000, 1),
+        "last_reload_error": datasets.last_error,
+        "search_cache": asdict(generation.search_cache.stats()),
     }
@@ -0,0 +1,186 @@
+"""Serveur pré-forké : jeu de données chargé une fois, partagé par les workers.
+
+``uvicorn --workers N`` démarre chaque worker dans un interpréteur neuf
+(``spawn``) : chacun charge ``rfe.json`` et reconstruit ses index. Ici, le
+processus maître charge le jeu de données, gèle le ramasse-miettes
+(``gc.freeze``) puis se duplique (``fork``) : les workers héritent des pages
+mémoire en copie sur écriture. Le gel évite que les passes du ramasse-
+miettes, en écrivant dans les en-têtes des objets, ne recopient ces pages
+dans chaque worker.
+
+Ce partage ne dure que jusqu'au premier rechargement. Chaque worker
+surveille ``rfe.json`` de son côté et, à une modification (ou via l'endpoint
+d'administration), construit sa nouvelle génération dans sa propre
+mémoire : une fois l'ancienne génération libérée, plus rien n'est partagé
+et la mémoire totale redevient celle de N chargements indépendants, jusqu'au
+redémarrage du maître.
+
+Un worker qui s'arrête est remplacé ; s'il meurt peu après son démarrage,
+le délai avant le remplacement double à chaque échec consécutif (pas de
+boucle de redémarrage effrénée sur une erreur au démarrage).
+
+Usage :
+    uv run python -m app.prefork --workers 4 --port 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+import uvicorn
+
+from app.main import app, create_dataset_manager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Délai avant de remplacer un worker mort au démarrage : doublé à chaque échec
+# consécutif, plafonné, remis à zéro dès qu'un worker a vécu _VIE_MIN secondes
+_RESPAWN_DELAI_MIN = 0.5
+_RESPAWN_DELAI_MAX = 30.0
+_VIE_MIN = 10.0
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    """Ouvre la socket d'écoute partagée par tous les workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket, config: uvicorn.Config) -> None:
+    """Corps d'un worker (processus fils) : sert l'application sur la socket héritée."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    server = uvicorn.Server(config)
+    try:
+        server.run(sockets=[sock])
+    finally:
+        os._exit(0)
+
+
+def _fork_worker(sock: socket.socket, config: uvicorn.Config) -> int:
+    """Démarre un worker et retourne son PID."""
+    pid = os.fork()
+    if pid == 0:
+        _run_worker(sock, config)
+    return pid
+
+
+def serve(host: str, port: int, workers: int) -> None:
+    """Charge le jeu de données, puis sert l'application avec ``workers`` processus fils.
+
+    Un worker qui s'arrête de façon inattendue est remplacé (voir
+    ``_supervise``). SIGTERM ou SIGINT sur le maître arrête tous les workers.
+
+    Parameters
+    ----------
+    host : str
+        Adresse d'écoute.
+    port : int
+        Port d'écoute.
+    workers : int
+        Nombre de processus workers.
+    """
+    app.state.preloaded_datasets = create_dataset_manager()
+    # Objets chargés jusqu'ici : hors du ramasse-miettes, pages partagées intactes
+    gc.collect()
+    gc.freeze()
+
+    sock = _bind(host, port)
+    config = uvicorn.Config(app, lifespan="on", log_level="info")
+    pids = {_fork_worker(sock, config): time.monotonic() for _ in range(workers)}
+    logger.info("Maître %d : %d workers sur %s:%d", os.getpid(), workers, host, port)
+
+    stopping = threading.Event()
+
+    def stop(signum: int, _frame: object) -> None:
+        stopping.set()
+        for pid in list(pids):
+            with suppress(ProcessLookupError):  # worker déjà terminé
+                os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    _supervise(pids, lambda: _fork_worker(sock, config), stopping)
+    sock.close()
+
+
+def _supervise(
+    pids: dict[int, float], spawn: Callable[[], int], stopping: threading.Event
+) -> None:
+    """Attend la fin des workers et remplace chacun, jusqu'à l'arrêt demandé.
+
+    Un worker mort moins de ``_VIE_MIN`` secondes après son démarrage n'est
+    remplacé qu'après un délai, doublé à chaque échec consécutif
+    (``_RESPAWN_DELAI_MIN`` à ``_RESPAWN_DELAI_MAX``) ; un arrêt demandé
+    pendant ce délai l'interrompt.
+
+    Parameters
+    ----------
+    pids : dict[int, float]
+        PID des workers en cours → instant de démarrage (``time.monotonic``),
+        tenu à jour.
+    spawn : Callable[[], int]
+        Démarre un worker et retourne son PID.
+    stopping : threading.Event
+        Arrêt demandé : les workers qui se terminent ne sont plus remplacés.
+    """
+    delai = 0.0
+    while pids:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        debut = pids.pop(pid, None)
+        if debut is None or stopping.is_set():
+            continue
+        if time.monotonic() - debut < _VIE_MIN:
+            delai = min(max(2 * delai, _RESPAWN_DELAI_MIN), _RESPAWN_DELAI_MAX)
+        else:
+            delai = 0.0
+        logger.warning(
+            "Worker %d arrêté (statut %d), remplacement dans %.1f s", pid, status, delai
+        )
+        if stopping.wait(delai):
+            continue
+        pids[spawn()] = time.monotonic()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # Toutes les interfaces par défaut : serveur exposé (conteneur)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        help="Nombre de workers (défaut : $WEB_CONCURRENCY, sinon nombre de cœurs)",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:     %(message)s")
+    serve(args.host, args.port, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Corps de réponse pré-compressés (gzip, brotli) et négociation ``Accept-Encoding``.
+
+Les corps servis sont immuables pour une génération de données (ou pour la
+durée du processus, pour ``app/static``) : ils sont compressés une fois à
+leur construction, et chaque requête se contente de choisir la variante
+acceptée par le client. Aucune compression n'a lieu pendant le traitement
+d'une requête.
+
+brotli est une dépendance optionnelle (``uv sync --extra brotli``) : sans
+elle, seule la variante gzip est produite.
+"""
+
+from __future__ import annotations
+
+import gzip
+from dataclasses import dataclass
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dépend de l'environnement
+    brotli = None
+
+# En dessous de cette taille, le gain ne compense pas l'en-tête et le décodage
+MIN_SIZE = 1024
+
+# Préférence du serveur à qualité égale côté client
+_PREFERENCE = ("br", "gzip")
+
+
+def _parse_accept_encoding(accept_encoding: str) -> dict[str, float]:
+    """Codages et leur qualité (``q``), en minuscules (RFC 9110, section 12.5.3)."""
+    qualites: dict[str, float] = {}
+    for element in accept_encoding.split(","):
+        coding, _, params = element.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            nom, _, valeur = param.partition("=")
+            if nom.strip().lower() == "q":
+                try:
+                    q = float(valeur)
+                except ValueError:
+                    q = 0.0
+        qualites[coding] = q
+    return qualites
+
+
+def negotiate(accept_encoding: str | None, available: tuple[str, ...]) -> str:
+    """Choisit le codage de contenu à servir.
+
+    Parameters
+    ----------
+    accept_encoding : str | None
+        Valeur de l'en-tête ``Accept-Encoding`` (None si absent).
+    available : tuple[str, ...]
+        Codages disponibles pour la ressource (``"br"``, ``"gzip"``).
+
+    Returns
+    -------
+    str
+        Codage accepté de plus haute qualité (``br`` préféré à égalité), ou
+        ``"identity"`` si aucun ne l'est.
+    """
+    if not accept_encoding or not available:
+        return "identity"
+    qualites = _parse_accept_encoding(accept_encoding)
+    defaut = qualites.get("*", 0.0)
+    meilleur, meilleure_q = "identity", 0.0
+    for coding in _PREFERENCE:
+        if coding in available:
+            q = qualites.get(coding, defaut)
+            if q > meilleure_q:
+                meilleur, meilleure_q = coding, q
+    return meilleur
+
+
+@dataclass(frozen=True, slots=True)
+class Precompressed:
+    """Corps de réponse et ses variantes compressées.
+
+    Attributes
+    ----------
+    identity : bytes
+        Corps non compressé.
+    gzip : bytes | None
+        Variante gzip, ou None si le corps est trop petit ou incompressible.
+    br : bytes | None
+        Variante brotli, ou None (corps trop petit, incompressible, ou module
+        ``brotli`` absent).
+    """
+
+    identity: bytes
+    gzip: bytes | None = None
+    br: bytes | None = None
+
+    @classmethod
+    def build(
+        cls, body: bytes, *, brotli_quality: int = 9, min_size: int = MIN_SIZE
+    ) -> Precompressed:
+        """Compresse ``body`` une fois pour toutes.
+
+        Parameters
+        ----------
+        body : bytes
+            Corps non compressé.
+        brotli_quality : int, optional
+            Qualité brotli (0 à 11). 11 compresse un peu mieux mais coûte
+            plus de dix fois plus cher ; réservée aux fichiers statiques.
+        min_size : int, optional
+            Taille en dessous de laquelle aucune variante n'est produite.
+
+        Returns
+        -------
+        Precompressed
+            Corps et variantes plus petites que l'original.
+        """
+        if len(body) < min_size:
+            return cls(body)
+        gz = gzip.compress(body, compresslevel=9, mtime=0)
+        br = brotli.compress(body, quality=brotli_quality) if brotli is not None else None
+        return cls(
+            body,
+            gzip=gz if len(gz) < len(body) else None,
+            br=br if br is not None and len(br) < len(body) else None,
+        )
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        """Codages disponibles pour ce corps."""
+        return tuple(c for c in _PREFERENCE if getattr(self, c) is not None)
+
+    def select(self, accept_encoding: str | None) -> tuple[str, bytes]:
+        """Variante à servir selon ``Accept-Encoding``.
+
+        Returns
+        -------
+        tuple[str, bytes]
+            Codage (``"br"``, ``"gzip"`` ou ``"identity"``) et corps correspondant.
+        """
+        coding = negotiate(accept_encoding, self.encodings)
+        return coding, self.identity if coding == "identity" else getattr(self, coding)
@@ -0,0 +1,170 @@
+"""Requêtes conditionnelles HTTP (ETag, Last-Modified, 304 Not Modified).
+
+Les données servies sont immuables pour une génération donnée : l'ETag
+d'une ressource est dérivé de l'empreinte du contenu du jeu de données et
+de l'URL demandée. La vérification se fait avant toute sérialisation ou
+rendu de template, qui sont entièrement évités pour une réponse 304.
+
+Pour une ressource servie en plusieurs codages (gzip, brotli), chaque
+représentation a son propre ETag et la réponse porte ``Vary: Accept-Encoding``.
+
+``Last-Modified`` ne peut pas refléter une nouvelle version de l'application
+(code, templates) servant les mêmes données : c'est la plus récente de la
+date de modification des données et du démarrage du processus. Une copie
+obtenue avant un déploiement n'est donc jamais validée par
+``If-Modified-Since`` après celui-ci.
+"""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from fastapi import Response
+
+if TYPE_CHECKING:
+    from fastapi import Request
+
+    from app.data.reload import DatasetGeneration
+
+# Démarrage du processus : borne inférieure de Last-Modified (voir le docstring du module)
+_STARTED_AT = datetime.datetime.now(datetime.UTC)
+
+
+def make_etag(fingerprint: str, resource: str) -> str:
+    """ETag fort d'une ressource.
+
+    Parameters
+    ----------
+    fingerprint : str
+        Empreinte du contenu servi (données et, le cas échéant, templates).
+    resource : str
+        Identifiant de la ressource (chemin et paramètres de la requête).
+
+    Returns
+    -------
+    str
+        ETag entre guillemets, ex. ``"3f2a…"``.
+    """
+    digest = hashlib.sha256(f"{fingerprint}\0{resource}".encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparaison faible de ``If-None-Match`` (RFC 9110, section 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, modified_at: datetime.datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # Last-Modified est transmis à la seconde près
+    return modified_at.replace(microsecond=0) <= since
+
+
+def conditional_get(
+    request: Request,
+    fingerprint: str,
+    modified_at: datetime.datetime,
+    cache_control: str,
+    content_encoding: str | None = None,
+) -> tuple[dict[str, str], Response | None]:
+    """En-têtes de validation de la ressource demandée, et la réponse 304 si à jour.
+
+    ``If-None-Match`` prime sur ``If-Modified-Since`` lorsqu'il est présent.
+
+    Parameters
+    ----------
+    request : Request
+        Requête entrante (URL et en-têtes conditionnels).
+    fingerprint : str
+        Empreinte du contenu servi (voir ``make_etag``).
+    modified_at : datetime.datetime
+        Date de modification des données servies (UTC). ``Last-Modified``
+        vaut la plus récente de cette date et du démarrage du processus.
+    cache_control : str
+        Valeur de l'en-tête ``Cache-Control``.
+    content_encoding : str | None, optional
+        Codage négocié de la représentation servie (``"br"``, ``"gzip"`` ou
+        ``"identity"``), ou None si la ressource n'est pas négociée.
+
+    Returns
+    -------
+    tuple[dict[str, str], Response | None]
+        En-têtes à joindre à la réponse (``Content-Encoding`` compris), et
+        une réponse ``304 Not Modified`` si la copie du client est à jour
+        (None sinon).
+    """
+    resource = f"{request.url.path}?{request.url.query}"
+    if content_encoding not in (None, "identity"):
+        resource = f"{resource};{content_encoding}"
+    modified_at = max(modified_at, _STARTED_AT)
+    headers = {
+        "ETag": make_etag(fingerprint, resource),
+        "Last-Modified": format_datetime(modified_at, usegmt=True),
+        "Cache-Control": cache_control,
+    }
+    if content_encoding is not None:
+        headers["Vary"] = "Accept-Encoding"
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        fresh = if_modified_since is not None and _not_modified_since(
+            if_modified_since, modified_at
+        )
+    if fresh:
+        return headers, Response(status_code=304, headers=headers)
+    if content_encoding not in (None, "identity"):
+        headers["Content-Encoding"] = content_encoding
+    return headers, None
+
+
+def conditional_generation(
+    request: Request,
+    generation: DatasetGeneration,
+    content_encoding: str | None = None,
+    templates: str | None = None,
+) -> tuple[dict[str, str], Response | None]:
+    """``conditional_get`` d'une ressource de la génération de données servie.
+
+    L'empreinte combine la version de l'application, celle des templates
+    (pages HTML) et celle des données ; ``Cache-Control`` provient de
+    ``Settings`` (``html_cache_control`` pour une page, ``api_cache_control``
+    sinon).
+
+    Parameters
+    ----------
+    request : Request
+        Requête entrante.
+    generation : DatasetGeneration
+        Génération servie (empreinte et date de modification des données).
+    content_encoding : str | None, optional
+        Codage négocié de la représentation (voir ``conditional_get``).
+    templates : str | None, optional
+        Empreinte des templates d'une page HTML, None pour l'API.
+
+    Returns
+    -------
+    tuple[dict[str, str], Response | None]
+        En-têtes de validation, et la réponse 304 si la copie du client est à jour.
+    """
+    settings = request.app.state.settings
+    if templates is None:
+        fingerprint = f"{settings.app_version}:{generation.dataset.fingerprint}"
+        cache_control = settings.api_cache_control
+    else:
+        fingerprint = f"{settings.app_version}:{templates}:{generation.dataset.fingerprint}"
+        cache_control = settings.html_cache_control
+    return conditional_get(
+        request, fingerprint, generation.modified_at, cache_control, content_encoding
+    )
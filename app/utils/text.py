@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import unicodedata
+from array import array
+from functools import lru_cache
 
 # Table de translittération des ligatures courantes
 _LIGATURE_TABLE = str.maketrans(
@@ -43,3 +45,61 @@ def strip_accents(text: str) -> str:
     return "".join(
         c for c in unicodedata.normalize("NFD", text) if unicodedata.category(c) != "Mn"
     )
+
+
+@lru_cache(maxsize=4096)
+def _strip_char(char: str) -> str:
+    """``strip_accents`` d'un seul caractère (mémoïsé : l'alphabet est petit)."""
+    return strip_accents(char)
+
+
+def strip_accents_with_offsets(text: str) -> tuple[str, array]:
+    """Normalise ``text`` et calcule la table position normalisée → position d'origine.
+
+    ``strip_accents`` peut changer la longueur (ex : œ → oe) : la table
+    permet de reporter une position du texte normalisé dans le texte
+    d'origine, par exemple pour surligner le texte affiché.
+
+    Parameters
+    ----------
+    text : str
+        Texte à normaliser.
+
+    Returns
+    -------
+    tuple[str, array]
+        Texte normalisé et table compacte (``array('H')``, ou ``array('I')``
+        au-delà de 65 535 caractères) de même longueur que le texte normalisé.
+
+    Examples
+    --------
+    >>> norm, offsets = strip_accents_with_offsets("Œso")
+    >>> norm, list(offsets)
+    ('oeso', [0, 0, 1, 2])
+    """
+    offsets = array("H" if len(text) <= 0xFFFF else "I")
+    pieces = []
+    for i, char in enumerate(text):
+        norm_char = _strip_char(char)
+        pieces.append(norm_char)
+        offsets.extend([i] * len(norm_char))
+    return "".join(pieces), offsets
+
+
+def find_occurrences(text: str, sub: str) -> tuple[tuple[int, int], ...]:
+    """Positions ``(début, fin)`` des occurrences non chevauchantes de ``sub`` dans ``text``.
+
+    Examples
+    --------
+    >>> find_occurrences("hanche et hanche", "hanche")
+    ((0, 6), (10, 16))
+    """
+    if not sub:
+        return ()
+    spans = []
+    start = text.find(sub)
+    while start != -1:
+        end = start + len(sub)
+        spans.append((start, end))
+        start = text.find(sub, end)
+    return tuple(spans)
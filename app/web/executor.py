@@ -0,0 +1,71 @@
+"""Exécution bornée des calculs de recherche hors de la boucle d'événements."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class SearchOverloadedError(RuntimeError):
+    """Levée quand la file d'attente de recherche est saturée (délestage)."""
+
+
+class BoundedExecutor:
+    """Pool de threads borné avec limite de profondeur de file.
+
+    rapidfuzz relâche le GIL pendant le scoring : les recherches s'exécutent
+    en parallèle sans bloquer la boucle d'événements (fichiers statiques,
+    pages protocole…). Au-delà de ``max_workers + max_queue`` tâches en
+    cours, ``run`` lève ``SearchOverloadedError`` au lieu d'empiler.
+
+    Parameters
+    ----------
+    max_workers : int
+        Nombre de threads de calcul.
+    max_queue : int
+        Nombre de tâches pouvant attendre un thread libre.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search")
+        # Modifié uniquement depuis la boucle d'événements : pas de verrou nécessaire
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Nombre de tâches en cours ou en attente."""
+        return self._in_flight
+
+    @property
+    def saturated(self) -> bool:
+        """Indique si une nouvelle tâche serait refusée."""
+        return self._in_flight >= self.max_workers + self.max_queue
+
+    async def run[T](self, fn: Callable[..., T], *args: object, **kwargs: object) -> T:
+        """Exécute ``fn(*args, **kwargs)`` dans le pool et attend son résultat.
+
+        Raises
+        ------
+        SearchOverloadedError
+            Si la file d'attente est pleine.
+        """
+        if self.saturated:
+            msg = f"File de recherche saturée ({self._in_flight} tâches en cours)"
+            raise SearchOverloadedError(msg)
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Arrête le pool (appelé à l'arrêt du serveur)."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -2,61 +2,76 @@
 
 from __future__ import annotations
 
-import re
-from typing import Annotated
+import hashlib
+from typing import TYPE_CHECKING, Annotated
+from urllib.parse import urlencode
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.templating import Jinja2Templates
 from markupsafe import Markup
 
+from app.api.interventions import filter_criteria, resolve_criteria
 from app.config import _PROJECT_ROOT
+from app.utils.http import conditional_generation
+from app.web.executor import SearchOverloadedError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.data.reload import DatasetGeneration
 
 router = APIRouter()
+
+# Libellés des champs secondaires ayant correspondu (le nom n'est pas signalé)
+_FIELD_LABELS = {
+    "sous_categorie": "sous-catégorie",
+    "source_tableau": "tableau",
+    "notes": "notes",
+    "protocole": "protocole",
+}
+
+# Libellés des facettes de la page de résultats (ordre d'affichage)
+_FACET_LABELS = {
+    "specialite": "Spécialité",
+    "sous_categorie": "Sous-catégorie",
+    "molecule": "Molécule",
+    "force_recommandation": "Force de recommandation",
+}
 templates = Jinja2Templates(directory=str(_PROJECT_ROOT / "app" / "templates"))
 
+# Empreinte des templates : une page change si ses données ou son gabarit changent
+_TEMPLATES_FINGERPRINT = hashlib.sha256(
+    b"".join(
+        p.read_bytes()
+        for p in sorted((_PROJECT_ROOT / "app" / "templates").rglob("*"))
+        if p.is_file()
+    )
+).hexdigest()[:16]
 
-def _highlight(text: str, query: str) -> Markup:
-    """Surligne les occurrences de query dans text avec <mark>.
 
-    La comparaison est insensible à la casse et aux accents : taper
-    "cesari" surligne "Césarienne", "oeso" surligne "Œsophagectomie".
-    Le texte affiché conserve ses accents et ligatures d'origine.
+def _mark(text: str, spans: Sequence[tuple[int, int]], offsets: Sequence[int]) -> Markup:
+    """Entoure de <mark> les zones ``spans`` (positions du texte normalisé) de ``text``.
 
     Parameters
     ----------
     text : str
-        Texte brut à traiter (non échappé).
-    query : str
-        Terme à surligner (insensible à la casse et aux accents).
+        Texte brut à afficher (non échappé).
+    spans : Sequence[tuple[int, int]]
+        Zones ``(début, fin)`` dans le texte normalisé, triées et disjointes.
+    offsets : Sequence[int]
+        Table position normalisée → position dans ``text``.
 
     Returns
     -------
     Markup
-        HTML sûr avec les occurrences entourées de <mark>.
+        HTML sûr avec les zones entourées de <mark>.
     """
-    from app.utils.text import strip_accents
-
-    query_norm = strip_accents(query.strip())
-    if not query_norm:
-        return Markup.escape(text)
-
-    # Construction d'une table de correspondance : position dans text_norm → position dans text.
-    # strip_accents peut changer la longueur (ex: œ → oe), donc les offsets divergent.
-    norm_to_orig: list[int] = []
-    for i, char in enumerate(text):
-        norm_char = strip_accents(char)
-        norm_to_orig.extend([i] * len(norm_char))
-
-    text_norm = strip_accents(text)
-    pattern = re.compile(re.escape(query_norm))
     result = []
     last_orig = 0
-    for m in pattern.finditer(text_norm):
+    for start, end in spans:
         # Convertit les positions normalisées en positions originales
-        orig_start = norm_to_orig[m.start()] if m.start() < len(norm_to_orig) else len(text)
-        last_norm_idx = m.end() - 1
-        in_bounds = m.end() > 0 and last_norm_idx < len(norm_to_orig)
-        orig_end = (norm_to_orig[last_norm_idx] + 1) if in_bounds else len(text)
+        orig_start = offsets[start]
+        orig_end = offsets[end - 1] + 1
         result.append(str(Markup.escape(text[last_orig:orig_start])))
         result.append(f"<mark>{Markup.escape(text[orig_start:orig_end])}</mark>")
         last_orig = orig_end
@@ -64,6 +79,121 @@ def _highlight(text: str, query: str) -> Markup:
     return Markup("".join(result))
 
 
+def _search_items(generation: DatasetGeneration, q: str, limit: int) -> list[dict]:
+    """Recherche et surlignage des résultats (calcul CPU, exécuté hors boucle d'événements).
+
+    Parameters
+    ----------
+    generation : DatasetGeneration
+        Génération de données lue par la requête (index, cache de recherche).
+    q : str
+        Texte de recherche.
+    limit : int
+        Nombre maximum de résultats.
+
+    Returns
+    -------
+    list[dict]
+        Résultats prêts pour les templates (id, nom surligné, spécialité,
+        champ secondaire ayant correspondu).
+    """
+    from app.data.query import is_structured
+    from app.data.search import search_interventions_cached, search_interventions_faceted
+
+    index = generation.search_index
+    if is_structured(q):
+        # Champs qualifiés (molecule:…, -terme) : plan compilé, fuzzy sur le reste
+        results = search_interventions_faceted(
+            q,
+            index,
+            generation.dataset.filters,
+            {},
+            generation.search_cache,
+            limit=limit,
+            facet_fields=(),
+            plans=generation.query_plans,
+        ).results
+    else:
+        results = search_interventions_cached(q, index, generation.search_cache, limit=limit)
+    return [
+        {
+            "id": r.intervention.id,
+            "nom": _mark(r.intervention.nom, r.spans, index.noms_offsets[r.position]),
+            "specialite": r.intervention.specialite,
+            "champ": _FIELD_LABELS.get(r.field),
+        }
+        for r in results
+    ]
+
+
+def _faceted_items(
+    generation: DatasetGeneration, q: str, criteria: dict[str, list], limit: int
+) -> tuple[list[dict], int, list[dict]]:
+    """Recherche à facettes et surlignage (calcul CPU, exécuté hors boucle d'événements).
+
+    Parameters
+    ----------
+    generation : DatasetGeneration
+        Génération de données lue par la requête (index, filtres, cache).
+    q : str
+        Texte de recherche.
+    criteria : dict[str, list]
+        Critères sélectionnés (voir ``filter_criteria``).
+    limit : int
+        Nombre maximum de résultats.
+
+    Returns
+    -------
+    tuple[list[dict], int, list[dict]]
+        Résultats prêts pour les templates, nombre total de résultats
+        retenus, et facettes (libellé, valeurs avec compte, état et lien
+        qui coche ou décoche la valeur).
+    """
+    from app.data.search import search_interventions_faceted
+
+    index = generation.search_index
+    criteria = resolve_criteria(generation.repository, criteria)
+    faceted = search_interventions_faceted(
+        q,
+        index,
+        generation.dataset.filters,
+        criteria,
+        generation.search_cache,
+        limit=limit,
+        facet_fields=tuple(_FACET_LABELS),
+        plans=generation.query_plans,
+    )
+    items = [
+        {
+            "id": r.intervention.id,
+            "nom": _mark(r.intervention.nom, r.spans, index.noms_offsets[r.position]),
+            "specialite": r.intervention.specialite,
+            "champ": _FIELD_LABELS.get(r.field),
+        }
+        for r in faceted.results
+    ]
+    # Paramètres courants, spécialités par nom : chaque lien bascule une seule valeur
+    params = [("q", q)] + [(f, str(v)) for f, values in criteria.items() for v in values]
+    facets = []
+    for field, label in _FACET_LABELS.items():
+        valeurs = []
+        for valeur, count in faceted.facets[field].items():
+            param = (field, str(valeur))
+            active = param in params
+            bascule = [p for p in params if p != param] if active else [*params, param]
+            valeurs.append(
+                {
+                    "valeur": valeur,
+                    "count": count,
+                    "active": active,
+                    "url": f"/recherche?{urlencode(bascule)}",
+                }
+            )
+        if valeurs:
+            facets.append({"field": field, "label": label, "valeurs": valeurs})
+    return items, faceted.total, facets
+
+
 @router.get("/")
 async def accueil(request: Request):
     """Page d'accueil — recherche + navigation par spécialité.
@@ -76,21 +206,29 @@ async def accueil(request: Request):
     Returns
     -------
     TemplateResponse
-        Page HTML avec héros, barre de recherche et grille des spécialités.
+        Page HTML avec héros, barre de recherche et grille des spécialités
+        (304 si la copie du client est à jour).
     """
-    rfe = request.app.state.rfe_data
+    generation = request.app.state.datasets.current
+    headers, not_modified = conditional_generation(
+        request, generation, templates=_TEMPLATES_FINGERPRINT
+    )
+    if not_modified is not None:
+        return not_modified
+    repository = generation.repository
     specialites = [
         {
             "id": s.id,
             "nom": s.nom,
             "nb_interventions": len(s.interventions),
         }
-        for s in rfe.specialites
+        for s in repository.specialites
     ]
     return templates.TemplateResponse(
         request,
         "accueil.html",
         {"specialites": specialites},
+        headers=headers,
     )
 
 
@@ -108,20 +246,27 @@ async def protocole(request: Request, intervention_id: str):
     Returns
     -------
     TemplateResponse
-        Page HTML du protocole, ou 404 si l'intervention n'existe pas.
+        Page HTML du protocole (304 si la copie du client est à jour), ou
+        404 si l'intervention n'existe pas.
     """
-    rfe = request.app.state.rfe_data
-    for specialite in rfe.specialites:
-        for intervention in specialite.interventions:
-            if intervention.id == intervention_id:
-                return templates.TemplateResponse(
-                    request,
-                    "protocole.html",
-                    {
-                        "intervention": intervention,
-                        "specialite": specialite,
-                    },
-                )
+    generation = request.app.state.datasets.current
+    repository = generation.repository
+    intervention = repository.get_intervention(intervention_id)
+    if intervention is not None:
+        headers, not_modified = conditional_generation(
+            request, generation, templates=_TEMPLATES_FINGERPRINT
+        )
+        if not_modified is not None:
+            return not_modified
+        return templates.TemplateResponse(
+            request,
+            "protocole.html",
+            {
+                "intervention": intervention,
+                "specialite": repository.specialite_de(intervention_id),
+            },
+            headers=headers,
+        )
     return templates.TemplateResponse(
         request,
         "404.html",
@@ -148,24 +293,30 @@ async def search_partial(
     TemplateResponse
         Fragment HTML avec les résultats de recherche.
     """
-    from app.data.search import search_interventions
-
-    rfe = request.app.state.rfe_data
     # On demande 4 pour détecter s'il y en a plus de 3 (has_more), mais on n'affiche que 3
-    results = search_interventions(q, rfe, limit=4) if q.strip() else []
-    has_more = len(results) > 3
-    items = [
-        {
-            "id": r.intervention.id,
-            "nom": _highlight(r.intervention.nom, q),
-            "specialite": r.intervention.specialite,
-        }
-        for r in results[:3]
-    ]
+    try:
+        items = (
+            await request.app.state.search_executor.run(
+                _search_items, request.app.state.datasets.current, q, 4
+            )
+            if q.strip()
+            else []
+        )
+    except SearchOverloadedError:
+        # Délestage : 503 comme /recherche ; HTMX affiche tout de même ce partial vide
+        # (responseHandling de base.html), qui se recharge après le délai indiqué
+        retry_after = request.app.state.settings.search_retry_after
+        return templates.TemplateResponse(
+            request,
+            "partials/search_results.html",
+            {"results": [], "has_more": False, "query": q, "retry_after": retry_after},
+            status_code=503,
+            headers={"Retry-After": str(retry_after)},
+        )
     return templates.TemplateResponse(
         request,
         "partials/search_results.html",
-        {"results": items, "has_more": has_more, "query": q},
+        {"results": items[:3], "has_more": len(items) > 3, "query": q},
     )
 
 
@@ -181,55 +332,74 @@ async def liste_specialites(request: Request):
     Returns
     -------
     TemplateResponse
-        Page HTML avec la grille des spécialités.
+        Page HTML avec la grille des spécialités (304 si la copie du client
+        est à jour).
     """
-    rfe = request.app.state.rfe_data
+    generation = request.app.state.datasets.current
+    headers, not_modified = conditional_generation(
+        request, generation, templates=_TEMPLATES_FINGERPRINT
+    )
+    if not_modified is not None:
+        return not_modified
     specialites = [
         {"id": s.id, "nom": s.nom, "nb_interventions": len(s.interventions)}
-        for s in rfe.specialites
+        for s in generation.repository.specialites
     ]
     return templates.TemplateResponse(
         request,
         "specialites.html",
         {"specialites": specialites},
+        headers=headers,
     )
 
 
 @router.get("/recherche")
 async def recherche(
     request: Request,
+    criteria: Annotated[dict[str, list], Depends(filter_criteria)],
     q: Annotated[str, Query(description="Texte de recherche")] = "",
 ):
-    """Page de résultats de recherche complète.
+    """Page de résultats de recherche complète, avec facettes.
+
+    Chaque valeur de facette (spécialité, sous-catégorie, molécule, force
+    de recommandation) est un lien qui la coche ou la décoche ; HTMX ne
+    remplace que la zone des résultats.
 
     Parameters
     ----------
     request : Request
         Requête HTTP entrante.
+    criteria : dict[str, list]
+        Valeurs de facettes cochées (voir ``filter_criteria``).
     q : str, optional
         Texte de recherche.
 
     Returns
     -------
     TemplateResponse
-        Page HTML avec tous les résultats de recherche.
+        Page HTML avec les résultats de recherche et les facettes.
     """
-    from app.data.search import search_interventions
-
-    rfe = request.app.state.rfe_data
-    results = search_interventions(q, rfe, limit=50) if q.strip() else []
-    items = [
-        {
-            "id": r.intervention.id,
-            "nom": _highlight(r.intervention.nom, q),
-            "specialite": r.intervention.specialite,
-        }
-        for r in results
-    ]
+    try:
+        items, total, facets = (
+            await request.app.state.search_executor.run(
+                _faceted_items, request.app.state.datasets.current, q, criteria, 50
+            )
+            if q.strip()
+            else ([], 0, [])
+        )
+    except SearchOverloadedError:
+        retry_after = request.app.state.settings.search_retry_after
+        return templates.TemplateResponse(
+            request,
+            "recherche.html",
+            {"query": q, "results": [], "retry_after": retry_after},
+            status_code=503,
+            headers={"Retry-After": str(retry_after)},
+        )
     return templates.TemplateResponse(
         request,
         "recherche.html",
-        {"query": q, "results": items},
+        {"query": q, "results": items, "total": total, "facets": facets},
     )
 
 
@@ -247,20 +417,27 @@ async def specialite(request: Request, specialite_id: str):
     Returns
     -------
     TemplateResponse
-        Page HTML de la spécialité avec groupes par sous-catégorie, ou 404.
+        Page HTML de la spécialité avec groupes par sous-catégorie (304 si
+        la copie du client est à jour), ou 404.
     """
-    rfe = request.app.state.rfe_data
-    for s in rfe.specialites:
-        if s.id == specialite_id:
-            groupes: dict[str, list] = {}
-            for interv in s.interventions:
-                cle = interv.sous_categorie or "Général"
-                groupes.setdefault(cle, []).append(interv)
-            return templates.TemplateResponse(
-                request,
-                "specialite.html",
-                {"specialite": s, "groupes": groupes},
-            )
+    generation = request.app.state.datasets.current
+    s = generation.repository.get_specialite(specialite_id)
+    if s is not None:
+        headers, not_modified = conditional_generation(
+            request, generation, templates=_TEMPLATES_FINGERPRINT
+        )
+        if not_modified is not None:
+            return not_modified
+        groupes: dict[str, list] = {}
+        for interv in s.interventions:
+            cle = interv.sous_categorie or "Général"
+            groupes.setdefault(cle, []).append(interv)
+        return templates.TemplateResponse(
+            request,
+            "specialite.html",
+            {"specialite": s, "groupes": groupes},
+            headers=headers,
+        )
     return templates.TemplateResponse(
         request,
         "404.html",
@@ -0,0 +1,86 @@
+"""Fichiers statiques servis pré-compressés (gzip, brotli).
+
+Les feuilles de style et scripts de ``app/static`` sont compressés une fois,
+au démarrage, puis servis selon ``Accept-Encoding`` sans compression à la
+requête. Un fichier modifié depuis le démarrage (taille ou date différente)
+est servi tel quel depuis le disque, non compressé.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+
+from app.utils.compression import Precompressed
+
+if TYPE_CHECKING:
+    from starlette.types import Scope
+
+# Formats textuels : les images (PNG, ICO…) sont déjà compressées
+COMPRESSIBLE_SUFFIXES = frozenset({".css", ".js", ".json", ".map", ".svg", ".txt", ".html"})
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` servant des variantes compressées construites au démarrage.
+
+    Parameters
+    ----------
+    directory : str | os.PathLike
+        Répertoire des fichiers statiques.
+    **kwargs
+        Autres arguments de ``StaticFiles``.
+    """
+
+    def __init__(self, *, directory: str | os.PathLike[str], **kwargs) -> None:
+        super().__init__(directory=directory, **kwargs)
+        # Chemin réel -> ((mtime_ns, taille) à la compression, variantes)
+        self._precompressed: dict[str, tuple[tuple[int, int], Precompressed]] = {}
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if os.path.splitext(name)[1] not in COMPRESSIBLE_SUFFIXES:
+                    continue
+                path = os.path.realpath(os.path.join(root, name))
+                st = os.stat(path)
+                with open(path, "rb") as f:
+                    body = Precompressed.build(f.read(), brotli_quality=11)
+                if body.encodings:
+                    self._precompressed[path] = ((st.st_mtime_ns, st.st_size), body)
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Variante compressée acceptée par le client, sinon le fichier sur disque."""
+        entry = self._precompressed.get(str(full_path))
+        if (
+            entry is None
+            or status_code != 200
+            or entry[0] != (stat_result.st_mtime_ns, stat_result.st_size)
+        ):
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        request_headers = Headers(scope=scope)
+        content_encoding, content = entry[1].select(request_headers.get("accept-encoding"))
+        # Mêmes en-têtes que FileResponse (type, Last-Modified, ETag), ETag propre au codage
+        file_headers = FileResponse(full_path, stat_result=stat_result).headers
+        headers = {
+            "content-type": file_headers["content-type"],
+            "last-modified": file_headers["last-modified"],
+            "etag": file_headers["etag"],
+            "vary": "Accept-Encoding",
+        }
+        if content_encoding != "identity":
+            headers["etag"] = f'{headers["etag"][:-1]}-{content_encoding}"'
+        if self.is_not_modified(Headers(headers), request_headers):
+            return NotModifiedResponse(Headers(headers))
+        if content_encoding != "identity":
+            headers["content-encoding"] = content_encoding
+        return Response(content, headers=headers)
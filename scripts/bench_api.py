@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Débit des endpoints REST : réponses pré-encodées contre ``response_model``.
+
+Les endpoints « avant » sont reconstitués sur une application FastAPI à
+part, qui renvoie les modèles Pydantic et laisse FastAPI les sérialiser à
+chaque requête ; les endpoints « après » sont ceux de ``app.main``. Les deux
+servent la même génération de données, en processus (client de test).
+
+Usage :
+    uv run python scripts/bench_api.py [--requests 500]
+"""
+
+import argparse
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.data.models import Intervention, Specialite
+from app.main import app
+
+avant = FastAPI()
+
+
+@avant.get("/api/v1/specialites", response_model=list[Specialite])
+def _list_specialites(request: Request) -> list[Specialite]:
+    return request.app.state.datasets.current.repository.specialites
+
+
+@avant.get("/api/v1/specialites/{specialite_id}", response_model=Specialite)
+def _get_specialite(specialite_id: str, request: Request) -> Specialite:
+    return request.app.state.datasets.current.repository.get_specialite(specialite_id)
+
+
+@avant.get("/api/v1/interventions", response_model=list[Intervention])
+def _list_interventions(request: Request, skip: int = 0, limit: int = 50) -> list[Intervention]:
+    return list(request.app.state.datasets.current.repository.interventions[skip : skip + limit])
+
+
+@avant.get("/api/v1/interventions/{intervention_id}", response_model=Intervention)
+def _get_intervention(intervention_id: str, request: Request) -> Intervention:
+    return request.app.state.datasets.current.repository.get_intervention(intervention_id)
+
+
+def _debit(client: TestClient, url: str, requests: int) -> float:
+    """Requêtes par seconde sur ``url``."""
+    client.get(url)
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(url)
+    return requests / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Affiche le débit de chaque endpoint avant et après pré-encodage."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with TestClient(app) as apres_client:
+        generation = app.state.datasets.current
+        avant.state.datasets = app.state.datasets
+        avant_client = TestClient(avant)
+        urls = [
+            "/api/v1/specialites",
+            f"/api/v1/specialites/{generation.repository.specialites[0].id}",
+            "/api/v1/interventions?limit=200",
+            f"/api/v1/interventions/{generation.repository.interventions[0].id}",
+        ]
+        print(f"{'Endpoint':<60} {'avant':>9} {'après':>9}  (req/s)")
+        for url in urls:
+            r_avant = _debit(avant_client, url, args.requests)
+            r_apres = _debit(apres_client, url, args.requests)
+            print(f"{url:<60} {r_avant:9.0f} {r_apres:9.0f}  x{r_apres / r_avant:.1f}")
+
+
+if __name__ == "__main__":
+    main()
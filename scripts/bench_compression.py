@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Compression à la volée contre corps pré-compressés.
+
+Les endpoints « à la volée » sont reconstitués sur une application FastAPI
+à part, derrière ``GZipMiddleware`` (compression gzip à chaque requête) ;
+les endpoints « pré-compressés » sont ceux de ``app.main``, qui servent les
+variantes construites une fois par génération (API) ou au démarrage
+(``app/static``). Les deux servent les mêmes octets, en processus (client
+de test), avec ``Accept-Encoding: gzip``.
+
+Usage :
+    uv run python scripts/bench_compression.py [--requests 500]
+"""
+
+import argparse
+import time
+
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
+from fastapi.testclient import TestClient
+
+from app.config import _PROJECT_ROOT
+from app.main import app
+
+a_la_volee = FastAPI()
+a_la_volee.add_middleware(GZipMiddleware, minimum_size=1024)
+a_la_volee.mount("/static", StaticFiles(directory=str(_PROJECT_ROOT / "app" / "static")))
+
+
+@a_la_volee.get("/api/v1/specialites")
+def _list_specialites(request: Request) -> Response:
+    body = request.app.state.datasets.current.responses.specialites_list.identity
+    return Response(body, media_type="application/json")
+
+
+@a_la_volee.get("/api/v1/specialites/{specialite_id}")
+def _get_specialite(specialite_id: str, request: Request) -> Response:
+    body = request.app.state.datasets.current.responses.specialite(specialite_id).identity
+    return Response(body, media_type="application/json")
+
+
+def _mesure(client: TestClient, url: str, requests: int, coding: str) -> tuple[float, int]:
+    """Requêtes par seconde sur ``url`` et taille transférée."""
+    headers = {"Accept-Encoding": coding}
+    taille = client.get(url, headers=headers).num_bytes_downloaded
+    start = time.perf_counter()
+    for _ in range(requests):
+        client.get(url, headers=headers)
+    return requests / (time.perf_counter() - start), taille
+
+
+def main() -> None:
+    """Affiche débit et taille transférée de chaque ressource, des deux façons."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with TestClient(app) as pre_client:
+        generation = app.state.datasets.current
+        a_la_volee.state.datasets = app.state.datasets
+        volee_client = TestClient(a_la_volee)
+        urls = [
+            "/api/v1/specialites",
+            f"/api/v1/specialites/{generation.repository.specialites[0].id}",
+            "/static/js/htmx.min.js",
+            "/static/css/accueil.css",
+        ]
+        print(f"{'Ressource':<55} {'à la volée':>16} {'pré-compressé':>16}  (req/s, octets)")
+        for url in urls:
+            r_volee, t_volee = _mesure(volee_client, url, args.requests, "gzip")
+            r_pre, t_pre = _mesure(pre_client, url, args.requests, "gzip")
+            print(
+                f"{url:<55} {r_volee:7.0f} {t_volee:8d} {r_pre:7.0f} {t_pre:8d}"
+                f"  x{r_pre / r_volee:.1f}"
+            )
+            if generation.responses.specialites_list.br is not None:
+                r_br, t_br = _mesure(pre_client, url, args.requests, "br")
+                print(f"{'  (brotli)':<55} {'':16} {r_br:7.0f} {t_br:8d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Latence de la recherche fuzzy selon la taille du corpus : balayage contre BM25.
+
+Le corpus synthétique reprend les interventions de ``data/rfe.json`` puis
+en ajoute des variantes jusqu'à la taille voulue : nom d'origine suivi de
+deux pseudo-mots tirés selon une loi de Zipf, dans un vocabulaire qui croît
+comme ``n ** 0.6`` (loi de Heaps). Pour chaque taille, les mêmes requêtes
+sont servies par balayage complet (``partial_ratio`` sur tous les textes)
+et par présélection BM25 puis rescoring fuzzy. Les variantes d'une même
+intervention ont souvent le même score : le rappel@10 compare donc les
+scores du top 10 (part des scores du balayage retrouvés par BM25), pas les
+identifiants.
+
+Usage :
+    uv run python scripts/bench_search.py [--sizes 1000 10000 100000] [--runs 5]
+"""
+
+import argparse
+import dataclasses
+import random
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+
+import app.data.search as search
+from app.config import Settings
+from app.data.loader import load_rfe_data
+from app.data.models import RFEData
+from app.data.search import SearchIndex, search_interventions
+
+_REQUETES = (
+    "prothese de hanche",
+    "prothse de genou",
+    "cholecystectomie",
+    "cesarienne programmee",
+    "hernie inguinale",
+    "chirurgie cardiaque",
+    "colectomie",
+    "vancomycine",
+    "voie anterieure",
+    "xyzabc",
+)
+
+_SYLLABES = ("ba", "ko", "ri", "tu", "ne", "mal", "vor", "pi", "sa", "lek", "du", "fo")
+
+
+def _pseudo_mot(rang: int) -> str:
+    """Pseudo-mot distinct pour chaque rang (syllabes en base 12)."""
+    syllabes = []
+    rang += len(_SYLLABES) ** 2  # au moins trois syllabes
+    while rang:
+        rang, reste = divmod(rang, len(_SYLLABES))
+        syllabes.append(_SYLLABES[reste])
+    return "".join(syllabes)
+
+
+def corpus_synthetique(data: RFEData, taille: int, seed: int = 0) -> RFEData:
+    """Données de ``taille`` interventions : les réelles puis leurs variantes."""
+    rng = random.Random(seed)
+    reelles = [(s, i) for s in data.specialites for i in s.interventions]
+    vocabulaire = max(1, int(30 * taille**0.6))
+    par_specialite = {s.id: list(s.interventions) for s in data.specialites}
+    for k in range(taille - len(reelles)):
+        specialite, base = rng.choice(reelles)
+        mots = [_pseudo_mot(min(int(rng.paretovariate(1.0)), vocabulaire) - 1) for _ in range(2)]
+        par_specialite[specialite.id].append(
+            base.model_copy(
+                update={"id": f"{base.id}-synth-{k}", "nom": f"{base.nom} {' '.join(mots)}"}
+            )
+        )
+    return data.model_copy(
+        update={
+            "specialites": [
+                s.model_copy(update={"interventions": par_specialite[s.id]})
+                for s in data.specialites
+            ]
+        }
+    )
+
+
+def _latence(query: str, index: SearchIndex, runs: int) -> float:
+    """Latence médiane de ``search_interventions`` sur ``runs`` appels, en µs."""
+    mesures = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        search_interventions(query, index, limit=10)
+        mesures.append(time.perf_counter() - start)
+    return statistics.median(mesures) * 1e6
+
+
+def main() -> None:
+    """Affiche latences et rappel des deux chemins pour chaque taille de corpus."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-path", type=Path, default=Settings().data_path)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    data = load_rfe_data(args.data_path)
+    # Index BM25 construit à toute taille : les deux chemins sont mesurés sur le même index
+    search._BM25_DOCUMENTS_MIN = 0
+
+    colonnes = ("documents", "index (s)", "balayage (µs)", "BM25 (µs)", "rappel@10")
+    print(" ".join(f"{c:>14}" for c in colonnes))
+    for taille in args.sizes:
+        corpus = corpus_synthetique(data, taille)
+        start = time.perf_counter()
+        bm25 = SearchIndex.from_data(corpus)
+        construction = time.perf_counter() - start
+        balayage = dataclasses.replace(bm25, bm25=None)
+
+        latences_balayage, latences_bm25, rappels = [], [], []
+        for query in _REQUETES:
+            attendu = Counter(r.score for r in search_interventions(query, balayage, 10))
+            obtenu = Counter(r.score for r in search_interventions(query, bm25, 10))
+            if attendu:
+                rappels.append((attendu & obtenu).total() / attendu.total())
+            latences_balayage.append(_latence(query, balayage, args.runs))
+            latences_bm25.append(_latence(query, bm25, args.runs))
+        print(
+            f"{taille:>14} {construction:>14.1f} {statistics.mean(latences_balayage):>14.0f}"
+            f" {statistics.mean(latences_bm25):>14.0f} {statistics.mean(rappels):>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
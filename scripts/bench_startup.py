@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Mesure le temps de chargement du jeu de données au démarrage.
+
+Compare le chargement complet (JSON + validation Pydantic + index) et le
+chargement depuis l'instantané binaire (voir scripts/build_snapshot.py).
+Chaque mesure est faite dans un processus neuf, comme un démarrage à froid.
+
+Usage :
+    uv run python scripts/bench_startup.py [--runs 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from app.config import Settings
+from app.data.snapshot import write_snapshot
+
+_MESURE = """
+import time
+t0 = time.perf_counter()
+from pathlib import Path
+from app.data.loader import load_dataset
+import app.data.snapshot  # noqa: F401 — imports hors de la mesure du chargement
+t1 = time.perf_counter()
+snapshot = {snapshot!r}
+load_dataset(Path({data!r}), Path(snapshot) if snapshot else None)
+t2 = time.perf_counter()
+print(t2 - t1, t2 - t0)
+"""
+
+
+def _mesurer(data_path: Path, snapshot_path: Path | None, runs: int) -> tuple[float, float]:
+    """Temps médians (chargement seul, imports compris) sur ``runs`` processus neufs, en ms."""
+    code = _MESURE.format(data=str(data_path), snapshot=str(snapshot_path or ""))
+    chargement, total = [], []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        t_chargement, t_total = map(float, out.stdout.split())
+        chargement.append(t_chargement)
+        total.append(t_total)
+    return statistics.median(chargement) * 1000, statistics.median(total) * 1000
+
+
+def main() -> None:
+    """Affiche les temps médians avec et sans instantané."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    data_path = Settings().data_path
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = Path(tmp) / "rfe.snapshot"
+        write_snapshot(data_path, snapshot_path)
+
+        complet = _mesurer(data_path, None, args.runs)
+        instantane = _mesurer(data_path, snapshot_path, args.runs)
+
+    print(f"Médianes sur {args.runs} démarrages   chargement   imports compris")
+    print(f"  Chargement complet    {complet[0]:9.1f} ms   {complet[1]:12.1f} ms")
+    print(f"  Depuis l'instantané   {instantane[0]:9.1f} ms   {instantane[1]:12.1f} ms")
+    gains = complet[0] / instantane[0], complet[1] / instantane[1]
+    print(f"  Gain                  {gains[0]:10.1f}x   {gains[1]:11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
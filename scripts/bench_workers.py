@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Mesure la mémoire par worker : uvicorn --workers contre le mode pré-forké.
+
+Démarre le serveur dans chaque mode, envoie quelques requêtes pour que
+chaque worker touche aux données, puis lit ``/proc/<pid>/smaps_rollup``
+de chaque worker (Linux uniquement) :
+
+- RSS : pages résidentes, partagées comprises ;
+- PSS : pages partagées réparties entre les processus qui les partagent ;
+- USS : pages privées du processus (libérées à son arrêt).
+
+Usage :
+    uv run python scripts/bench_workers.py [--workers 4] [--requests 200]
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+_URLS = [
+    "/api/v1/health",
+    "/api/v1/interventions?limit=100",
+    "/api/v1/specialites",
+    "/api/v1/search?q=hanche",
+    "/recherche?q=prothese",
+]
+
+
+def _children(pid: int) -> list[int]:
+    """PID des processus fils directs de ``pid`` (lecture de /proc)."""
+    enfants = []
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # Le nom du programme (2e champ) peut contenir des espaces : découper après ')'
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        if ppid == pid:
+            enfants.append(int(entry.name))
+    return sorted(enfants)
+
+
+def _memory(pid: int) -> dict[str, int]:
+    """RSS, PSS et USS d'un processus, en Kio."""
+    valeurs = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        champ, valeur, *_ = line.split()
+        valeurs[champ.rstrip(":")] = int(valeur)
+    return {
+        "rss": valeurs["Rss"],
+        "pss": valeurs["Pss"],
+        "uss": valeurs["Private_Clean"] + valeurs["Private_Dirty"],
+    }
+
+
+def _wait_ready(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/v1/health") as r:
+                json.load(r)
+                return
+        except OSError:
+            time.sleep(0.2)
+    msg = f"Serveur non disponible sur le port {port}"
+    raise TimeoutError(msg)
+
+
+def _mesurer(command: list[str], port: int, workers: int, requests: int) -> list[dict]:
+    """Démarre ``command``, sollicite le serveur et mesure le maître puis chaque worker."""
+    env = dict(os.environ, RELOAD_POLL_INTERVAL="0")
+    proc = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_ready(port)
+        for i in range(requests):
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}{_URLS[i % len(_URLS)]}") as r:
+                r.read()
+        # uvicorn --workers démarre aussi un suivi de ressources : garder les workers
+        pids = [p for p in _children(proc.pid) if b"resource_tracker" not in _cmdline(p)]
+        return [
+            {"pid": pid, "role": role, **_memory(pid)}
+            for role, pid in [("maître", proc.pid), *(("worker", p) for p in pids[:workers])]
+        ]
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+def _cmdline(pid: int) -> bytes:
+    try:
+        return Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return b""
+
+
+def _afficher(titre: str, mesures: list[dict]) -> None:
+    print(f"\n{titre}")
+    print("  Processus          RSS (Mio)   PSS (Mio)   USS (Mio)")
+    for m in mesures:
+        rss, pss, uss = (m[k] / 1024 for k in ("rss", "pss", "uss"))
+        print(f"  {m['role']:<7} {m['pid']:<9} {rss:9.1f}   {pss:9.1f}   {uss:9.1f}")
+    total_pss = sum(m["pss"] for m in mesures) / 1024
+    total_uss = sum(m["uss"] for m in mesures) / 1024
+    print(f"  {'Total':<17} {'':9}   {total_pss:9.1f}   {total_uss:9.1f}")
+
+
+def main() -> None:
+    """Affiche la mémoire par worker dans les deux modes."""
+    if not Path("/proc/self/smaps_rollup").exists():
+        sys.exit("ERREUR : /proc/<pid>/smaps_rollup indisponible (Linux uniquement)")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    n, port = str(args.workers), str(args.port)
+    uvicorn = [sys.executable, "-m", "uvicorn", "app.main:app", "--workers", n, "--port", port]
+    prefork = [sys.executable, "-m", "app.prefork", "--workers", n, "--port", port]
+    _afficher("uvicorn --workers", _mesurer(uvicorn, args.port, args.workers, args.requests))
+    _afficher("app.prefork", _mesurer(prefork, args.port, args.workers, args.requests))
+
+
+if __name__ == "__main__":
+    main()
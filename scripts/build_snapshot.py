@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Construit l'instantané binaire de data/rfe.json (démarrage rapide).
+
+À lancer au build, après toute modification de data/rfe.json ou du code
+de app/data : un instantané périmé est ignoré au démarrage (chargement
+complet), jamais utilisé à tort.
+
+Usage :
+    uv run python scripts/build_snapshot.py
+"""
+
+import sys
+
+from app.config import Settings
+from app.data.snapshot import write_snapshot
+
+
+def build() -> None:
+    """Écrit l'instantané de ``Settings.data_path`` vers ``Settings.snapshot_path``.
+
+    Raises
+    ------
+    ValueError
+        Si aucun chemin d'instantané n'est configuré.
+    """
+    settings = Settings()
+    if settings.snapshot_path is None:
+        msg = "SNAPSHOT_PATH n'est pas configuré."
+        raise ValueError(msg)
+
+    dataset = write_snapshot(settings.data_path, settings.snapshot_path)
+    size_kb = settings.snapshot_path.stat().st_size / 1024
+    print(f"Instantané écrit — {settings.snapshot_path} ({size_kb:.0f} Ko)")
+    print(f"  Interventions : {len(dataset.repository.interventions)}")
+
+
+if __name__ == "__main__":
+    try:
+        build()
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERREUR : {e}")
+        sys.exit(1)
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Rapprochement en masse des libellés du planning opératoire avec les interventions RFE.
+
+Lit un export CSV/TSV en flux, répartit le matching sur un pool de processus
+(même normalisation, même scorer et mêmes poids de champs ``search_weights``
+que l'endpoint ``/search``, voir ``app/data/search.py``) et écrit en
+flux, pour chaque ligne, la meilleure intervention, son score et la
+deuxième proposition. Un point de reprise (lignes traitées, taille en
+octets de la sortie) est enregistré après chaque lot : relancer avec
+``--resume`` tronque la sortie à cette taille et repart de la ligne
+suivante. Si la sortie a disparu, le traitement reprend depuis le début.
+
+Usage :
+    uv run python scripts/map_schedule.py planning.csv correspondances.csv --column libelle
+    uv run python scripts/map_schedule.py planning.tsv sortie.tsv --resume
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.config import Settings
+from app.data.loader import load_rfe_data
+from app.data.search import SearchIndex, search_interventions_batch
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+OUTPUT_COLUMNS = ["intervention_id", "intervention_nom", "score", "second_id", "second_score"]
+
+# Index de recherche propre à chaque processus du pool (construit par _init_worker)
+_INDEX: SearchIndex | None = None
+
+
+def _init_worker(data_path: Path, search_weights: Mapping[str, float] | None = None) -> None:
+    """Charge les données et construit l'index une fois par processus.
+
+    Les poids de champs sont appliqués comme par l'application (voir
+    ``DatasetManager``) : le classement est celui de ``/search``.
+    """
+    global _INDEX
+    index = SearchIndex.from_data(load_rfe_data(data_path))
+    _INDEX = index.weighted(search_weights) if search_weights else index
+
+
+def _match_chunk(labels: list[str]) -> list[list[str]]:
+    """Rapproche un lot de libellés : meilleure proposition et deuxième."""
+    assert _INDEX is not None, "_init_worker doit être appelé avant _match_chunk"
+    rows = []
+    # workers=1 : le parallélisme est assuré par le pool de processus
+    for results in search_interventions_batch(labels, _INDEX, limit=2, workers=1):
+        best = results[0] if results else None
+        second = results[1] if len(results) > 1 else None
+        rows.append(
+            [
+                best.intervention.id if best else "",
+                best.intervention.nom if best else "",
+                f"{best.score:.1f}" if best else "",
+                second.intervention.id if second else "",
+                f"{second.score:.1f}" if second else "",
+            ]
+        )
+    return rows
+
+
+def _checkpoint_path(output: Path) -> Path:
+    return output.with_name(output.name + ".checkpoint")
+
+
+def _read_checkpoint(output: Path) -> tuple[int, int]:
+    """Retourne (lignes déjà traitées, taille de la sortie) du point de reprise."""
+    path = _checkpoint_path(output)
+    if not path.exists():
+        return 0, 0
+    state = json.loads(path.read_text(encoding="utf-8"))
+    return state["rows_done"], state["output_bytes"]
+
+
+def _write_checkpoint(output: Path, rows_done: int, output_bytes: int) -> None:
+    """Écrit le point de reprise de façon atomique (fichier temporaire + rename)."""
+    path = _checkpoint_path(output)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"rows_done": rows_done, "output_bytes": output_bytes}), encoding="utf-8"
+    )
+    tmp.replace(path)
+
+
+def _detect_delimiter(path: Path) -> str:
+    """Tabulation pour les fichiers .tsv/.tab, virgule sinon."""
+    return "\t" if path.suffix.lower() in {".tsv", ".tab"} else ","
+
+
+def _encode_rows(rows: list[list[str]], delimiter: str) -> bytes:
+    """Lignes CSV encodées en UTF-8 : la sortie est écrite en binaire (offsets en octets)."""
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter=delimiter).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _chunks(reader, size: int):
+    """Regroupe les lignes du lecteur CSV en lots de ``size`` lignes."""
+    chunk: list[list[str]] = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def map_schedule(
+    input_path: Path,
+    output_path: Path,
+    column: str,
+    data_path: Path,
+    workers: int,
+    chunk_size: int,
+    resume: bool,
+    search_weights: Mapping[str, float] | None = None,
+) -> int:
+    """Rapproche chaque ligne de ``input_path`` et écrit le résultat dans ``output_path``.
+
+    Parameters
+    ----------
+    input_path : Path
+        Export CSV/TSV du planning (avec ligne d'en-tête).
+    output_path : Path
+        Fichier de sortie (mêmes colonnes + colonnes de correspondance).
+    column : str
+        Nom de la colonne contenant le libellé de l'intervention.
+    data_path : Path
+        Chemin vers ``rfe.json``.
+    workers : int
+        Nombre de processus du pool.
+    chunk_size : int
+        Nombre de lignes par lot envoyé à un processus.
+    resume : bool
+        Reprendre depuis le point de reprise de ``output_path``.
+    search_weights : Mapping[str, float] | None, optional
+        Poids des champs de recherche (``Settings.search_weights``) ; None :
+        poids par défaut.
+
+    Returns
+    -------
+    int
+        Nombre de lignes traitées lors de cette exécution.
+
+    Raises
+    ------
+    ValueError
+        Si le fichier d'entrée est vide ou si la colonne demandée est absente
+        de l'en-tête.
+    """
+    delimiter = _detect_delimiter(input_path)
+    rows_done, output_bytes = _read_checkpoint(output_path) if resume else (0, 0)
+    if rows_done and not output_path.exists():
+        print(f"Sortie {output_path} absente : reprise depuis le début", file=sys.stderr)
+        rows_done = 0
+
+    with input_path.open(encoding="utf-8", newline="") as fin:
+        reader = csv.reader(fin, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            msg = f"Fichier d'entrée vide (ligne d'en-tête attendue) : {input_path}"
+            raise ValueError(msg)
+        if column not in header:
+            msg = f"Colonne '{column}' absente de l'en-tête : {header}"
+            raise ValueError(msg)
+        col = header.index(column)
+
+        # Saute les lignes déjà traitées (lecture en flux, sans tout charger)
+        for _ in range(rows_done):
+            next(reader, None)
+
+        if rows_done:
+            # Une écriture interrompue après le dernier point de reprise est tronquée
+            fout = output_path.open("r+b")
+            fout.truncate(output_bytes)
+            fout.seek(output_bytes)
+        else:
+            fout = output_path.open("wb")
+        with fout:
+            if not rows_done:
+                fout.write(_encode_rows([header + OUTPUT_COLUMNS], delimiter))
+
+            start = time.perf_counter()
+            processed = 0
+            # Fenêtre bornée de lots en vol : mémoire constante quelle que soit la taille
+            pending: deque[tuple[list[list[str]], Future]] = deque()
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(data_path, search_weights),
+            ) as pool:
+
+                def flush_one() -> None:
+                    nonlocal rows_done, processed
+                    rows, future = pending.popleft()
+                    matches = future.result()
+                    lines = [row + match for row, match in zip(rows, matches, strict=True)]
+                    fout.write(_encode_rows(lines, delimiter))
+                    fout.flush()
+                    rows_done += len(rows)
+                    processed += len(rows)
+                    _write_checkpoint(output_path, rows_done, fout.tell())
+                    elapsed = time.perf_counter() - start
+                    print(
+                        f"\r  {rows_done} lignes — {processed / elapsed:,.0f} lignes/s",
+                        end="",
+                        file=sys.stderr,
+                    )
+
+                for rows in _chunks(reader, chunk_size):
+                    labels = [row[col] if col < len(row) else "" for row in rows]
+                    pending.append((rows, pool.submit(_match_chunk, labels)))
+                    if len(pending) >= 2 * workers:
+                        flush_one()
+                while pending:
+                    flush_one()
+
+    elapsed = time.perf_counter() - start
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    print(
+        f"\nTerminé : {processed} lignes en {elapsed:.1f} s ({rate:,.0f} lignes/s)",
+        file=sys.stderr,
+    )
+    _checkpoint_path(output_path).unlink(missing_ok=True)
+    return processed
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Point d'entrée en ligne de commande."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", type=Path, help="Export CSV/TSV du planning opératoire")
+    parser.add_argument("output", type=Path, help="Fichier de sortie")
+    parser.add_argument(
+        "--column", default="libelle", help="Colonne du libellé (défaut : libelle)"
+    )
+    settings = Settings()
+    parser.add_argument("--data-path", type=Path, default=settings.data_path)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--resume", action="store_true", help="Reprendre après interruption")
+    args = parser.parse_args(argv)
+
+    map_schedule(
+        args.input,
+        args.output,
+        column=args.column,
+        data_path=args.data_path,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        resume=args.resume,
+        search_weights=settings.search_weights,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERREUR : {e}")
+        sys.exit(1)
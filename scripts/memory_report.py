@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Rapport mémoire des données RFE chargées : octets par intervention.
+
+Compare les modèles tels que validés par Pydantic et la représentation
+compacte servie (chaînes internées, protocoles partagés, voir
+``app/data/compact.py``), puis donne l'empreinte du jeu de données complet
+(dépôt et index de recherche compris).
+
+Usage :
+    uv run python scripts/memory_report.py
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from app.config import Settings
+from app.data.compact import compact_rfe_data, deep_sizeof
+from app.data.dataset import Dataset
+from app.data.models import RFEData
+
+
+def main() -> None:
+    """Affiche l'empreinte mémoire avant et après compaction."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-path", type=Path, default=Settings().data_path)
+    args = parser.parse_args()
+
+    raw = json.loads(args.data_path.read_text(encoding="utf-8"))
+    brut = RFEData.model_validate(raw)
+    compact = compact_rfe_data(RFEData.model_validate(raw))
+    nb = sum(len(s.interventions) for s in brut.specialites)
+
+    avant, apres = deep_sizeof(brut), deep_sizeof(compact)
+    # Dépôt et index de recherche compris
+    dataset = deep_sizeof(Dataset.from_data(compact))
+
+    print(f"{nb} interventions")
+    print(f"  Modèles validés         {avant / 1024:8.1f} Kio   {avant / nb:7.0f} o/interv.")
+    print(f"  Représentation compacte {apres / 1024:8.1f} Kio   {apres / nb:7.0f} o/interv.")
+    print(f"  Gain                    {avant / apres:8.1f}x")
+    print(f"  Jeu de données complet  {dataset / 1024:8.1f} Kio   {dataset / nb:7.0f} o/interv.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 """Validation Pydantic du fichier data/rfe.json.
 
+Avec ``--compare``, affiche aussi le rapport des interventions et
+spécialités ajoutées, supprimées ou modifiées par rapport à une version
+précédente du fichier.
+
 Usage :
     uv run python scripts/validate_data.py
+    git show HEAD:data/rfe.json > /tmp/rfe-precedent.json
+    uv run python scripts/validate_data.py --compare /tmp/rfe-precedent.json
 """
 
+import argparse
 import json
 import sys
 from pathlib import Path
 
+from app.data.diff import diff_rfe_data
 from app.data.models import RFEData
 
 DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "rfe.json"
@@ -79,9 +87,60 @@ def validate() -> RFEData:
     return data
 
 
+def report_changes(previous_path: Path, data: RFEData) -> None:
+    """Affiche les modifications de ``data`` par rapport à ``previous_path``.
+
+    Parameters
+    ----------
+    previous_path : Path
+        Version précédente de rfe.json.
+    data : RFEData
+        Données validées de la version courante.
+
+    Raises
+    ------
+    FileNotFoundError
+        Si ``previous_path`` est introuvable.
+    """
+    if not previous_path.exists():
+        msg = f"{previous_path} introuvable."
+        raise FileNotFoundError(msg)
+    previous = RFEData.model_validate_json(previous_path.read_bytes())
+    diff = diff_rfe_data(previous, data)
+
+    print(f"\nModifications depuis {previous_path} ({previous.version}) :")
+    if not diff:
+        print("  Aucune")
+        return
+    sections = [
+        ("Interventions ajoutées", diff.added_interventions),
+        ("Interventions supprimées", diff.removed_interventions),
+        ("Interventions modifiées", diff.modified_interventions),
+        ("Spécialités ajoutées", diff.added_specialites),
+        ("Spécialités supprimées", diff.removed_specialites),
+        ("Spécialités modifiées", diff.modified_specialites),
+    ]
+    for titre, ids in sections:
+        if ids:
+            print(f"  {titre} ({len(ids)}) :")
+            for i in ids:
+                print(f"    - {i}")
+    if diff.reordered:
+        print("  Ordre des spécialités modifié")
+    if diff.metadata_changed:
+        print("  Métadonnées (version, date, recommandations générales) modifiées")
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--compare", type=Path, help="Version précédente de rfe.json (rapport de modifications)"
+    )
+    args = parser.parse_args()
     try:
-        validate()
+        data = validate()
+        if args.compare is not None:
+            report_changes(args.compare, data)
     except (FileNotFoundError, ValueError) as e:
         print(f"ERREUR : {e}")
         sys.exit(1)
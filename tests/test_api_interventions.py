@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
 
-from app.main import app
+from app.api.interventions import InterventionBatchItem
+from app.main import app, settings
 
 
 @pytest.fixture(name="client")
@@ -107,3 +109,62 @@ def test_get_interventions_limit_defaut(client):
     response = client.get("/api/v1/interventions")
     data = response.json()
     assert len(data) <= 50
+
+
+def _premiers_ids(client, n):
+    """Identifiants des n premières interventions."""
+    return [i["id"] for i in client.get(f"/api/v1/interventions?limit={n}").json()]
+
+
+def test_get_interventions_ids_lecture_groupee(client):
+    """GET ?ids= retourne les interventions demandées, dans l'ordre demandé."""
+    ids = _premiers_ids(client, 5)[::-1]
+    response = client.get(f"/api/v1/interventions?ids={','.join(ids)}")
+    assert response.status_code == 200
+    items = response.json()
+    assert [item["id"] for item in items] == ids
+    for item in items:
+        assert item["intervention"] == client.get(f"/api/v1/interventions/{item['id']}").json()
+        assert item["detail"] is None
+
+
+def test_get_interventions_ids_inconnu_signale_par_element(client):
+    """Un identifiant inconnu n'empêche pas de servir les autres."""
+    connu = _premiers_ids(client, 1)[0]
+    items = client.get(f"/api/v1/interventions?ids={connu},inexistante").json()
+    assert items[0]["intervention"]["id"] == connu
+    assert items[1] == {
+        "id": "inexistante",
+        "intervention": None,
+        "detail": "Intervention 'inexistante' non trouvée.",
+    }
+
+
+def test_lecture_groupee_conforme_au_schema(client):
+    """Le corps assemblé est celui du schéma InterventionBatchItem."""
+    ids = [*_premiers_ids(client, 3), "inconnue"]
+    response = client.post("/api/v1/interventions/batch", json={"ids": ids})
+    adapter = TypeAdapter(list[InterventionBatchItem])
+    assert response.content == adapter.dump_json(adapter.validate_json(response.content))
+
+
+def test_post_batch_avec_projection(client):
+    """POST /batch accepte view= et fields= comme les autres endpoints."""
+    ids = _premiers_ids(client, 2)
+    items = client.post("/api/v1/interventions/batch?fields=id,nom", json={"ids": ids}).json()
+    assert [set(item["intervention"]) for item in items] == [{"id", "nom"}] * 2
+
+
+@pytest.mark.parametrize("query", ["ids=", "ids=a&skip=5", "ids=a&cursor="])
+def test_get_interventions_ids_invalide(client, query):
+    """ids vide ou combiné à skip/cursor : 422."""
+    assert client.get(f"/api/v1/interventions?{query}").status_code == 422
+
+
+def test_lecture_groupee_trop_d_identifiants(client, monkeypatch):
+    """Au-delà de interventions_batch_max_ids : 413."""
+    monkeypatch.setattr(settings, "interventions_batch_max_ids", 2)
+    assert client.get("/api/v1/interventions?ids=a,b,c").status_code == 413
+    response = client.post("/api/v1/interventions/batch", json={"ids": ["a", "b", "c"]})
+    assert response.status_code == 413
+    assert client.post("/api/v1/interventions/batch", json={"ids": []}).status_code == 422
@@ -0,0 +1,128 @@
+"""Tests pour l'index BM25 (présélection des grands corpus)."""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.data import search
+from app.data.bm25 import BM25Index, _premiers, tokenize
+from app.data.loader import load_rfe_data
+from app.data.search import SearchIndex, search_candidates, search_interventions_batch
+
+_TEXTES = (
+    "prothese de hanche orthopedie",
+    "protheses de genou et de hanche orthopedie",
+    "arthroscopie de la hanche orthopedie",
+    "voie anterieure voies aeriennes",
+    "appendicectomie chirurgie digestive",
+    "hemicolectomie chirurgie digestive chirurgie",
+)
+
+
+@pytest.fixture(name="index")
+def _index() -> BM25Index:
+    """Index construit sur quelques textes normalisés."""
+    return BM25Index(_TEXTES)
+
+
+@pytest.fixture(name="preselection")
+def _preselection(monkeypatch) -> SearchIndex:
+    """Index des données réelles, avec présélection BM25 malgré leur petite taille."""
+    monkeypatch.setattr(search, "_BM25_DOCUMENTS_MIN", 0)
+    return SearchIndex.from_data(load_rfe_data(Path(__file__).parent.parent / "data" / "rfe.json"))
+
+
+class TestTokenize:
+    """Tests pour tokenize."""
+
+    def test_mots_vides_retires(self):
+        """Articles, prépositions et conjonctions ne sont pas indexés."""
+        assert tokenize("prothese de la hanche et du genou (voie d'abord)") == [
+            "prothese",
+            "hanche",
+            "genou",
+            "voie",
+            "abord",
+        ]
+
+
+class TestBM25Index:
+    """Tests pour BM25Index."""
+
+    def test_impacts_decroissants(self, index):
+        """Listes triées par impact ; à tf égal, le document le plus court d'abord."""
+        assert index.docs["hanche"].tolist() == [0, 2, 1]
+        impacts = index.impacts["hanche"]
+        assert list(impacts) == sorted(impacts, reverse=True)
+        # Terme rare : idf plus élevé
+        assert index.impacts["arthroscopie"][0] > index.impacts["hanche"][0]
+
+    def test_expansions(self, index):
+        """Mot exact (poids 1), mots qui le contiennent, substituts d'un mot inconnu."""
+        assert index.expansions("prothese") == {"prothese": 1.0, "protheses": 1.0}
+        assert index.expansions("colectomie")["hemicolectomie"] == 1.0
+        assert index.expansions("colectomie")["appendicectomie"] < 1
+        typo = index.expansions("prothse")
+        assert set(typo) == {"prothese", "protheses"}
+        assert all(poids < 1 for poids in typo.values())
+        # Mot plus court que la requête : pas de correspondance partielle à l'envers
+        assert "voie" not in index.expansions("voiees")
+
+    def test_tous_les_mots_puis_similarite(self, index):
+        """Les documents qui contiennent tous les mots passent en premier."""
+        assert index.rechercher("hanche genou") == [1, 0, 2]
+        # Mot exact avant les mots approchés (« chirurgie », « arthroscopie »)
+        assert index.rechercher("voie")[0] == 3
+
+    def test_limit_et_requetes_sans_mot(self, index):
+        """limit tronque le classement ; mots vides ou inconnus : aucun document."""
+        assert index.rechercher("hanche", limit=2) == index.rechercher("hanche")[:2]
+        assert index.rechercher("de la") == []
+        assert index.rechercher("xyzabc") == []
+
+    def test_premiers_equivalent_au_tri(self):
+        """La sélection par partitions successives égale un tri lexicographique complet."""
+        rng = np.random.default_rng(0)
+        cles = (rng.integers(0, 3, 500), rng.integers(0, 4, 500) / 2, rng.random(500).round(1))
+        candidats = np.flatnonzero(rng.random(500) < 0.8)
+        ordre = np.lexsort((candidats, *(-cle[candidats] for cle in reversed(cles))))
+        for limit in (1, 10, 57, 1000):
+            retenus = _premiers(candidats, cles, limit)
+            assert sorted(retenus) == sorted(candidats[ordre][:limit])
+
+
+class TestPreselection:
+    """Recherche avec présélection BM25 puis rescoring fuzzy."""
+
+    def test_petit_corpus_sans_index_bm25(self):
+        """Sous le seuil, le balayage complet reste exact et suffisant."""
+        data = load_rfe_data(Path(__file__).parent.parent / "data" / "rfe.json")
+        assert SearchIndex.from_data(data).bm25 is None
+
+    @pytest.mark.parametrize(
+        "query",
+        ["prothese de hanche", "prothse de genou", "cesarienne", "vancomycine", "voie anterieure"],
+    )
+    def test_top_k_identique_au_balayage(self, preselection, query):
+        """Les meilleurs résultats sont ceux du balayage complet."""
+        balayage = dataclasses.replace(preselection, bm25=None)
+        attendu = search.search_interventions(query, balayage, limit=5)
+        resultats = search.search_interventions(query, preselection, limit=5)
+        assert attendu
+        assert [(r.intervention.id, r.score, r.field) for r in resultats] == [
+            (r.intervention.id, r.score, r.field) for r in attendu
+        ]
+
+    def test_candidats_et_lot(self, preselection):
+        """Recherche à facettes et lot passent aussi par la présélection."""
+        candidats = search_candidates("hanche", preselection)
+        assert {r.position for r in candidats} <= set(preselection.bm25.rechercher("hanche"))
+        lot = search_interventions_batch(["prothese de hanche", "han"], preselection, limit=3)
+        assert [r.intervention.id for r in lot[0]] == [
+            r.intervention.id
+            for r in search.search_interventions("prothese de hanche", preselection, limit=3)
+        ]
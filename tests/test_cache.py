@@ -0,0 +1,105 @@
+"""Tests pour le cache LRU borné (app.data.cache)."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.data.cache import CacheStats, LRUCache
+
+
+class _FakeClock:
+    """Horloge manuelle pour tester l'expiration."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Tests pour LRUCache."""
+
+    def test_get_absent_compte_un_miss(self):
+        """Une clé absente retourne None et incrémente misses."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        assert cache.get("a") is None
+        assert cache.stats().misses == 1
+
+    def test_put_puis_get_compte_un_hit(self):
+        """Une clé présente est servie par le cache."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats().hits == 1
+
+    def test_eviction_de_la_moins_recemment_utilisee(self):
+        """Au-delà de maxsize, l'entrée la moins récemment lue est évincée."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" devient la plus ancienne
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats().evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expire_les_entrees(self):
+        """Une entrée expirée est traitée comme absente."""
+        clock = _FakeClock()
+        cache: LRUCache[str, int] = LRUCache(2, ttl=10.0, clock=clock)
+        cache.put("a", 1)
+        clock.now = 9.0
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_get_or_compute_ne_calcule_qu_une_fois(self):
+        """La valeur n'est calculée qu'au premier accès."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        appels = []
+
+        def compute() -> int:
+            appels.append(1)
+            return 42
+
+        assert cache.get_or_compute("a", compute) == 42
+        assert cache.get_or_compute("a", compute) == 42
+        assert len(appels) == 1
+
+    def test_clear_vide_le_cache(self):
+        """clear() vide le cache sans réinitialiser les compteurs."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        assert cache.get("a") is None
+        assert cache.stats() == CacheStats(hits=1, misses=1, evictions=0, size=0, maxsize=2)
+
+    def test_maxsize_invalide(self):
+        """Une capacité nulle est refusée."""
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+    def test_acces_concurrents_coherents(self):
+        """Des accès concurrents ne dépassent jamais maxsize et comptent chaque lecture."""
+        cache: LRUCache[int, int] = LRUCache(16)
+        nb_threads, nb_ops = 8, 500
+
+        def worker(seed: int) -> None:
+            for i in range(nb_ops):
+                cache.get_or_compute((seed * i) % 64, lambda i=i: i)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(nb_threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = cache.stats()
+        assert stats.size <= 16
+        assert stats.hits + stats.misses == nb_threads * nb_ops
@@ -0,0 +1,94 @@
+"""Tests pour la représentation compacte des données RFE."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from app.data.compact import compact_rfe_data, deep_sizeof
+from app.data.loader import load_rfe_data
+from app.data.models import RFEData
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+
+
+@pytest.fixture(name="raw")
+def _raw() -> dict:
+    """Contenu brut de data/rfe.json."""
+    return json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(name="compact")
+def _compact(raw) -> RFEData:
+    """Données compactées."""
+    return compact_rfe_data(RFEData.model_validate(raw))
+
+
+def _interventions(data: RFEData) -> list:
+    return [i for s in data.specialites for i in s.interventions]
+
+
+class TestCompactRfeData:
+    """Tests pour compact_rfe_data."""
+
+    def test_valeurs_inchangees(self, raw, compact):
+        """Les données compactées sont égales et se sérialisent à l'identique."""
+        brut = RFEData.model_validate(raw)
+        assert compact == brut
+        assert compact.model_dump_json() == brut.model_dump_json()
+        assert compact.model_dump_json(exclude_unset=True) == brut.model_dump_json(
+            exclude_unset=True
+        )
+
+    def test_protocoles_partages(self, compact):
+        """Deux protocoles égaux sont une seule instance."""
+        protocoles = {}
+        for intervention in _interventions(compact):
+            for protocole in [intervention.protocole, *(intervention.alternative_allergie or [])]:
+                if protocole is not None:
+                    protocoles.setdefault(protocole.model_dump_json(), set()).add(id(protocole))
+        assert all(len(ids) == 1 for ids in protocoles.values())
+        assert len(protocoles) < sum(1 for i in _interventions(compact) if i.protocole)
+
+    def test_chaines_partagees(self, compact):
+        """La spécialité d'une intervention est la chaîne du nom de sa spécialité."""
+        for specialite in compact.specialites:
+            for intervention in specialite.interventions:
+                assert intervention.specialite is specialite.nom
+
+    def test_empreinte_reduite(self, raw, compact):
+        """La représentation compacte occupe nettement moins de mémoire."""
+        assert deep_sizeof(compact) * 1.5 < deep_sizeof(RFEData.model_validate(raw))
+
+    def test_load_rfe_data_compacte(self):
+        """Le chargement produit directement la représentation compacte."""
+        data = load_rfe_data(_DATA_PATH)
+        premiere, *autres = _interventions(data)
+        assert any(i.protocole is premiere.protocole for i in autres)
+
+    def test_modification_sans_effet_sur_les_autres(self, compact):
+        """Seuls des objets immuables sont partagés entre interventions."""
+        premiere, *autres = _interventions(compact)
+        partage = premiere.protocole
+        voisine = next(i for i in autres if i.protocole is partage)
+        with pytest.raises(ValidationError, match="frozen"):
+            partage.dose_initiale = "1 g"
+        premiere.protocole = None
+        premiere.notes = "Note modifiée"
+        assert voisine.protocole is partage
+        assert voisine.notes != "Note modifiée"
+        assert premiere.model_fields_set is not voisine.model_fields_set
+        alternatives = [i for i in autres if i.alternative_allergie]
+        assert alternatives[0].alternative_allergie is not alternatives[1].alternative_allergie
+
+
+class TestDeepSizeof:
+    """Tests pour deep_sizeof."""
+
+    def test_objets_partages_comptes_une_fois(self):
+        """Un objet référencé deux fois n'est compté qu'une fois."""
+        partage, copie = "".join(["x"] * 1000), "".join(["x"] * 1000)
+        assert deep_sizeof([partage, partage]) + len(copie) < deep_sizeof([partage, copie])
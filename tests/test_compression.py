@@ -0,0 +1,210 @@
+"""Tests pour les corps pré-compressés et la négociation Accept-Encoding."""
+
+from __future__ import annotations
+
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils import compression
+from app.utils.compression import MIN_SIZE, Precompressed, negotiate
+from app.web.static import PrecompressedStaticFiles
+
+_STATIC = Path(__file__).parent.parent / "app" / "static"
+
+requires_brotli = pytest.mark.skipif(
+    compression.brotli is None, reason="module brotli absent (extra « brotli »)"
+)
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+class TestNegotiate:
+    """Tests pour negotiate (Accept-Encoding, RFC 9110)."""
+
+    @pytest.mark.parametrize(
+        ("accept_encoding", "attendu"),
+        [
+            (None, "identity"),
+            ("", "identity"),
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("GZIP", "gzip"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("br;q=0, gzip;q=0", "identity"),
+            ("*", "br"),
+            ("*;q=0.1, br;q=0", "gzip"),
+            ("deflate, identity", "identity"),
+            ("gzip;q=abc", "identity"),
+        ],
+    )
+    def test_choix_du_codage(self, accept_encoding, attendu):
+        """Le codage accepté de plus haute qualité l'emporte, br à égalité."""
+        assert negotiate(accept_encoding, ("br", "gzip")) == attendu
+
+    def test_codage_indisponible(self):
+        """Un codage accepté mais non produit n'est pas choisi."""
+        assert negotiate("br", ("gzip",)) == "identity"
+        assert negotiate("gzip, br", ()) == "identity"
+
+
+class TestPrecompressed:
+    """Tests pour Precompressed."""
+
+    def test_variante_gzip(self):
+        """La variante gzip redonne le corps d'origine."""
+        body = b'{"cle": "valeur"}' * 200
+        compressed = Precompressed.build(body)
+        assert gzip.decompress(compressed.gzip) == body
+        assert "gzip" in compressed.encodings
+
+    @requires_brotli
+    def test_variante_brotli(self):
+        """La variante brotli redonne le corps d'origine et est préférée."""
+        body = b'{"cle": "valeur"}' * 200
+        compressed = Precompressed.build(body)
+        assert compression.brotli.decompress(compressed.br) == body
+        assert compressed.encodings == ("br", "gzip")
+
+    def test_sans_module_brotli(self, monkeypatch):
+        """Sans le module brotli, seule la variante gzip est produite."""
+        monkeypatch.setattr(compression, "brotli", None)
+        compressed = Precompressed.build(b'{"cle": "valeur"}' * 200)
+        assert compressed.encodings == ("gzip",)
+        assert compressed.select("br, gzip")[0] == "gzip"
+
+    def test_petit_corps_non_compresse(self):
+        """Sous MIN_SIZE, aucune variante n'est produite."""
+        compressed = Precompressed.build(b"x" * (MIN_SIZE - 1))
+        assert compressed.encodings == ()
+        assert compressed.select("gzip, br") == ("identity", b"x" * (MIN_SIZE - 1))
+
+    def test_corps_incompressible(self):
+        """Une variante plus grosse que l'original est écartée."""
+        compressed = Precompressed.build(os.urandom(4096))
+        assert compressed.encodings == ()
+
+
+class TestApi:
+    """Réponses de l'API servies pré-compressées."""
+
+    @pytest.mark.parametrize(
+        "url", ["/api/v1/specialites", "/api/v1/specialites/chirurgie-orthopedique-programmee"]
+    )
+    @pytest.mark.parametrize("coding", [pytest.param("br", marks=requires_brotli), "gzip"])
+    def test_variante_negociee(self, client, url, coding):
+        """Le codage demandé est servi, et décodé donne le JSON non compressé."""
+        identity = client.get(url, headers={"Accept-Encoding": "identity"})
+        response = client.get(url, headers={"Accept-Encoding": coding})
+
+        assert response.headers["content-encoding"] == coding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(identity.content)
+        assert response.content == identity.content
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["vary"] == "Accept-Encoding"
+
+    def test_corps_compresse_une_fois(self, client):
+        """Les octets servis sont ceux construits pour la génération."""
+        body = client.app.state.datasets.current.responses.specialites_list
+        response = client.get("/api/v1/specialites", headers={"Accept-Encoding": "gzip"})
+        assert response.num_bytes_downloaded == len(body.gzip)
+
+    def test_intervention_non_negociee(self, client):
+        """Les petits corps assemblés à la requête ne sont pas compressés."""
+        response = client.get("/api/v1/interventions?limit=5", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+
+    def test_etag_propre_a_chaque_codage(self, client):
+        """Chaque représentation a son ETag ; le 304 ne porte pas Content-Encoding."""
+        etags = {
+            coding: client.get("/api/v1/specialites", headers={"Accept-Encoding": coding}).headers[
+                "etag"
+            ]
+            for coding in ("deflate", "gzip", "identity")
+        }
+        assert etags["deflate"] == etags["identity"]
+        assert etags["gzip"] != etags["identity"]
+
+        revalidation = client.get(
+            "/api/v1/specialites",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etags["gzip"]},
+        )
+        assert revalidation.status_code == 304
+        assert revalidation.headers["vary"] == "Accept-Encoding"
+        assert "content-encoding" not in revalidation.headers
+
+        autre_codage = client.get(
+            "/api/v1/specialites",
+            headers={"Accept-Encoding": "identity", "If-None-Match": etags["gzip"]},
+        )
+        assert autre_codage.status_code == 200
+
+
+class TestStaticFiles:
+    """Fichiers statiques pré-compressés au démarrage."""
+
+    @pytest.mark.parametrize("coding", [pytest.param("br", marks=requires_brotli), "gzip"])
+    def test_script_compresse(self, client, coding):
+        """htmx.min.js est servi compressé, identique au fichier une fois décodé."""
+        response = client.get("/static/js/htmx.min.js", headers={"Accept-Encoding": coding})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == coding
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["content-type"].startswith("text/javascript")
+        assert response.content == (_STATIC / "js" / "htmx.min.js").read_bytes()
+
+    def test_sans_accept_encoding(self, client):
+        """Sans codage accepté, le fichier est servi tel quel."""
+        response = client.get("/static/css/layout.css", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.content == (_STATIC / "css" / "layout.css").read_bytes()
+
+    def test_304_par_codage(self, client):
+        """L'ETag d'une variante compressée la revalide, pas les autres."""
+        url = "/static/js/htmx.min.js"
+        etag = client.get(url, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        assert etag.endswith('-gzip"')
+        assert (
+            client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}).status_code
+            == 304
+        )
+        assert (
+            client.get(
+                url, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+            ).status_code
+            == 200
+        )
+
+    def test_image_non_compressee(self, client):
+        """Les images ne sont pas recompressées."""
+        response = client.get("/static/img/logo_sfar.png", headers={"Accept-Encoding": "br"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_fichier_modifie_apres_demarrage(self, tmp_path):
+        """Un fichier modifié depuis le démarrage est servi depuis le disque."""
+        fichier = tmp_path / "style.css"
+        fichier.write_text("body { margin: 0; }\n" * 200)
+        static = FastAPI()
+        static.mount("/static", PrecompressedStaticFiles(directory=str(tmp_path)))
+        client = TestClient(static)
+        compresse = client.get("/static/style.css", headers={"Accept-Encoding": "gzip"})
+        assert compresse.headers["content-encoding"] == "gzip"
+
+        fichier.write_text("body { margin: 1px; }\n" * 200)
+        response = client.get("/static/style.css", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text == fichier.read_text()
@@ -0,0 +1,122 @@
+"""Tests pour les requêtes conditionnelles (ETag, Last-Modified, 304)."""
+
+from __future__ import annotations
+
+import datetime
+from email.utils import parsedate_to_datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app, settings
+from app.utils import http
+from app.utils.http import make_etag
+
+_RESSOURCES = [
+    "/api/v1/specialites",
+    "/api/v1/specialites/chirurgie-orthopedique-programmee",
+    "/api/v1/interventions?skip=10&limit=5",
+    "/api/v1/interventions/ortho-prog-mi-prothese-hanche-genou",
+    "/",
+    "/specialites",
+    "/specialites/chirurgie-orthopedique-programmee",
+    "/protocole/ortho-prog-mi-prothese-hanche-genou",
+]
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+class TestConditionalGet:
+    """Tests pour ETag / If-None-Match / If-Modified-Since."""
+
+    @pytest.mark.parametrize("url", _RESSOURCES)
+    def test_304_si_etag_identique(self, client, url):
+        """Une copie à jour reçoit 304 sans corps, avec les mêmes validateurs."""
+        response = client.get(url)
+        etag = response.headers["etag"]
+        assert response.status_code == 200
+        assert etag.startswith('"')
+        assert response.headers["cache-control"] == "no-cache"
+
+        revalidation = client.get(url, headers={"If-None-Match": etag})
+
+        assert revalidation.status_code == 304
+        assert revalidation.content == b""
+        assert revalidation.headers["etag"] == etag
+        assert revalidation.headers["last-modified"] == response.headers["last-modified"]
+
+    def test_etag_propre_a_chaque_ressource(self, client):
+        """Deux ressources ou deux pages différentes ont des ETag différents."""
+        etags = {client.get(url).headers["etag"] for url in _RESSOURCES}
+        etags.add(client.get("/api/v1/interventions?skip=15&limit=5").headers["etag"])
+        assert len(etags) == len(_RESSOURCES) + 1
+
+    def test_etag_different_donne_200(self, client):
+        """Un ETag périmé reçoit la réponse complète."""
+        response = client.get("/api/v1/specialites", headers={"If-None-Match": '"perime"'})
+        assert response.status_code == 200
+        assert response.json()
+
+    def test_liste_d_etags_et_etag_faible(self, client):
+        """If-None-Match accepte une liste et la forme faible W/."""
+        etag = client.get("/specialites").headers["etag"]
+        response = client.get("/specialites", headers={"If-None-Match": f'"autre", W/{etag}'})
+        assert response.status_code == 304
+
+    def test_if_modified_since(self, client):
+        """Sans If-None-Match, If-Modified-Since à la date servie donne 304."""
+        last_modified = client.get("/api/v1/specialites").headers["last-modified"]
+        response = client.get("/api/v1/specialites", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+        ancien = client.get(
+            "/api/v1/specialites",
+            headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"},
+        )
+        assert ancien.status_code == 200
+
+    def test_if_modified_since_avant_demarrage(self, client, monkeypatch):
+        """Données inchangées mais processus redémarré (déploiement) : pas de 304."""
+        last_modified = client.get("/").headers["last-modified"]
+        redemarrage = parsedate_to_datetime(last_modified) + datetime.timedelta(hours=1)
+        monkeypatch.setattr(http, "_STARTED_AT", redemarrage)
+        response = client.get("/", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 200
+        assert parsedate_to_datetime(response.headers["last-modified"]) == redemarrage
+
+    def test_if_none_match_prime(self, client):
+        """If-None-Match périmé l'emporte sur un If-Modified-Since à jour."""
+        last_modified = client.get("/").headers["last-modified"]
+        response = client.get(
+            "/", headers={"If-None-Match": '"perime"', "If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 200
+
+    def test_404_sans_validateurs(self, client):
+        """Une ressource inconnue n'a pas d'ETag."""
+        response = client.get("/api/v1/interventions/inexistante", headers={"If-None-Match": "*"})
+        assert response.status_code == 404
+        assert "etag" not in response.headers
+
+    def test_cache_control_configurable(self, client, monkeypatch):
+        """Cache-Control provient de Settings (API et pages séparément)."""
+        monkeypatch.setattr(settings, "api_cache_control", "public, max-age=300")
+        monkeypatch.setattr(settings, "html_cache_control", "private, max-age=60")
+        api = client.get("/api/v1/specialites")
+        page = client.get("/specialites")
+        assert api.headers["cache-control"] == "public, max-age=300"
+        assert page.headers["cache-control"] == "private, max-age=60"
+
+
+class TestMakeEtag:
+    """Tests pour make_etag."""
+
+    def test_depend_de_l_empreinte_et_de_la_ressource(self):
+        """L'ETag change avec le contenu ou la ressource, et est stable sinon."""
+        assert make_etag("a", "/x") == make_etag("a", "/x")
+        assert make_etag("a", "/x") != make_etag("b", "/x")
+        assert make_etag("a", "/x") != make_etag("a", "/y")
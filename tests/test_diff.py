@@ -0,0 +1,235 @@
+"""Tests pour la différence structurelle et la réindexation incrémentale."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.data.cache import LRUCache
+from app.data.dataset import Dataset
+from app.data.diff import RFEDiff, diff_rfe_data, share_unchanged
+from app.data.models import RFEData
+from app.data.ngram import NGramIndex
+from app.data.search import carry_over_search_cache, search_interventions_cached
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+
+
+@pytest.fixture(name="raw")
+def _raw() -> dict:
+    """Contenu brut de data/rfe.json, modifiable par le test."""
+    return json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture(name="dataset")
+def _dataset(raw) -> Dataset:
+    """Jeu de données construit à partir des vraies données."""
+    return Dataset.from_data(RFEData.model_validate(raw))
+
+
+def _assert_equivalents(patched: Dataset, rebuilt: Dataset) -> None:
+    """Vérifie qu'un jeu de données patché est identique à une reconstruction complète."""
+    assert patched.rfe_data == rebuilt.rfe_data
+    index, attendu = patched.search_index, rebuilt.search_index
+    assert index.choices == attendu.choices
+    assert index.interventions == attendu.interventions
+    assert index.noms == attendu.noms
+    assert index.noms_offsets == attendu.noms_offsets
+    assert index.version == attendu.version
+    assert index.ngrams.postings == attendu.ngrams.postings
+    repository = patched.repository
+    assert repository.interventions == rebuilt.repository.interventions
+    for intervention in rebuilt.repository.interventions:
+        assert repository.get_intervention(intervention.id) == intervention
+        assert repository.specialite_de(intervention.id) == rebuilt.repository.specialite_de(
+            intervention.id
+        )
+    for specialite in rebuilt.repository.specialites:
+        assert repository.get_specialite(specialite.id) == specialite
+        assert repository.get_specialite_par_nom(specialite.nom) == specialite
+
+
+class TestDiffRfeData:
+    """Tests pour diff_rfe_data."""
+
+    def test_donnees_identiques(self, dataset, raw):
+        """Deux chargements du même fichier ne diffèrent pas."""
+        diff = diff_rfe_data(dataset.rfe_data, RFEData.model_validate(raw))
+        assert not diff
+        assert diff == RFEDiff()
+
+    def test_ajout_suppression_modification(self, dataset, raw):
+        """Les enregistrements sont appariés par identifiant."""
+        specialites = raw["specialites"]
+        modifiee = specialites[0]["interventions"][0]
+        modifiee["protocole"] = {"molecule": "Céfazoline", "dose_initiale": "4g"}
+        supprimee = specialites[1]["interventions"].pop()
+        ajoutee = dict(specialites[1]["interventions"][0], id="nouvelle-intervention")
+        specialites[2]["interventions"].append(ajoutee)
+
+        diff = diff_rfe_data(dataset.rfe_data, RFEData.model_validate(raw))
+
+        assert diff.modified_interventions == (modifiee["id"],)
+        assert diff.removed_interventions == (supprimee["id"],)
+        assert diff.added_interventions == ("nouvelle-intervention",)
+        assert diff.modified_specialites == (specialites[1]["id"], specialites[2]["id"])
+        assert not diff.metadata_changed
+
+    def test_specialite_supprimee(self, dataset, raw):
+        """Une spécialité supprimée entraîne la suppression de ses interventions."""
+        supprimee = raw["specialites"].pop()
+
+        diff = diff_rfe_data(dataset.rfe_data, RFEData.model_validate(raw))
+
+        assert diff.removed_specialites == (supprimee["id"],)
+        assert set(diff.removed_interventions) == {i["id"] for i in supprimee["interventions"]}
+
+    def test_metadonnees(self, dataset, raw):
+        """Un changement de version est signalé sans toucher aux enregistrements."""
+        raw["version"] = "autre version"
+
+        diff = diff_rfe_data(dataset.rfe_data, RFEData.model_validate(raw))
+
+        assert diff.metadata_changed
+        assert not diff.changed_interventions
+
+
+class TestShareUnchanged:
+    """Tests pour share_unchanged."""
+
+    def test_objets_inchanges_partages(self, dataset, raw):
+        """Seuls les enregistrements modifiés sont de nouveaux objets."""
+        raw["specialites"][0]["interventions"][0]["notes"] = "Note corrigée"
+        new = RFEData.model_validate(raw)
+        diff = diff_rfe_data(dataset.rfe_data, new)
+
+        shared = share_unchanged(dataset.rfe_data, new, diff)
+
+        assert shared == new
+        old_specialites = dataset.rfe_data.specialites
+        assert shared.specialites[0] is not old_specialites[0]
+        assert shared.specialites[0].interventions[0].notes == "Note corrigée"
+        assert shared.specialites[0].interventions[1] is old_specialites[0].interventions[1]
+        assert all(
+            a is b for a, b in zip(shared.specialites[1:], old_specialites[1:], strict=True)
+        )
+
+
+class TestDatasetPatched:
+    """Tests pour Dataset.patched : équivalence avec une reconstruction complète."""
+
+    def test_sans_changement(self, dataset, raw):
+        """Sans modification, le même jeu de données est conservé."""
+        patched, diff = dataset.patched(RFEData.model_validate(raw))
+        assert patched is dataset
+        assert not diff
+
+    def test_modification_hors_texte_indexe(self, dataset, raw):
+        """Une dose corrigée ne ré-indexe aucun texte."""
+        raw["specialites"][0]["interventions"][0]["protocole"] = {
+            "molecule": "Céfazoline",
+            "dose_initiale": "4g",
+        }
+        new = RFEData.model_validate(raw)
+
+        patched, _ = dataset.patched(new)
+
+        _assert_equivalents(patched, Dataset.from_data(new))
+        postings = patched.search_index.ngrams.postings
+        assert postings["han"] is dataset.search_index.ngrams.postings["han"]
+
+    def test_renommage(self, dataset, raw):
+        """Un nom modifié est ré-indexé à la même position."""
+        raw["specialites"][0]["interventions"][0]["nom"] = "Zygomatoplastie"
+        new = RFEData.model_validate(raw)
+
+        patched, _ = dataset.patched(new)
+
+        _assert_equivalents(patched, Dataset.from_data(new))
+
+    def test_ajouts_et_suppressions(self, dataset, raw):
+        """Ajouts et suppressions décalent les positions sans reconstruction complète."""
+        specialites = raw["specialites"]
+        specialites[1]["interventions"].pop(0)
+        specialites[0]["interventions"].insert(
+            1, dict(specialites[0]["interventions"][0], id="ajout-1", nom="Ostéotomie inédite")
+        )
+        specialites.pop()
+        new = RFEData.model_validate(raw)
+
+        patched, diff = dataset.patched(new)
+
+        assert diff.added_interventions == ("ajout-1",)
+        _assert_equivalents(patched, Dataset.from_data(new))
+
+    def test_reordonnancement(self, dataset, raw):
+        """Un changement d'ordre des spécialités reconstruit les n-grammes à l'identique."""
+        raw["specialites"].reverse()
+        new = RFEData.model_validate(raw)
+
+        patched, diff = dataset.patched(new)
+
+        assert diff.reordered
+
+        _assert_equivalents(patched, Dataset.from_data(new))
+
+
+class TestNGramIndexPatched:
+    """Tests pour NGramIndex.patched."""
+
+    @pytest.mark.parametrize(
+        ("textes", "anciens"),
+        [
+            (("abc", "xbcd", "hanche"), [0, None, 2]),
+            (("abc", "hanche"), [0, 2]),
+            (("nouveau", "abc", "bcd", "hanche", "fin"), [None, 0, 1, 2, None]),
+            (("hanche", "abc"), [2, 0]),
+        ],
+    )
+    def test_equivalent_a_une_reconstruction(self, textes, anciens):
+        """Le résultat est identique à un index construit directement."""
+        index = NGramIndex(("abc", "bcd", "hanche"))
+        patched = index.patched(textes, anciens)
+        assert patched.postings == NGramIndex(textes).postings
+        # L'index d'origine n'est pas modifié
+        assert index.postings == NGramIndex(("abc", "bcd", "hanche")).postings
+
+
+class TestCarryOverSearchCache:
+    """Tests pour carry_over_search_cache."""
+
+    def test_reprise_sauf_interventions_modifiees(self, dataset, raw):
+        """Les résultats sans intervention modifiée sont repris sous la nouvelle version."""
+        intervention = raw["specialites"][0]["interventions"][0]
+        intervention["source_page"] += 1  # champ non indexé pour la recherche
+        ancien_cache = LRUCache(16)
+        search_interventions_cached(intervention["nom"], dataset.search_index, ancien_cache)
+        search_interventions_cached("appendicectomie", dataset.search_index, ancien_cache)
+        patched, diff = dataset.patched(RFEData.model_validate(raw))
+        nouveau_cache = LRUCache(16)
+
+        reprises = carry_over_search_cache(
+            ancien_cache, nouveau_cache, dataset.search_index, patched.search_index, diff
+        )
+
+        assert reprises == 1
+        results = search_interventions_cached(
+            "appendicectomie", patched.search_index, nouveau_cache
+        )
+        assert results
+        assert nouveau_cache.stats().hits == 1
+
+    def test_pas_de_reprise_si_texte_modifie(self, dataset, raw):
+        """Un texte indexé modifié invalide tout le cache."""
+        raw["specialites"][0]["interventions"][0]["nom"] = "Zygomatoplastie"
+        ancien_cache = LRUCache(16)
+        search_interventions_cached("appendicectomie", dataset.search_index, ancien_cache)
+        patched, diff = dataset.patched(RFEData.model_validate(raw))
+
+        reprises = carry_over_search_cache(
+            ancien_cache, LRUCache(16), dataset.search_index, patched.search_index, diff
+        )
+
+        assert reprises == 0
@@ -0,0 +1,47 @@
+"""Tests pour l'exécuteur borné de la recherche web (délestage)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from app.web.executor import BoundedExecutor, SearchOverloadedError
+
+
+class TestBoundedExecutor:
+    """Tests pour BoundedExecutor."""
+
+    def test_run_retourne_le_resultat(self):
+        """La fonction s'exécute dans le pool et son résultat est retourné."""
+        executor = BoundedExecutor(max_workers=2, max_queue=0)
+
+        async def scenario() -> tuple[int, str]:
+            total = await executor.run(lambda a, b: a + b, 1, b=2)
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+            return total, thread_name
+
+        total, thread_name = asyncio.run(scenario())
+        executor.shutdown()
+        assert total == 3
+        assert thread_name.startswith("search")
+
+    def test_file_saturee_leve_overloaded(self):
+        """Au-delà de max_workers + max_queue tâches, la nouvelle tâche est refusée."""
+        executor = BoundedExecutor(max_workers=1, max_queue=1)
+        libere = threading.Event()
+
+        async def scenario() -> None:
+            taches = [asyncio.create_task(executor.run(libere.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            assert executor.in_flight == 2
+            assert executor.saturated
+            with pytest.raises(SearchOverloadedError):
+                await executor.run(lambda: None)
+            libere.set()
+            await asyncio.gather(*taches)
+            assert executor.in_flight == 0
+
+        asyncio.run(scenario())
+        executor.shutdown()
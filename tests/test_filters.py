@@ -0,0 +1,154 @@
+"""Tests pour les index inversés en bitsets et le filtrage des interventions."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.data.filters import FILTER_FIELDS, FilterIndex, bit_positions
+from app.main import app
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(name="repository")
+def _repository(client):
+    """Dépôt de la génération servie."""
+    return client.app.state.datasets.current.repository
+
+
+def _molecules(intervention) -> set[str]:
+    """Molécules du protocole standard et des alternatives allergie."""
+    protocoles = [intervention.protocole, *(intervention.alternative_allergie or [])]
+    return {p.molecule.value for p in protocoles if p is not None}
+
+
+class TestBitPositions:
+    """Tests pour bit_positions."""
+
+    def test_positions_croissantes(self):
+        """Les positions des bits à 1 sont énumérées par ordre croissant."""
+        assert bit_positions(0b1010_0110) == [1, 2, 5, 7]
+        assert bit_positions(0) == []
+
+    def test_pagination(self):
+        """skip et limit portent sur le rang des bits à 1."""
+        bits = sum(1 << i for i in range(0, 100, 3))
+        assert bit_positions(bits, skip=2, limit=3) == [6, 9, 12]
+        assert bit_positions(bits, skip=40) == []
+
+
+class TestFilterIndex:
+    """Tests pour FilterIndex."""
+
+    def test_chaque_critere_conforme_au_parcours(self, repository):
+        """Pour chaque critère et valeur, le bitset égale un filtrage naïf."""
+        index = FilterIndex.from_interventions(repository.interventions)
+        assert set(index.bitsets) == set(FILTER_FIELDS)
+        for field, par_valeur in index.bitsets.items():
+            for valeur, bits in par_valeur.items():
+                attendu = [
+                    i
+                    for i, intervention in enumerate(repository.interventions)
+                    if (
+                        valeur in _molecules(intervention)
+                        if field == "molecule"
+                        else getattr(intervention, field) == valeur
+                    )
+                ]
+                assert bit_positions(bits) == attendu, (field, valeur)
+
+    def test_select_intersection_et_union(self, repository):
+        """« Ou » entre valeurs d'un critère, « et » entre critères."""
+        index = FilterIndex.from_interventions(repository.interventions)
+        criteria = {
+            "molecule": ["Céfazoline", "Clindamycine"],
+            "force_recommandation": ["GRADE 1"],
+        }
+        attendu = [
+            i
+            for i, intervention in enumerate(repository.interventions)
+            if _molecules(intervention) & {"Céfazoline", "Clindamycine"}
+            and intervention.force_recommandation == "GRADE 1"
+        ]
+        assert attendu
+        assert bit_positions(index.select(criteria)) == attendu
+        assert index.select({}) == index.all
+        assert index.select({"sous_categorie": ["inconnue"], "molecule": ["Céfazoline"]}) == 0
+
+    def test_facettes_disjonctives(self, repository):
+        """Les comptes d'une facette ignorent son propre critère, pas ceux des autres."""
+        index = FilterIndex.from_interventions(repository.interventions)
+        candidates = index.all
+        criteria = {"force_recommandation": ["GRADE 1"], "molecule": ["Céfazoline"]}
+        retenues, facets = index.facets(candidates, criteria)
+        assert retenues == index.select(criteria)
+        assert facets["force_recommandation"] == {
+            valeur: n
+            for valeur, bits in index.bitsets["force_recommandation"].items()
+            if (n := (bits & index.match("molecule", ["Céfazoline"])).bit_count())
+        }
+        assert sum(facets["specialite"].values()) == retenues.bit_count()
+        assert list(facets["molecule"].values()) == sorted(facets["molecule"].values())[::-1]
+
+
+class TestApi:
+    """Filtres de GET /api/v1/interventions."""
+
+    def test_molecule_protocole_ou_alternative(self, client, repository):
+        """molecule= retient les interventions dont un protocole utilise la molécule."""
+        response = client.get(
+            "/api/v1/interventions",
+            params={"molecule": "Clindamycine + Gentamicine", "limit": 200},
+        )
+        assert response.status_code == 200
+        attendu = [
+            i.id for i in repository.interventions if "Clindamycine + Gentamicine" in _molecules(i)
+        ]
+        assert attendu
+        assert [i["id"] for i in response.json()] == attendu[:200]
+        assert response.headers["x-total-count"] == str(len(attendu))
+
+    def test_criteres_combines(self, client, repository):
+        """GRADE 1 dans un tableau donné, avec pagination."""
+        tableau = repository.interventions[0].source_tableau
+        attendu = [
+            i.id
+            for i in repository.interventions
+            if i.source_tableau == tableau and i.force_recommandation == "GRADE 1"
+        ]
+        params = {"source_tableau": tableau, "force_recommandation": "GRADE 1"}
+        response = client.get("/api/v1/interventions", params={**params, "skip": 1, "limit": 2})
+        assert [i["id"] for i in response.json()] == attendu[1:3]
+        assert response.headers["x-total-count"] == str(len(attendu))
+
+    def test_specialite_par_identifiant_ou_nom(self, client, repository):
+        """specialite= accepte l'identifiant ou le nom de la spécialité."""
+        specialite = repository.specialites[1]
+        par_id = client.get(
+            "/api/v1/interventions", params={"specialite": specialite.id, "limit": 200}
+        )
+        par_nom = client.get(
+            "/api/v1/interventions", params={"specialite": specialite.nom, "limit": 200}
+        )
+        assert par_id.content == par_nom.content
+        assert [i["id"] for i in par_id.json()] == [i.id for i in specialite.interventions]
+
+    def test_source_page_et_projection(self, client, repository):
+        """source_page= se combine avec fields=."""
+        page = repository.interventions[5].source_page
+        response = client.get(f"/api/v1/interventions?source_page={page}&fields=id,source_page")
+        assert response.json()
+        assert all(item == {"id": item["id"], "source_page": page} for item in response.json())
+
+    @pytest.mark.parametrize(
+        "query", ["molecule=Inconnue", "source_page=abc", "molecule=Céfazoline&cursor="]
+    )
+    def test_parametres_invalides(self, client, query):
+        """Valeur hors énumération, page non entière, filtre avec curseur : 422."""
+        assert client.get(f"/api/v1/interventions?{query}").status_code == 422
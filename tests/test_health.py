@@ -27,3 +27,11 @@ def test_health_contient_statistiques(client):
     data = response.json()
     assert data["specialites"] >= 2
     assert data["interventions"] >= 40
+
+
+def test_health_expose_compteurs_cache_recherche(client):
+    client.get("/api/v1/search", params={"q": "hanche"})
+    client.get("/api/v1/search", params={"q": "hanche"})
+    stats = client.get("/api/v1/health").json()["search_cache"]
+    assert stats["hits"] >= 1
+    assert {"misses", "evictions", "size", "maxsize"} <= stats.keys()
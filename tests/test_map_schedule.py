@@ -0,0 +1,154 @@
+"""Tests pour le rapprochement en masse du planning opératoire (scripts/map_schedule.py)."""
+
+from __future__ import annotations
+
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts import map_schedule
+from scripts.map_schedule import _checkpoint_path, _chunks
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+
+# Libellés accentués : les offsets de reprise sont en octets, pas en caractères
+_LIBELLES = [
+    "prothèse de hanche",
+    "ostéotomie",
+    "césarienne",
+    "arthroscopie genou",
+    "hernie inguinale",
+    "cholécystectomie",
+    "libellé inconnu xyz",
+]
+
+
+class _Interruption(Exception):
+    """Arrêt simulé du script entre deux lots."""
+
+
+@pytest.fixture(name="planning")
+def _planning(tmp_path) -> Path:
+    """Export CSV du planning : identifiant de ligne et libellé."""
+    path = tmp_path / "planning.csv"
+    with path.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["ligne", "libelle"])
+        writer.writerows([str(i), libelle] for i, libelle in enumerate(_LIBELLES))
+    return path
+
+
+def _run(planning: Path, output: Path, *, resume: bool = False) -> int:
+    return map_schedule.map_schedule(
+        planning,
+        output,
+        column="libelle",
+        data_path=DATA_PATH,
+        workers=1,
+        chunk_size=2,
+        resume=resume,
+    )
+
+
+def _interrupted_run(planning: Path, output: Path, monkeypatch) -> None:
+    """Exécution arrêtée après le premier point de reprise, un lot déjà écrit au-delà."""
+    write_checkpoint = map_schedule._write_checkpoint
+    calls = []
+
+    def interrupt(*args) -> None:
+        calls.append(args)
+        if len(calls) > 1:
+            raise _Interruption
+        write_checkpoint(*args)
+
+    monkeypatch.setattr(map_schedule, "_write_checkpoint", interrupt)
+    with pytest.raises(_Interruption):
+        _run(planning, output)
+    monkeypatch.setattr(map_schedule, "_write_checkpoint", write_checkpoint)
+
+
+@pytest.fixture(name="reference")
+def _reference(planning, tmp_path) -> bytes:
+    """Sortie d'une exécution complète, sans interruption."""
+    output = tmp_path / "reference.csv"
+    assert _run(planning, output) == len(_LIBELLES)
+    return output.read_bytes()
+
+
+class TestChunks:
+    """Tests pour _chunks."""
+
+    def test_bornes_des_lots(self):
+        """Lots pleins puis un dernier lot partiel ; aucun lot vide."""
+        rows = [[str(i)] for i in range(7)]
+        assert [len(c) for c in _chunks(iter(rows), 3)] == [3, 3, 1]
+        assert [len(c) for c in _chunks(iter(rows[:6]), 3)] == [3, 3]
+        assert list(_chunks(iter([]), 3)) == []
+        assert [c for chunk in _chunks(iter(rows), 3) for c in chunk] == rows
+
+
+class TestMapSchedule:
+    """Tests pour map_schedule."""
+
+    def test_sortie_complete(self, reference, tmp_path):
+        """Une ligne par libellé, correspondance en fin de ligne, point de reprise supprimé."""
+        lines = list(csv.reader(reference.decode("utf-8").splitlines()))
+        assert lines[0] == ["ligne", "libelle", *map_schedule.OUTPUT_COLUMNS]
+        assert [line[1] for line in lines[1:]] == _LIBELLES
+        assert lines[1][2] == "ortho-prog-mi-prothese-hanche-genou"
+        assert not _checkpoint_path(tmp_path / "reference.csv").exists()
+
+    def test_reprise_apres_interruption(self, planning, reference, tmp_path, monkeypatch):
+        """La reprise tronque le lot écrit après le point de reprise et termine la sortie."""
+        output = tmp_path / "sortie.csv"
+        _interrupted_run(planning, output, monkeypatch)
+        state = json.loads(_checkpoint_path(output).read_text(encoding="utf-8"))
+        assert state["rows_done"] == 2
+        assert output.stat().st_size > state["output_bytes"]
+
+        assert _run(planning, output, resume=True) == len(_LIBELLES) - 2
+        assert output.read_bytes() == reference
+        assert not _checkpoint_path(output).exists()
+
+    def test_reprise_sortie_absente(self, planning, reference, tmp_path, monkeypatch):
+        """Sortie supprimée depuis l'interruption : tout est retraité."""
+        output = tmp_path / "sortie.csv"
+        _interrupted_run(planning, output, monkeypatch)
+        output.unlink()
+
+        assert _run(planning, output, resume=True) == len(_LIBELLES)
+        assert output.read_bytes() == reference
+
+    def test_colonne_absente(self, planning, tmp_path):
+        """Colonne du libellé introuvable : ValueError."""
+        with pytest.raises(ValueError, match="absente"):
+            map_schedule.map_schedule(
+                planning,
+                tmp_path / "sortie.csv",
+                column="intitule",
+                data_path=DATA_PATH,
+                workers=1,
+                chunk_size=2,
+                resume=False,
+            )
+
+    def test_entree_vide(self, tmp_path):
+        """Fichier sans ligne d'en-tête : ValueError, pas de StopIteration."""
+        vide = tmp_path / "vide.csv"
+        vide.write_text("", encoding="utf-8")
+        with pytest.raises(ValueError, match="vide"):
+            _run(vide, tmp_path / "sortie.csv")
+
+
+class TestInitWorker:
+    """Tests pour _init_worker."""
+
+    def test_poids_de_la_configuration(self, monkeypatch):
+        """L'index du processus porte les poids de champs configurés, comme /search."""
+        monkeypatch.setattr(map_schedule, "_INDEX", None)
+        map_schedule._init_worker(DATA_PATH)
+        assert "notes" in dict(map_schedule._INDEX.weights)
+        map_schedule._init_worker(DATA_PATH, {"notes": 0.0})
+        assert "notes" not in dict(map_schedule._INDEX.weights)
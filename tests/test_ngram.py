@@ -0,0 +1,59 @@
+"""Tests pour l'index inversé de n-grammes (requêtes courtes)."""
+
+from __future__ import annotations
+
+from array import array
+
+import pytest
+
+from app.data.ngram import NGramIndex
+
+_TEXTES = (
+    "prothese de hanche orthopedie",
+    "arthroscopie de la hanche orthopedie",
+    "chirurgie de la main orthopedie",
+    "hanche (reprise) orthopedie",
+    "appendicectomie chirurgie digestive",
+)
+
+
+@pytest.fixture(name="index")
+def _index() -> NGramIndex:
+    """Index construit sur quelques textes normalisés."""
+    return NGramIndex(_TEXTES)
+
+
+class TestNGramIndex:
+    """Tests pour NGramIndex."""
+
+    def test_postings_compacts_et_tries(self, index):
+        """Les listes de documents sont des array('I') triées sans doublon."""
+        liste = index.postings["han"]
+        assert isinstance(liste, array)
+        assert liste.typecode == "I"
+        assert list(liste) == sorted(set(liste))
+
+    @pytest.mark.parametrize("query", ["h", "an", "han", "ie ", "hanche", "de la", "zzz"])
+    def test_candidats_equivalents_a_un_scan(self, index, query):
+        """Les candidats sont exactement les textes contenant la requête."""
+        attendu = {doc for doc, texte in enumerate(_TEXTES) if query in texte}
+        assert index.candidats(query) == attendu
+
+    def test_debut_de_texte_puis_debut_de_mot(self, index):
+        """Classement : début de texte, puis début de mot, puis sous-chaîne."""
+        assert index.rechercher("han") == [3, 0, 1]
+
+    def test_sous_chaine_en_milieu_de_mot_en_dernier(self, index):
+        """Une occurrence en milieu de mot passe après les débuts de mot."""
+        docs = index.rechercher("ect")
+        assert docs == [4]  # "appendicectomie" : milieu de mot seulement
+        docs = index.rechercher("ap")
+        assert docs[0] == 4  # "appendicectomie" en début de texte
+
+    def test_limit(self, index):
+        """Le paramètre limit tronque le classement."""
+        assert len(index.rechercher("e", limit=2)) == 2
+
+    def test_requete_vide(self, index):
+        """Une requête vide ne retourne rien."""
+        assert index.rechercher("") == []
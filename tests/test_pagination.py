@@ -0,0 +1,158 @@
+"""Tests pour la pagination par curseur des interventions."""
+
+from __future__ import annotations
+
+import copy
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.data.pagination import Cursor, InvalidCursorError, keyset_page
+from app.data.reload import DatasetManager
+from app.main import app
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+_IDS = tuple(f"id-{i:02d}" for i in range(10))
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+def _parcourir(client: TestClient, url: str) -> list[dict]:
+    """Suit les liens ``next`` à partir de ``url`` et retourne tous les éléments."""
+    elements = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        elements.extend(response.json())
+        url = response.links.get("next", {}).get("url")
+    return elements
+
+
+class TestCursor:
+    """Tests pour Cursor."""
+
+    def test_aller_retour(self):
+        """Un curseur encodé se décode à l'identique, sans caractère à échapper."""
+        cursor = Cursor("abc123", 41, "ortho:prothèse/genou")
+        token = cursor.encode()
+        assert Cursor.decode(token) == cursor
+        assert token.replace("-", "").replace("_", "").isalnum()
+
+    @pytest.mark.parametrize("token", ["@@@", "YWJj", "YTpiOmM"])
+    def test_curseur_invalide(self, token):
+        """Base64 invalide, mauvais nombre de parties ou position non entière."""
+        with pytest.raises(InvalidCursorError):
+            Cursor.decode(token)
+
+
+class TestKeysetPage:
+    """Tests pour keyset_page."""
+
+    def test_parcours_complet(self):
+        """Les pages couvrent tous les identifiants, le dernier curseur est None."""
+        vus, cursor = [], None
+        while True:
+            page, cursor = keyset_page(_IDS, "empreinte", cursor, 3)
+            vus.extend(page)
+            if cursor is None:
+                break
+        assert tuple(vus) == _IDS
+
+    def test_reprise_apres_modification(self):
+        """Sur d'autres données, la reprise suit le dernier identifiant servi."""
+        page, cursor = keyset_page(_IDS, "empreinte", None, 4)
+        assert page[-1] == "id-03"
+        # id-02 et id-03 supprimés, id-035 ajouté : la position 3 ne correspond plus
+        nouveaux = ("id-00", "id-01", "id-035", *_IDS[4:])
+        suite, _ = keyset_page(nouveaux, "autre", cursor, 2)
+        assert suite == ("id-035", "id-04")
+
+    def test_position_ignoree_si_incoherente(self):
+        """Même empreinte mais position hors bornes : recherche par identifiant."""
+        suite, _ = keyset_page(_IDS, "empreinte", Cursor("empreinte", 99, "id-07"), 5)
+        assert suite == ("id-08", "id-09")
+
+
+class TestApi:
+    """Pagination par curseur de GET /api/v1/interventions."""
+
+    def test_parcours_du_catalogue(self, client):
+        """Le parcours par curseur sert chaque intervention une fois, par id croissant."""
+        repository = client.app.state.datasets.current.repository
+        elements = _parcourir(client, "/api/v1/interventions?cursor=&limit=37")
+        ids = [e["id"] for e in elements]
+        assert ids == sorted(repository.ids_tries)
+        assert len(ids) == len(set(ids)) == len(repository.ids_tries)
+
+    def test_lien_next_conserve_les_parametres(self, client):
+        """Le lien next garde limit et la projection demandée."""
+        response = client.get("/api/v1/interventions?cursor=&limit=5&view=summary")
+        suivant = response.links["next"]["url"]
+        assert "limit=5" in suivant
+        assert "view=summary" in suivant
+        assert set(client.get(suivant).json()[0]) == {
+            "id",
+            "nom",
+            "specialite",
+            "force_recommandation",
+        }
+
+    def test_derniere_page_sans_lien(self, client):
+        """La dernière page n'a pas de lien next."""
+        elements = _parcourir(client, "/api/v1/interventions?cursor=&limit=200")
+        derniere = Cursor("x", 0, elements[-2]["id"]).encode()
+        response = client.get(f"/api/v1/interventions?cursor={derniere}")
+        assert [e["id"] for e in response.json()] == [elements[-1]["id"]]
+        assert "link" not in response.headers
+
+    @pytest.mark.parametrize("query", ["cursor=@@@", "cursor=&skip=10"])
+    def test_parametres_invalides(self, client, query):
+        """Curseur invalide ou combiné à skip : 422."""
+        assert client.get(f"/api/v1/interventions?{query}").status_code == 422
+
+
+class TestRechargement:
+    """Cohérence du parcours à travers un rechargement à chaud."""
+
+    def test_aucune_intervention_inchangee_sautee_ou_repetee(self, tmp_path):
+        """Ajouts et suppressions en cours de parcours ne décalent pas les autres."""
+        source = tmp_path / "rfe.json"
+        shutil.copy(_DATA_PATH, source)
+        manager = DatasetManager(source, None, cache_size=16, cache_ttl=None)
+        avant = set(manager.current.repository.ids_tries)
+
+        generation = manager.current
+        page, cursor = keyset_page(
+            generation.repository.ids_tries, generation.dataset.fingerprint, None, 100
+        )
+        vus = list(page)
+
+        data = json.loads(source.read_text(encoding="utf-8"))
+        interventions = data["specialites"][0]["interventions"]
+        supprimee = interventions.pop(0)
+        ajoutee = copy.deepcopy(interventions[0])
+        ajoutee["id"] = "zz-nouvelle-intervention"
+        interventions.insert(0, ajoutee)
+        source.write_text(json.dumps(data), encoding="utf-8")
+        generation = manager.reload()
+        assert generation.repository.ids_tries == tuple(
+            sorted(i.id for i in generation.repository.interventions)
+        )
+
+        while cursor is not None:
+            page, cursor = keyset_page(
+                generation.repository.ids_tries, generation.dataset.fingerprint, cursor, 100
+            )
+            vus.extend(page)
+
+        assert len(vus) == len(set(vus))
+        assert avant - {supprimee["id"]} <= set(vus)
+        assert "zz-nouvelle-intervention" in vus
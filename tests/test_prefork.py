@@ -0,0 +1,90 @@
+"""Tests pour le mode pré-forké (jeu de données chargé par le processus maître)."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import prefork
+from app.main import app, create_dataset_manager
+from app.prefork import _bind, _supervise
+
+
+@pytest.fixture(name="preloaded")
+def _preloaded():
+    """Jeu de données pré-chargé comme le ferait le maître avant fork."""
+    datasets = create_dataset_manager()
+    app.state.preloaded_datasets = datasets
+    yield datasets
+    del app.state.preloaded_datasets
+
+
+class TestPrefork:
+    """Tests pour app.prefork."""
+
+    def test_lifespan_reprend_le_jeu_de_donnees_herite(self, preloaded):
+        """Le worker sert le jeu de données du maître au lieu de recharger rfe.json."""
+        with TestClient(app) as client:
+            assert client.app.state.datasets is preloaded
+            response = client.get("/api/v1/health")
+        assert response.json()["generation"] == preloaded.current.number
+
+    def test_socket_heritable(self):
+        """La socket d'écoute est transmise aux workers."""
+        sock = _bind("127.0.0.1", 0)
+        try:
+            assert sock.get_inheritable()
+            assert sock.getsockname()[1] > 0
+        finally:
+            sock.close()
+
+
+class _Arret(threading.Event):
+    """Événement d'arrêt qui relève les délais de remplacement sans attendre."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.delais: list[float] = []
+
+    def wait(self, timeout: float | None = None) -> bool:
+        self.delais.append(timeout)
+        return self.is_set()
+
+
+class TestSupervise:
+    """Tests pour _supervise (remplacement des workers)."""
+
+    @staticmethod
+    def _superviser(remplacements: int) -> tuple[list[int], list[float]]:
+        """Workers qui meurent aussitôt démarrés ; arrêt demandé au dernier remplacement."""
+        stopping = _Arret()
+        demarres = []
+
+        def spawn() -> int:
+            pid = os.fork()
+            if pid == 0:
+                os._exit(1)
+            demarres.append(pid)
+            if len(demarres) > remplacements:
+                stopping.set()
+            return pid
+
+        _supervise({spawn(): time.monotonic()}, spawn, stopping)
+        return demarres, stopping.delais
+
+    def test_worker_mort_remplace_avec_delai_croissant(self):
+        """Chaque worker mort est remplacé ; mort au démarrage, le délai double."""
+        demarres, delais = self._superviser(3)
+        assert len(demarres) == 4
+        assert delais == [0.5, 1.0, 2.0]
+
+    def test_delai_plafonne_puis_remis_a_zero(self, monkeypatch):
+        """Délai plafonné ; un worker qui a assez vécu est remplacé sans attendre."""
+        monkeypatch.setattr(prefork, "_RESPAWN_DELAI_MAX", 1.0)
+        assert self._superviser(3)[1] == [0.5, 1.0, 1.0]
+        monkeypatch.setattr(prefork, "_VIE_MIN", 0.0)
+        assert self._superviser(2)[1] == [0.0, 0.0]
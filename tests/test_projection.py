@@ -0,0 +1,164 @@
+"""Tests pour les projections de l'API (view=summary, fields=)."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.projection import InterventionProjection, SpecialiteProjection
+from app.data.projection import FIELDS, SUMMARY_FIELDS, Projections, parse_fields
+from app.main import app
+
+_SPECIALITE = "chirurgie-orthopedique-programmee"
+_INTERVENTION = "ortho-prog-mi-prothese-hanche-genou"
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(name="repository")
+def _repository(client):
+    """Dépôt de la génération servie."""
+    return client.app.state.datasets.current.repository
+
+
+class TestParseFields:
+    """Tests pour parse_fields."""
+
+    def test_ordre_canonique_sans_doublon(self):
+        """Les champs sont remis dans l'ordre de la vue complète."""
+        assert parse_fields("interventions", " notes,id ,nom,id") == ("id", "nom", "notes")
+
+    @pytest.mark.parametrize("fields", ["", " , ", "id,inconnu"])
+    def test_champs_invalides(self, fields):
+        """Un paramètre vide ou un champ inconnu lève ValueError."""
+        with pytest.raises(ValueError, match="fields|inconnu"):
+            parse_fields("specialites", fields)
+
+
+class TestSpecialites:
+    """Projections de /api/v1/specialites."""
+
+    def test_vue_resumee(self, client, repository):
+        """view=summary : id, nom et nb_interventions de chaque spécialité."""
+        response = client.get("/api/v1/specialites?view=summary")
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": s.id, "nom": s.nom, "nb_interventions": len(s.interventions)}
+            for s in repository.specialites
+        ]
+
+    def test_reponse_par_defaut_inchangee(self, client):
+        """Sans paramètre, view=full ou tous les champs : la vue complète."""
+        complete = client.get("/api/v1/specialites").content
+        assert client.get("/api/v1/specialites?view=full").content == complete
+        tous = ",".join(f for f in FIELDS["specialites"] if f != "nb_interventions")
+        assert client.get(f"/api/v1/specialites?fields={tous}").content == complete
+
+    @pytest.mark.parametrize("url", ["/api/v1/specialites", f"/api/v1/specialites/{_SPECIALITE}"])
+    def test_tous_les_champs_avec_nb_interventions(self, client, url):
+        """Tous les champs projetables : nb_interventions est servi en plus de la vue complète."""
+        complete = client.get(url).json()
+        projetee = client.get(f"{url}?fields=id,nom,nb_interventions,interventions").json()
+        for s, p in zip(
+            complete if isinstance(complete, list) else [complete],
+            projetee if isinstance(projetee, list) else [projetee],
+            strict=True,
+        ):
+            assert p == {**s, "nb_interventions": len(s["interventions"])}
+            assert tuple(p) == FIELDS["specialites"]
+
+    def test_fields_prime_sur_view(self, client):
+        """fields= l'emporte sur view=."""
+        response = client.get(f"/api/v1/specialites/{_SPECIALITE}?view=summary&fields=nom")
+        assert response.json() == {"nom": "Chirurgie orthopédique programmée"}
+
+    def test_specialite_inconnue(self, client):
+        """Une spécialité inconnue reste en 404 avec une projection."""
+        response = client.get("/api/v1/specialites/inexistante?view=summary")
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("query", ["fields=inconnu", "fields=", "view=court"])
+    def test_parametres_invalides(self, client, query):
+        """Champ inconnu, fields vide ou vue inconnue : 422."""
+        assert client.get(f"/api/v1/specialites?{query}").status_code == 422
+
+
+class TestInterventions:
+    """Projections de /api/v1/interventions."""
+
+    def test_page_projetee(self, client, repository):
+        """fields= restreint chaque intervention de la page."""
+        response = client.get("/api/v1/interventions?skip=10&limit=3&fields=nom,id")
+        assert response.json() == [
+            {"id": i.id, "nom": i.nom} for i in repository.interventions[10:13]
+        ]
+
+    def test_vue_resumee(self, client):
+        """view=summary sur le détail d'une intervention."""
+        data = client.get(f"/api/v1/interventions/{_INTERVENTION}?view=summary").json()
+        assert tuple(data) == SUMMARY_FIELDS["interventions"]
+        assert data["id"] == _INTERVENTION
+
+    def test_projection_coherente_avec_la_vue_complete(self, client):
+        """Chaque champ projeté a la valeur de la vue complète."""
+        complete = client.get(f"/api/v1/interventions/{_INTERVENTION}").json()
+        projetee = client.get(
+            f"/api/v1/interventions/{_INTERVENTION}?fields=protocole,alternative_allergie,notes"
+        ).json()
+        assert projetee == {k: complete[k] for k in projetee}
+
+    def test_etag_propre_a_la_projection(self, client):
+        """Une projection a son propre ETag, revalidable en 304."""
+        url = "/api/v1/interventions?view=summary"
+        etag = client.get(url).headers["etag"]
+        assert etag != client.get("/api/v1/interventions").headers["etag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+
+class TestProjections:
+    """Tests pour Projections (encodage une fois par projection)."""
+
+    def test_vues_resumees_encodees_a_la_creation(self, repository):
+        """Les vues résumées sont prêtes sans passer par le cache LRU."""
+        projections = Projections(repository)
+        premier = projections.specialites_list(SUMMARY_FIELDS["specialites"])
+        assert projections.specialites_list(SUMMARY_FIELDS["specialites"]) == premier
+        assert len(projections._cache) == 0
+
+    def test_projection_memoisee(self, repository):
+        """Une projection fields= est encodée une fois puis réutilisée."""
+        projections = Projections(repository, maxsize=2)
+        projections.interventions_page(("id",), 0, 5)
+        encodes = projections._cache.get(("interventions", ("id",)))
+        projections.intervention(repository.interventions[0].id, ("id",))
+        assert projections._cache.get(("interventions", ("id",))) is encodes
+        assert projections._cache.stats().size == 1
+
+
+class TestSchemas:
+    """Schémas OpenAPI des réponses projetées."""
+
+    def test_champs_projetables(self):
+        """Les modèles projetés déclarent exactement les champs projetables."""
+        assert tuple(SpecialiteProjection.model_fields) == FIELDS["specialites"]
+        assert tuple(InterventionProjection.model_fields) == FIELDS["interventions"]
+
+    @pytest.mark.parametrize(
+        ("path", "schema"),
+        [
+            ("/api/v1/specialites", "SpecialiteProjection"),
+            ("/api/v1/specialites/{specialite_id}", "SpecialiteProjection"),
+            ("/api/v1/interventions", "InterventionProjection"),
+            ("/api/v1/interventions/{intervention_id}", "InterventionProjection"),
+        ],
+    )
+    def test_openapi_declare_la_forme_projetee(self, client, path, schema):
+        """La réponse 200 documente la vue complète et la forme projetée."""
+        openapi = client.get("/openapi.json").json()
+        reponse = openapi["paths"][path]["get"]["responses"]["200"]
+        assert f"#/components/schemas/{schema}" in str(reponse)
@@ -0,0 +1,181 @@
+"""Tests pour le langage de requête à champs qualifiés."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.data.cache import LRUCache
+from app.data.diff import RFEDiff
+from app.data.filters import bit_positions
+from app.data.query import Clause, compile_query, is_structured, parse_query
+from app.data.search import (
+    carry_over_search_cache,
+    search_candidates,
+    search_interventions_faceted,
+)
+from app.main import app
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(name="dataset")
+def _dataset(client):
+    """Jeu de données servi (index de recherche et index inversés)."""
+    return client.app.state.datasets.current.dataset
+
+
+def _molecules(intervention) -> set[str]:
+    """Molécules du protocole standard et des alternatives allergie."""
+    protocoles = [intervention.protocole, *(intervention.alternative_allergie or [])]
+    return {p.molecule.value for p in protocoles if p is not None}
+
+
+class TestParseQuery:
+    """Tests pour parse_query."""
+
+    def test_champs_exclusions_et_texte_libre(self):
+        """Champs (alias accentués compris), exclusions et texte libre sont séparés."""
+        parsed = parse_query("Molécule:Céfazoline spécialité:ortho hanche -reprise")
+        assert parsed.text == "hanche"
+        assert parsed.clauses == (
+            Clause("molecule", "cefazoline", negated=False),
+            Clause("specialite", "ortho", negated=False),
+            Clause(None, "reprise", negated=True),
+        )
+
+    def test_guillemets_et_exclusion_de_champ(self):
+        """Une valeur entre guillemets peut contenir des espaces."""
+        parsed = parse_query('-sous-categorie:"chirurgie de paroi" grade:2')
+        assert parsed.text == ""
+        assert parsed.clauses == (
+            Clause("sous_categorie", "chirurgie de paroi", negated=True),
+            Clause("force_recommandation", "2", negated=False),
+        )
+
+    @pytest.mark.parametrize("query", ["post-partum", "10:30 cesarienne", "hanche", "inconnu:x"])
+    def test_requetes_non_structurees(self, query):
+        """Mot composé ou préfixe inconnu : texte libre, sans clause."""
+        assert not is_structured(query)
+        assert parse_query(query).text == query
+
+
+class TestCompileQuery:
+    """Tests pour compile_query."""
+
+    def test_valeur_identique_ou_sous_chaine(self, dataset):
+        """Valeur identique si elle existe, sinon toutes celles qui la contiennent."""
+        index, filters = dataset.search_index, dataset.filters
+        exacte = compile_query("molecule:cefazoline", index, filters)
+        assert exacte.candidates == filters.match("molecule", ["Céfazoline"])
+        partielle = compile_query("specialite:chirurgie", index, filters)
+        chirurgies = [v for v in filters.bitsets["specialite"] if "chirurgie" in v.lower()]
+        assert len(chirurgies) > 1
+        assert partielle.candidates == filters.match("specialite", chirurgies)
+
+    def test_identifiant_de_specialite(self, dataset):
+        """L'identifiant d'une spécialité désigne la spécialité."""
+        specialite = dataset.repository.specialites[0]
+        plan = compile_query(f"specialite:{specialite.id}", dataset.search_index, dataset.filters)
+        assert plan.candidates == dataset.filters.match("specialite", [specialite.nom])
+
+    def test_exclusions(self, dataset):
+        """-terme exclut le texte indexé, -champ:valeur la valeur du critère."""
+        index = dataset.search_index
+        plan = compile_query("-genou -molecule:vancomycine", index, dataset.filters)
+        attendu = [
+            i
+            for i, intervention in enumerate(index.interventions)
+            if "genou" not in index.choices[i] and "Vancomycine" not in _molecules(intervention)
+        ]
+        assert bit_positions(plan.candidates) == attendu
+
+
+class TestExecution:
+    """Exécution des plans dans la recherche."""
+
+    @pytest.mark.parametrize("text", ["prothese", "han"])
+    def test_scoring_restreint_equivalent_au_filtrage(self, dataset, text):
+        """Scorer les seules admises équivaut à filtrer les correspondances complètes."""
+        index = dataset.search_index
+        admises = dataset.filters.match("force_recommandation", ["Avis d'experts"])
+        positions = set(bit_positions(admises))
+        attendu = [r for r in search_candidates(text, index) if r.position in positions]
+        assert attendu
+        assert [(r.position, r.score) for r in search_candidates(text, index, admises)] == [
+            (r.position, r.score) for r in attendu
+        ]
+
+    def test_sans_texte_libre(self, dataset):
+        """Sans texte à scorer, toutes les admises, score 100, ordre de l'index."""
+        admises = dataset.filters.match("force_recommandation", ["GRADE 2"])
+        resultats = search_candidates("", dataset.search_index, admises)
+        assert [r.position for r in resultats] == bit_positions(admises)
+        assert {r.score for r in resultats} == {100.0}
+
+    def test_plan_mis_en_cache(self, dataset):
+        """Le plan d'une requête est compilé une fois, clé normalisée."""
+        plans = LRUCache(16)
+        for query in ("molecule:Céfazoline hanche", "  molecule:cefazoline hanche"):
+            faceted = search_interventions_faceted(
+                query,
+                dataset.search_index,
+                dataset.filters,
+                {},
+                LRUCache(16),
+                facet_fields=(),
+                plans=plans,
+            )
+        assert plans.stats().hits == 1
+        assert [r.intervention.id for r in faceted.results] == [
+            "ortho-prog-mi-prothese-hanche-genou"
+        ]
+        assert faceted.results[0].spans
+
+    def test_cache_de_recherche_non_repris(self, dataset):
+        """Les requêtes structurées ne survivent pas à un rechargement."""
+        index = dataset.search_index
+        ancien, nouveau = LRUCache(16), LRUCache(16)
+        for query in ("hanche", "molecule:cefazoline hanche"):
+            search_interventions_faceted(query, index, dataset.filters, {}, ancien)
+        assert carry_over_search_cache(ancien, nouveau, index, index, RFEDiff()) == 1
+        assert [query for (query, _, _), _ in nouveau.items()] == ["hanche"]
+
+
+class TestApi:
+    """Requêtes structurées sur /api/v1/search et /search."""
+
+    def test_api_respecte_les_clauses(self, client, dataset):
+        """Chaque résultat satisfait les champs et exclusions de la requête."""
+        response = client.get(
+            "/api/v1/search",
+            params={"q": "molecule:cefazoline specialite:ortho -genou prothese", "limit": 50},
+        )
+        assert response.status_code == 200
+        repository = dataset.repository
+        resultats = [repository.get_intervention(r["id"]) for r in response.json()]
+        assert resultats
+        for intervention in resultats:
+            assert "Céfazoline" in _molecules(intervention)
+            assert "orthopédique" in intervention.specialite
+            assert "genou" not in intervention.nom.lower()
+
+    def test_clauses_seules_ordre_du_fichier(self, client, dataset):
+        """Sans texte libre, les interventions admises dans l'ordre du fichier."""
+        response = client.get("/api/v1/search", params={"q": "grade:1", "limit": 50})
+        attendu = [
+            i.id for i in dataset.search_index.interventions if i.force_recommandation == "GRADE 1"
+        ]
+        assert [r["id"] for r in response.json()] == attendu[:50]
+        assert {r["score"] for r in response.json()} == {100.0}
+
+    def test_suggestions_htmx(self, client):
+        """La barre de recherche accepte la même syntaxe."""
+        response = client.get("/search", params={"q": "molecule:cefazoline hanche"})
+        assert response.status_code == 200
+        assert "<mark>hanche</mark>" in response.text
@@ -0,0 +1,134 @@
+"""Tests pour le rechargement à chaud de rfe.json (générations de données)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.data.reload import DatasetManager, watch_data_file
+from app.main import app
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+
+
+@pytest.fixture(name="source")
+def _source(tmp_path) -> Path:
+    """Copie de data/rfe.json modifiable par le test."""
+    path = tmp_path / "rfe.json"
+    shutil.copy(_DATA_PATH, path)
+    return path
+
+
+@pytest.fixture(name="manager")
+def _manager(source) -> DatasetManager:
+    """Gestionnaire de données sur la copie de rfe.json."""
+    return DatasetManager(source, None, cache_size=16, cache_ttl=None)
+
+
+def _renommer_premiere_intervention(source: Path, nom: str) -> str:
+    """Modifie le nom de la première intervention et retourne son identifiant."""
+    data = json.loads(source.read_text(encoding="utf-8"))
+    intervention = data["specialites"][0]["interventions"][0]
+    intervention["nom"] = nom
+    source.write_text(json.dumps(data), encoding="utf-8")
+    return intervention["id"]
+
+
+class TestDatasetManager:
+    """Tests pour DatasetManager."""
+
+    def test_premiere_generation(self, manager):
+        """Au démarrage, la génération 1 est servie."""
+        assert manager.current.number == 1
+        assert manager.current.load_duration > 0
+        assert len(manager.current.repository.interventions) >= 40
+
+    def test_reload_sans_changement_garde_la_generation(self, manager):
+        """Sans modification du fichier, la génération courante est conservée."""
+        generation = manager.current
+        assert manager.reload() is generation
+
+    def test_reload_bascule_sur_une_nouvelle_generation(self, manager, source):
+        """Après modification, une nouvelle génération complète est servie."""
+        ancienne = manager.current
+        intervention_id = _renommer_premiere_intervention(source, "Nom corrigé")
+
+        nouvelle = manager.reload()
+
+        assert nouvelle.number == 2
+        assert manager.current is nouvelle
+        assert nouvelle.repository.get_intervention(intervention_id).nom == "Nom corrigé"
+        assert nouvelle.search_index.version != ancienne.search_index.version
+        assert nouvelle.search_cache is not ancienne.search_cache
+        assert nouvelle.diff.modified_interventions == (intervention_id,)
+        # Une requête en cours sur l'ancienne génération la voit inchangée
+        assert ancienne.repository.get_intervention(intervention_id).nom != "Nom corrigé"
+
+    def test_fichier_invalide_garde_l_ancienne_generation(self, manager, source):
+        """Un fichier invalide est refusé : l'ancienne génération reste servie."""
+        ancienne = manager.current
+        source.write_text("{cassé", encoding="utf-8")
+
+        with pytest.raises(ValueError):
+            manager.reload()
+
+        assert manager.current is ancienne
+        assert manager.last_error is not None
+
+    def test_surveillance_du_fichier(self, manager, source):
+        """La surveillance recharge automatiquement après modification du fichier."""
+
+        async def scenario() -> None:
+            watcher = asyncio.create_task(watch_data_file(manager, interval=0.01))
+            await asyncio.sleep(0.05)
+            _renommer_premiere_intervention(source, "Nom surveillé")
+            for _ in range(200):
+                await asyncio.sleep(0.01)
+                if manager.current.number == 2:
+                    break
+            watcher.cancel()
+
+        asyncio.run(scenario())
+        assert manager.current.number == 2
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+class TestReloadEndpoint:
+    """Tests pour POST /api/v1/admin/reload et les informations de /api/v1/health."""
+
+    def test_desactive_sans_jeton_configure(self, client):
+        """Sans ADMIN_TOKEN configuré, l'endpoint est refusé."""
+        response = client.post("/api/v1/admin/reload", headers={"X-Admin-Token": "x"})
+        assert response.status_code == 403
+
+    def test_jeton_invalide(self, client, monkeypatch):
+        """Un jeton erroné est refusé."""
+        monkeypatch.setattr(client.app.state.settings, "admin_token", "secret")
+        response = client.post("/api/v1/admin/reload", headers={"X-Admin-Token": "autre"})
+        assert response.status_code == 403
+
+    def test_reload_incremente_la_generation(self, client, monkeypatch):
+        """Un rechargement forcé produit une nouvelle génération, visible dans /health."""
+        monkeypatch.setattr(client.app.state.settings, "admin_token", "secret")
+        avant = client.get("/api/v1/health").json()
+
+        response = client.post("/api/v1/admin/reload", headers={"X-Admin-Token": "secret"})
+
+        assert response.status_code == 200
+        assert response.json()["generation"] == avant["generation"] + 1
+        assert response.json()["changes"]["modified_interventions"] == []
+        apres = client.get("/api/v1/health").json()
+        assert apres["generation"] == avant["generation"] + 1
+        assert apres["load_duration_ms"] >= 0
+        assert apres["last_reload_error"] is None
@@ -0,0 +1,59 @@
+"""Tests pour la couche d'accès indexée RFERepository."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.data.loader import load_rfe_data
+from app.data.repository import RFERepository
+
+if TYPE_CHECKING:
+    from app.data.models import RFEData
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+
+
+@pytest.fixture(name="rfe_data")
+def _rfe_data() -> RFEData:
+    """Charge le vrai fichier data/rfe.json."""
+    return load_rfe_data(_DATA_PATH)
+
+
+@pytest.fixture(name="repository")
+def _repository(rfe_data) -> RFERepository:
+    """Dépôt construit à partir des vraies données."""
+    return RFERepository.from_data(rfe_data)
+
+
+class TestRFERepository:
+    """Tests pour les tables de correspondance par identifiant."""
+
+    def test_interventions_a_plat_dans_l_ordre_du_fichier(self, repository, rfe_data):
+        """Le tuple à plat suit l'ordre spécialité puis intervention."""
+        attendu = [i.id for s in rfe_data.specialites for i in s.interventions]
+        assert [i.id for i in repository.interventions] == attendu
+
+    def test_get_intervention_par_id(self, repository, rfe_data):
+        """Chaque intervention est retrouvée par son identifiant."""
+        for specialite in rfe_data.specialites:
+            for intervention in specialite.interventions:
+                assert repository.get_intervention(intervention.id) is intervention
+
+    def test_get_intervention_inconnue_retourne_none(self, repository):
+        """Un identifiant inconnu retourne None."""
+        assert repository.get_intervention("id-inexistant-xyz") is None
+
+    def test_get_specialite_par_id_et_par_nom(self, repository, rfe_data):
+        """Les spécialités sont indexées par identifiant et par nom."""
+        for specialite in rfe_data.specialites:
+            assert repository.get_specialite(specialite.id) is specialite
+            assert repository.get_specialite_par_nom(specialite.nom) is specialite
+
+    def test_specialite_de_intervention(self, repository, rfe_data):
+        """La spécialité contenant une intervention est retrouvée directement."""
+        specialite = rfe_data.specialites[0]
+        intervention = specialite.interventions[0]
+        assert repository.specialite_de(intervention.id) is specialite
@@ -4,19 +4,29 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.data.cache import LRUCache
+from app.data.dataset import Dataset
+from app.data.filters import FACET_FIELDS, FilterIndex
 from app.data.loader import load_rfe_data
-from app.data.search import SearchResult, search_interventions
+from app.data.models import RFEData
+from app.data.search import (
+    SEARCH_FIELDS,
+    SearchColumn,
+    SearchIndex,
+    SearchResult,
+    _score_fields,
+    carry_over_search_cache,
+    search_interventions,
+    search_interventions_batch,
+    search_interventions_cached,
+    search_interventions_faceted,
+)
 from app.main import app
 
-if TYPE_CHECKING:
-    from app.data.models import RFEData
-
-
 # ---------------------------------------------------------------------------
 # Fixture : données réelles du projet
 # ---------------------------------------------------------------------------
@@ -204,6 +214,238 @@ class TestSearchInterventions:
         assert results == []
 
 
+# ---------------------------------------------------------------------------
+# Tests unitaires — SearchIndex
+# ---------------------------------------------------------------------------
+
+
+class TestSearchIndex:
+    """Tests pour l'index de recherche pré-calculé."""
+
+    def test_choices_normalises(self, rfe_data_minimal):
+        """Les textes indexés sont déjà sans accents et en minuscules."""
+        index = SearchIndex.from_data(rfe_data_minimal)
+
+        assert index.choices[0] == "prothese de hanche orthopedie"
+
+    def test_une_entree_par_intervention(self, rfe_data):
+        """L'index contient une entrée par intervention, alignée sur les choix."""
+        index = SearchIndex.from_data(rfe_data)
+        total = sum(len(s.interventions) for s in rfe_data.specialites)
+
+        assert len(index) == total
+        assert len(index.interventions) == len(index.choices)
+
+    def test_index_et_donnees_brutes_equivalents(self, rfe_data):
+        """Chercher via l'index ou via RFEData donne les mêmes résultats."""
+        index = SearchIndex.from_data(rfe_data)
+
+        for query in ("han", "prothese", "cesarienne"):
+            via_index = [r.intervention.id for r in search_interventions(query, index)]
+            via_data = [r.intervention.id for r in search_interventions(query, rfe_data)]
+            assert via_index == via_data
+
+    def test_version_depend_du_contenu(self, rfe_data, rfe_data_minimal):
+        """La version de l'index change avec le contenu des données."""
+        assert SearchIndex.from_data(rfe_data).version == SearchIndex.from_data(rfe_data).version
+        assert (
+            SearchIndex.from_data(rfe_data).version
+            != SearchIndex.from_data(rfe_data_minimal).version
+        )
+
+
+class TestSearchInterventionsCached:
+    """Tests pour la recherche via le cache LRU."""
+
+    def test_memes_resultats_que_sans_cache(self, rfe_data):
+        """Le cache ne change pas les résultats."""
+        index = SearchIndex.from_data(rfe_data)
+        cache = LRUCache(16)
+        attendu = [r.intervention.id for r in search_interventions("prothese", index)]
+        for _ in range(2):
+            results = search_interventions_cached("prothese", index, cache)
+            assert [r.intervention.id for r in results] == attendu
+
+    def test_cle_normalisee(self, rfe_data):
+        """Deux requêtes de même forme normalisée partagent l'entrée du cache."""
+        index = SearchIndex.from_data(rfe_data)
+        cache = LRUCache(16)
+        search_interventions_cached("Prothèse", index, cache)
+        search_interventions_cached(" prothese ", index, cache)
+        assert cache.stats().hits == 1
+        assert len(cache) == 1
+
+    def test_cle_depend_de_la_version_des_donnees(self, rfe_data, rfe_data_minimal):
+        """Un nouvel index (données modifiées) ne relit pas les anciens résultats."""
+        cache = LRUCache(16)
+        search_interventions_cached("hanche", SearchIndex.from_data(rfe_data), cache)
+        results = search_interventions_cached(
+            "hanche", SearchIndex.from_data(rfe_data_minimal), cache
+        )
+        assert cache.stats().hits == 0
+        assert [r.intervention.id for r in results] == ["orthopedie-01"]
+
+    def test_notes_modifiees_au_rechargement(self):
+        """Une note modifiée invalide les résultats repris d'une génération à l'autre."""
+        raw = json.loads((Path(__file__).parent.parent / "data" / "rfe.json").read_text("utf-8"))
+        dataset = Dataset.from_data(RFEData.model_validate(raw))
+        ancien = LRUCache(16)
+        search_interventions_cached("voie anterieure", dataset.search_index, ancien)
+        search_interventions_faceted(
+            "voie anterieure", dataset.search_index, dataset.filters, {}, ancien
+        )
+        intervention = raw["specialites"][0]["interventions"][1]
+        assert intervention["id"] == "ortho-prog-mi-gestes-osseux-materiel"
+        intervention["notes"] = "Préférer la voie antérieure."
+        patched, diff = dataset.patched(RFEData.model_validate(raw))
+        nouveau = LRUCache(16)
+
+        carry_over_search_cache(ancien, nouveau, dataset.search_index, patched.search_index, diff)
+
+        index = patched.search_index
+        attendu = [r.intervention.id for r in search_interventions("voie anterieure", index)]
+        assert intervention["id"] in attendu
+        cached = search_interventions_cached("voie anterieure", index, nouveau)
+        assert [r.intervention.id for r in cached] == attendu
+        faceted = search_interventions_faceted(
+            "voie anterieure", index, patched.filters, {}, nouveau
+        )
+        assert [r.intervention.id for r in faceted.results] == attendu
+
+
+class TestSearchInterventionsBatch:
+    """Tests pour la recherche groupée vectorisée (cdist)."""
+
+    def test_identique_a_la_recherche_unitaire(self, rfe_data):
+        """Chaque requête du lot donne les mêmes résultats qu'un appel unitaire."""
+        index = SearchIndex.from_data(rfe_data)
+        queries = ["prothese de hanche", "cesarienne", "han", "", "prothse", "xyznotfound"]
+
+        batch = search_interventions_batch(queries, index, limit=5)
+
+        assert len(batch) == len(queries)
+        for query, results in zip(queries, batch, strict=True):
+            attendu = search_interventions(query, index, limit=5)
+            assert [(r.intervention.id, r.score, r.field) for r in results] == [
+                (r.intervention.id, r.score, r.field) for r in attendu
+            ]
+
+    def test_lot_vide(self, rfe_data_minimal):
+        """Un lot vide retourne une liste vide."""
+        assert search_interventions_batch([], SearchIndex.from_data(rfe_data_minimal)) == []
+
+
+class TestRechercheMultiChamps:
+    """Tests pour la recherche pondérée sur plusieurs champs."""
+
+    def test_texte_present_seulement_dans_les_notes(self, rfe_data):
+        """Une intervention est trouvée par ses notes, champ signalé."""
+        index = SearchIndex.from_data(rfe_data)
+        results = search_interventions("voie anterieure", index, limit=10)
+        par_notes = [r for r in results if r.field == "notes"]
+        assert par_notes
+        assert all("anterieure" not in index.choices[r.position] for r in par_notes)
+        assert all(r.spans == () for r in par_notes)
+        assert par_notes[0].score == pytest.approx(80.0)
+
+    def test_molecule_du_protocole(self, rfe_data):
+        """Le nom d'une molécule retrouve les interventions qui la prescrivent."""
+        index = SearchIndex.from_data(rfe_data)
+        nom_seul = index.weighted(dict.fromkeys(SEARCH_FIELDS[1:], 0))
+        assert search_interventions("vancomycine", nom_seul) == []
+        results = search_interventions("vancomycine", index)
+        assert any(r.field == "protocole" for r in results)
+
+    def test_arret_anticipe_sans_effet_sur_le_top_k(self, rfe_data):
+        """Le top-k avec arrêt anticipé égale le début du classement complet."""
+        index = SearchIndex.from_data(rfe_data)
+        for query in ("prothese de hanche", "membre inferieur", "cefazoline", "voie anterieure"):
+            complet = _score_fields(query, index, None)
+            for limit in (1, 5, 10):
+                assert _score_fields(query, index, limit) == complet[:limit], (query, limit)
+
+    def test_poids(self, rfe_data):
+        """Un poids module le score du champ ; un poids nul désactive le champ."""
+        index = SearchIndex.from_data(rfe_data)
+        renforce = index.weighted({"notes": 1.0})
+        results = search_interventions("voie anterieure", renforce, limit=1)
+        assert (results[0].score, results[0].field) == (pytest.approx(100.0), "notes")
+        sans_notes = index.weighted({"notes": 0})
+        assert "notes" not in {
+            r.field for r in search_interventions("voie anterieure", sans_notes)
+        }
+        assert renforce.columns is index.columns
+
+    @pytest.mark.parametrize("weights", [{"inconnu": 1.0}, {"notes": -0.5}])
+    def test_poids_invalides(self, rfe_data_minimal, weights):
+        """Champ inconnu ou poids négatif : ValueError."""
+        with pytest.raises(ValueError):
+            SearchIndex.from_data(rfe_data_minimal).weighted(weights)
+
+    def test_colonne_textes_distincts(self):
+        """Chaque texte normalisé distinct n'apparaît qu'une fois dans la colonne."""
+        column = SearchColumn.from_texts(["Tableau 1", None, "Tableau 1", "Tableau 2", ""])
+        assert column.values == ("tableau 1", "tableau 2")
+        assert column.rows == ((0, 2), (3,))
+        assert list(column.inverse) == [0, -1, 0, 1, -1]
+
+
+class TestSearchInterventionsFaceted:
+    """Tests pour la recherche à facettes (bitsets)."""
+
+    @pytest.fixture(name="indexes")
+    def _indexes(self, rfe_data):
+        """Index de recherche et index inversés, mêmes positions."""
+        index = SearchIndex.from_data(rfe_data)
+        return index, FilterIndex.from_interventions(index.interventions)
+
+    @pytest.mark.parametrize("query", ["prothese de hanche", "han", "xyznotfound"])
+    def test_sans_critere_identique_a_la_recherche(self, indexes, query):
+        """Sans critère, mêmes résultats que search_interventions."""
+        index, filters = indexes
+        faceted = search_interventions_faceted(query, index, filters, {}, LRUCache(16), limit=5)
+        attendu = search_interventions(query, index, limit=5)
+        assert [(r.intervention.id, r.score, r.spans) for r in faceted.results] == [
+            (r.intervention.id, r.score, r.spans) for r in attendu
+        ]
+        assert faceted.total >= len(attendu)
+
+    def test_critere_et_comptes(self, indexes):
+        """Les résultats respectent le critère ; les comptes somment au total."""
+        index, filters = indexes
+        cache = LRUCache(16)
+        tous = search_interventions_faceted("prothese", index, filters, {}, cache, limit=50)
+        faceted = search_interventions_faceted(
+            "prothese", index, filters, {"molecule": ["Vancomycine"]}, cache, limit=50
+        )
+        assert cache.stats().hits == 1  # correspondances réutilisées d'un critère à l'autre
+        attendu = [
+            r.intervention.id
+            for r in tous.results
+            if any(
+                p.molecule == "Vancomycine"
+                for p in [r.intervention.protocole, *(r.intervention.alternative_allergie or [])]
+                if p is not None
+            )
+        ]
+        assert [r.intervention.id for r in faceted.results] == attendu
+        assert faceted.total == len(attendu)
+        assert set(faceted.facets) == set(FACET_FIELDS)
+        assert sum(faceted.facets["specialite"].values()) == faceted.total
+        # La facette du critère compte sans lui-même : les autres molécules restent visibles
+        assert faceted.facets["molecule"] == tous.facets["molecule"]
+
+    def test_requete_vide(self, indexes):
+        """Requête vide : aucun résultat, valeurs sélectionnées conservées à 0."""
+        index, filters = indexes
+        faceted = search_interventions_faceted(
+            "", index, filters, {"force_recommandation": ["GRADE 1"]}, LRUCache(16)
+        )
+        assert faceted.results == []
+        assert faceted.total == 0
+        assert faceted.facets["force_recommandation"] == {"GRADE 1": 0}
+
+
 # ---------------------------------------------------------------------------
 # Tests d'intégration — endpoint /api/v1/search
 # ---------------------------------------------------------------------------
@@ -260,6 +502,53 @@ class TestSearchEndpoint:
         data = response.json()
         assert len(data) <= 10
 
+    def test_batch_retourne_resultats_par_requete(self, client):
+        """POST /api/v1/search/batch retourne un élément par requête, dans l'ordre."""
+        response = client.post(
+            "/api/v1/search/batch",
+            json={"queries": ["hanche", "cesarienne", ""], "limit": 3},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["query"] for item in data] == ["hanche", "cesarienne", ""]
+        assert 0 < len(data[0]["results"]) <= 3
+        assert set(data[0]["results"][0]) == {"id", "nom", "specialite", "score", "field"}
+        assert data[2]["results"] == []
+
+    def test_batch_trop_de_requetes_retourne_413(self, client):
+        """Au-delà de search_batch_max_queries, la requête est refusée."""
+        max_queries = client.app.state.settings.search_batch_max_queries
+        response = client.post("/api/v1/search/batch", json={"queries": ["a"] * (max_queries + 1)})
+        assert response.status_code == 413
+
+    def test_index_partage_construit_au_demarrage(self, client):
+        """L'index de recherche est construit une fois au démarrage, par génération."""
+        assert isinstance(client.app.state.datasets.current.search_index, SearchIndex)
+
+    def test_facettes(self, client):
+        """facets=true : résultats, total et comptes par facette."""
+        resp = client.get("/api/v1/search", params={"q": "prothese", "facets": "true"})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert set(data) == {"results", "total", "facets"}
+        assert len(data["results"]) == 10
+        assert sum(data["facets"]["force_recommandation"].values()) == data["total"] > 10
+
+    def test_filtre_sans_facettes_retourne_liste(self, client):
+        """Un critère seul restreint la liste, sans changer sa forme."""
+        resp = client.get(
+            "/api/v1/search",
+            params={"q": "prothese", "specialite": "chirurgie-orthopedique-programmee"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()
+        assert {r["specialite"] for r in resp.json()} == {"Chirurgie orthopédique programmée"}
+
+    def test_critere_invalide_retourne_422(self, client):
+        """Une molécule inconnue est refusée."""
+        resp = client.get("/api/v1/search", params={"q": "prothese", "molecule": "Inconnue"})
+        assert resp.status_code == 422
+
     def test_parametre_limit_respecte(self, client):
         """Le paramètre limit est respecté."""
         response = client.get("/api/v1/search", params={"q": "a", "limit": 3})
@@ -310,43 +599,105 @@ class TestStripAccents:
 
         assert strip_accents("æther") == "aether"
 
+    def test_offsets_ligature(self):
+        from app.utils.text import strip_accents_with_offsets
+
+        norm, offsets = strip_accents_with_offsets("cœlio")
+        assert norm == "coelio"
+        assert offsets.typecode == "H"
+        assert list(offsets) == [0, 1, 1, 2, 3, 4]
+
+    def test_offsets_coherents_avec_strip_accents(self, rfe_data):
+        from app.utils.text import strip_accents, strip_accents_with_offsets
+
+        for specialite in rfe_data.specialites:
+            for intervention in specialite.interventions:
+                norm, offsets = strip_accents_with_offsets(intervention.nom)
+                assert norm == strip_accents(intervention.nom)
+                assert len(offsets) == len(norm)
+
 
 # ---------------------------------------------------------------------------
-# Tests _highlight sans accent
+# Tests _mark : surlignage sans accent
 # ---------------------------------------------------------------------------
 
 
+def _surligner(text: str, query: str) -> str:
+    """Rendu des occurrences exactes de query, zones calculées comme par le moteur."""
+    from app.utils.text import find_occurrences, strip_accents, strip_accents_with_offsets
+    from app.web.routes import _mark
+
+    norm, offsets = strip_accents_with_offsets(text)
+    return str(_mark(text, find_occurrences(norm, strip_accents(query)), offsets))
+
+
 class TestHighlightSansAccent:
-    """Tests pour le surlignage insensible aux accents."""
+    """Tests pour le surlignage insensible aux accents (_mark)."""
 
     def test_query_sans_accent_surligne_texte_avec_accent(self):
-        from app.web.routes import _highlight
-
-        result = str(_highlight("Prothèse de hanche", "prothese"))
-        assert result == "<mark>Prothèse</mark> de hanche"
+        assert _surligner("Prothèse de hanche", "prothese") == "<mark>Prothèse</mark> de hanche"
 
     def test_query_avec_accent_surligne_aussi(self):
-        from app.web.routes import _highlight
-
-        result = str(_highlight("Prothèse de hanche", "Prothèse"))
-        assert result == "<mark>Prothèse</mark> de hanche"
+        assert _surligner("Prothèse de hanche", "Prothèse") == "<mark>Prothèse</mark> de hanche"
 
-    def test_query_vide_retourne_texte_brut(self):
-        from app.web.routes import _highlight
+    def test_sans_zone_retourne_texte_echappe(self):
+        from app.web.routes import _mark
 
-        result = str(_highlight("Prothèse de hanche", ""))
-        assert result == "Prothèse de hanche"
+        assert str(_mark("Hanche & genou", (), range(14))) == "Hanche &amp; genou"
 
     def test_ligature_oe_surlignee_avec_query_sans_ligature(self):
         # "oeso" (4 chars normalisés) = Œ(→oe) + s + o → "Œso" dans l'original
-        from app.web.routes import _highlight
-
-        result = str(_highlight("Œsophagectomie", "oeso"))
-        assert result == "<mark>Œso</mark>phagectomie"
+        assert _surligner("Œsophagectomie", "oeso") == "<mark>Œso</mark>phagectomie"
 
     def test_ligature_milieu_mot(self):
         # "coelio" (6 chars normalisés) = c + œ(→oe) + l + i + o → "cœlio" dans l'original
-        from app.web.routes import _highlight
-
-        result = str(_highlight("cœlioscopie", "coelio"))
-        assert result == "<mark>cœlio</mark>scopie"
+        assert _surligner("cœlioscopie", "coelio") == "<mark>cœlio</mark>scopie"
+
+    def test_occurrences_multiples(self):
+        assert (
+            _surligner("Hanche & hanché", "hanche")
+            == "<mark>Hanche</mark> &amp; <mark>hanché</mark>"
+        )
+
+    def test_table_precalculee_identique_au_calcul(self, rfe_data):
+        """Les tables de l'index sont celles calculées à la volée."""
+        from app.utils.text import strip_accents_with_offsets
+
+        index = SearchIndex.from_data(rfe_data)
+        for position, intervention in enumerate(index.interventions):
+            norm, offsets = index.highlight_map(position)
+            attendu_norm, attendu_offsets = strip_accents_with_offsets(intervention.nom)
+            assert norm == attendu_norm
+            assert list(offsets) == list(attendu_offsets)
+
+    def test_spans_exacts_identiques_au_surlignage(self, rfe_data):
+        """Pour une sous-chaîne exacte, les zones du moteur sont ses occurrences."""
+        from app.web.routes import _mark
+
+        index = SearchIndex.from_data(rfe_data)
+        for query in ("han", "prothese", "oeso"):
+            for r in search_interventions(query, index, limit=50):
+                if query not in index.noms[r.position]:
+                    continue  # correspondance fuzzy : zone issue de l'alignement
+                rendu = _mark(r.intervention.nom, r.spans, index.noms_offsets[r.position])
+                assert rendu == _surligner(r.intervention.nom, query)
+
+    def test_spans_fuzzy_faute_de_frappe(self, rfe_data_minimal):
+        """Une requête avec faute de frappe obtient une zone étendue au mot entier."""
+        from app.web.routes import _mark
+
+        index = SearchIndex.from_data(rfe_data_minimal)
+        results = search_interventions("prothse", index)
+
+        assert results
+        first = results[0]
+        assert first.spans == ((0, 8),)
+        rendu = str(_mark(first.intervention.nom, first.spans, index.noms_offsets[first.position]))
+        assert rendu.startswith("<mark>Prothèse</mark>")
+
+    def test_position_des_resultats(self, rfe_data):
+        """Chaque résultat connaît sa position dans l'index."""
+        index = SearchIndex.from_data(rfe_data)
+        for query in ("han", "prothese de hanche"):
+            for r in search_interventions(query, index):
+                assert index.interventions[r.position] is r.intervention
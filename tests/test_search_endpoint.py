@@ -1,5 +1,7 @@
 """Tests pour l'endpoint HTMX /search (suggestions dropdown)."""
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -50,3 +52,72 @@ class TestSearchEndpoint:
         assert resp.status_code == 200
         if resp.text.count("/protocole/") < 3:
             assert "Voir tous" not in resp.text
+
+    def test_faute_de_frappe_surlignee(self, client):
+        """Une requête avec faute de frappe surligne quand même le mot trouvé."""
+        resp = client.get("/search", params={"q": "prothse"})
+        assert resp.status_code == 200
+        assert "<mark>Prothèse</mark>" in resp.text
+
+
+class TestPageRecherche:
+    """Facettes de la page /recherche."""
+
+    def test_facettes_affichees(self, client):
+        """Chaque facette propose ses valeurs sous forme de liens HTMX."""
+        resp = client.get("/recherche", params={"q": "prothese"})
+        assert resp.status_code == 200
+        for label in ("Spécialité", "Sous-catégorie", "Molécule", "Force de recommandation"):
+            assert label in resp.text
+        assert 'hx-target="#recherche-resultats"' in resp.text
+        assert 'aria-pressed="true"' not in resp.text
+
+    def test_facette_cochee_filtre_et_se_decoche(self, client):
+        """Une valeur cochée restreint les résultats ; son lien la retire."""
+        resp = client.get(
+            "/recherche",
+            params={"q": "prothese", "specialite": "chirurgie-orthopedique-programmee"},
+        )
+        assert resp.status_code == 200
+        assert resp.text.count("recherche-resultats__specialite") == resp.text.count(
+            "Chirurgie orthopédique programmée</span>"
+        )
+        assert 'aria-pressed="true"' in resp.text
+        assert 'href="/recherche?q=prothese"' in resp.text
+
+
+class TestDelestage:
+    """Délestage quand la file de recherche est saturée."""
+
+    @pytest.fixture(name="client_sature")
+    def _client_sature(self, client, monkeypatch):
+        """Client dont l'exécuteur de recherche refuse toute nouvelle tâche."""
+        monkeypatch.setattr(client.app.state.search_executor, "_in_flight", 10**6)
+        return client
+
+    def test_partial_vide_avec_indication_de_reessai(self, client_sature):
+        """Le partial répond 503, vide, avec Retry-After et un rechargement HTMX différé."""
+        resp = client_sature.get("/search", params={"q": "hanche"})
+        assert resp.status_code == 503
+        assert "Retry-After" in resp.headers
+        assert "/protocole/" not in resp.text
+        assert 'hx-trigger="load delay:' in resp.text
+
+    def test_page_recherche_retourne_503(self, client_sature):
+        """La page de résultats complète répond 503 avec Retry-After."""
+        resp = client_sature.get("/recherche", params={"q": "hanche"})
+        assert resp.status_code == 503
+        assert "Retry-After" in resp.headers
+
+    def test_htmx_affiche_les_reponses_503(self, client):
+        """Les pages configurent HTMX pour insérer le fragment d'une réponse 503."""
+        resp = client.get("/")
+        config = resp.text.split('name="htmx-config" content=\'', 1)[1].split("'>", 1)[0]
+        regles = json.loads(config)["responseHandling"]
+        premiere_503 = next(r for r in regles if r["code"] in ("503", "[45]..", "..."))
+        assert premiere_503 == {"code": "503", "swap": True}
+
+    def test_pages_protocole_non_affectees(self, client_sature):
+        """Les autres pages restent servies pendant la saturation."""
+        resp = client_sature.get("/specialites")
+        assert resp.status_code == 200
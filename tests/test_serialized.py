@@ -0,0 +1,80 @@
+"""Tests pour les réponses JSON pré-encodées de l'API."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from app.data.dataset import Dataset
+from app.data.models import Intervention, RFEData, Specialite
+from app.main import app
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+
+
+@pytest.fixture(name="client")
+def _client():
+    """Client de test avec lifespan (données chargées en mémoire)."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(name="repository")
+def _repository(client):
+    """Dépôt de la génération servie."""
+    return client.app.state.datasets.current.repository
+
+
+class TestSerializedResponses:
+    """Les corps pré-encodés sont identiques à la sérialisation par response_model."""
+
+    def test_liste_des_specialites(self, client, repository):
+        """GET /api/v1/specialites : mêmes octets que list[Specialite]."""
+        response = client.get("/api/v1/specialites")
+        attendu = TypeAdapter(list[Specialite]).dump_json(repository.specialites)
+        assert response.content == attendu
+        assert response.headers["content-type"] == "application/json"
+
+    def test_specialite(self, client, repository):
+        """GET /api/v1/specialites/{id} : mêmes octets que Specialite."""
+        specialite = repository.specialites[0]
+        response = client.get(f"/api/v1/specialites/{specialite.id}")
+        assert response.content == TypeAdapter(Specialite).dump_json(specialite)
+
+    @pytest.mark.parametrize(("skip", "limit"), [(0, 50), (10, 5), (400, 200), (10000, 10)])
+    def test_page_d_interventions(self, client, repository, skip, limit):
+        """GET /api/v1/interventions : mêmes octets que list[Intervention]."""
+        response = client.get(f"/api/v1/interventions?skip={skip}&limit={limit}")
+        page = list(repository.interventions[skip : skip + limit])
+        assert response.content == TypeAdapter(list[Intervention]).dump_json(page)
+
+    def test_intervention(self, client, repository):
+        """GET /api/v1/interventions/{id} : mêmes octets que Intervention."""
+        intervention = repository.interventions[3]
+        response = client.get(f"/api/v1/interventions/{intervention.id}")
+        assert response.content == TypeAdapter(Intervention).dump_json(intervention)
+
+
+class TestPatched:
+    """Réutilisation des octets d'une génération à l'autre."""
+
+    def test_seules_les_modifications_sont_reencodees(self):
+        """Les interventions inchangées reprennent leurs octets, les autres sont ré-encodées."""
+        raw = json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+        dataset = Dataset.from_data(RFEData.model_validate(raw))
+        raw["specialites"][0]["interventions"][0]["notes"] = "Note corrigée"
+
+        patched, _ = dataset.patched(RFEData.model_validate(raw))
+
+        anciennes, nouvelles = dataset.responses, patched.responses
+        assert b"Note corrig" in nouvelles.interventions[0]
+        assert nouvelles.interventions[1] is anciennes.interventions[1]
+        assert nouvelles.specialites[0] is not anciennes.specialites[0]
+        assert nouvelles.specialites[1] is anciennes.specialites[1]
+        assert nouvelles.specialites_list.identity == TypeAdapter(list[Specialite]).dump_json(
+            patched.repository.specialites
+        )
@@ -0,0 +1,94 @@
+"""Tests pour l'instantané binaire du jeu de données (démarrage rapide)."""
+
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.data import snapshot
+from app.data.dataset import Dataset
+from app.data.loader import load_dataset
+from app.data.snapshot import read_snapshot, write_snapshot
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "rfe.json"
+
+
+@pytest.fixture(name="source")
+def _source(tmp_path) -> Path:
+    """Copie de data/rfe.json modifiable par le test."""
+    path = tmp_path / "rfe.json"
+    shutil.copy(_DATA_PATH, path)
+    return path
+
+
+class TestSnapshot:
+    """Tests pour write_snapshot / read_snapshot."""
+
+    def test_aller_retour(self, source, tmp_path):
+        """L'instantané relu est identique au jeu de données écrit."""
+        target = tmp_path / "rfe.snapshot"
+        ecrit = write_snapshot(source, target)
+
+        relu = read_snapshot(target, source)
+
+        assert isinstance(relu, Dataset)
+        assert relu.rfe_data == ecrit.rfe_data
+        assert relu.search_index.choices == ecrit.search_index.choices
+        assert relu.search_index.version == ecrit.search_index.version
+        premiere = ecrit.repository.interventions[0]
+        assert relu.repository.get_intervention(premiere.id) == premiere
+
+    def test_absent_retourne_none(self, source, tmp_path):
+        """Sans fichier d'instantané, read_snapshot retourne None."""
+        assert read_snapshot(tmp_path / "absent.snapshot", source) is None
+
+    def test_source_modifiee_invalide_l_instantane(self, source, tmp_path):
+        """Une modification de rfe.json rend l'instantané inutilisable."""
+        target = tmp_path / "rfe.snapshot"
+        write_snapshot(source, target)
+        data = json.loads(source.read_text(encoding="utf-8"))
+        data["specialites"][0]["interventions"][0]["nom"] = "Nom corrigé"
+        source.write_text(json.dumps(data), encoding="utf-8")
+
+        assert read_snapshot(target, source) is None
+
+    def test_code_modifie_invalide_l_instantane(self, source, tmp_path, monkeypatch):
+        """Un changement du code des structures rend l'instantané inutilisable."""
+        target = tmp_path / "rfe.snapshot"
+        write_snapshot(source, target)
+        monkeypatch.setattr(snapshot, "code_fingerprint", lambda: "autre-version")
+
+        assert read_snapshot(target, source) is None
+
+    def test_fichier_corrompu_retourne_none(self, source, tmp_path):
+        """Un instantané illisible est ignoré."""
+        target = tmp_path / "rfe.snapshot"
+        target.write_bytes(b"pas un pickle")
+
+        assert read_snapshot(target, source) is None
+
+
+class TestLoadDataset:
+    """Tests pour load_dataset (instantané ou chargement complet)."""
+
+    def test_utilise_l_instantane_a_jour(self, source, tmp_path, monkeypatch):
+        """Avec un instantané à jour, la validation Pydantic n'est pas relancée."""
+        target = tmp_path / "rfe.snapshot"
+        write_snapshot(source, target)
+
+        def _interdit(_path):
+            raise AssertionError("load_rfe_data ne doit pas être appelé")
+
+        monkeypatch.setattr("app.data.loader.load_rfe_data", _interdit)
+        dataset = load_dataset(source, target)
+
+        assert len(dataset.repository.interventions) >= 40
+
+    def test_repli_sur_chargement_complet(self, source, tmp_path):
+        """Sans instantané valide, les données sont chargées et validées."""
+        dataset = load_dataset(source, tmp_path / "absent.snapshot")
+
+        assert len(dataset.repository.interventions) >= 40